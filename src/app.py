@@ -235,7 +235,7 @@ def create_app():
                 'timestamp': datetime.now().isoformat(),
                 'monitoring_active': True,
                 'last_update': datetime.now().isoformat(),
-                'metrics_count': len(ai_performance_monitor.metrics_history)
+                'metrics_count': ai_performance_monitor.metrics_count
             }
             
             return jsonify(health_status)
@@ -4,21 +4,22 @@ Advanced AI Research Module
 Next-generation AI capabilities including quantum-inspired computing, cognitive architectures, and advanced threat detection
 """
 
-import os
 import sys
-import time
 import json
 import logging
-import threading
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
-from collections import defaultdict, deque
 from enum import Enum
+from types import MappingProxyType
+try:
+    import orjson
+except ImportError:
+    # Fallback for environments without orjson
+    orjson = None
 
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from .research_kernels import composite_score, DEFAULT_COMPOSITE_WEIGHTS
 
 class ResearchArea(Enum):
     QUANTUM_INSPIRED = "quantum_inspired"
@@ -38,6 +39,10 @@ class ResearchStatus(Enum):
     VALIDATION = "validation"
     PRODUCTION_READY = "production_ready"
 
+# Value -> member lookup that skips the Enum call protocol for request filters;
+# statuses need none, since the status index is keyed by value
+_RESEARCH_AREAS_BY_VALUE = {member.value: member for member in ResearchArea}
+
 @dataclass
 class ResearchProject:
     """Research project data structure"""
@@ -107,20 +112,424 @@ class NeuromorphicSystem:
     production_status: str
     scalability_metrics: Dict[str, float]
 
+QUANTUM_BENCHMARK_METRICS = (
+    "performance_improvement",
+    "accuracy_improvement",
+    "speed_improvement",
+    "energy_efficiency",
+    "scalability_factor"
+)
+
+# Seed data shared by every AdvancedAIResearchSystem instance; dates are
+# stored as offsets from the time the instance is created
+_PROJECT_SEED_DATA = (
+    MappingProxyType({
+        "project_id": "QUANTUM_OPT_001",
+        "name": "Quantum-Inspired Optimization Algorithm",
+        "research_area": ResearchArea.QUANTUM_INSPIRED,
+        "description": "Develop quantum-inspired optimization algorithms for security pattern detection",
+        "status": ResearchStatus.PROTOTYPE,
+        "progress_percentage": 65.0,
+        "start_offset": timedelta(days=-180),
+        "completion_offset": timedelta(days=120),
+        "lead_researcher": "Dr. Sarah Chen",
+        "team_members": ["Dr. Michael Zhang", "Dr. Emily Rodriguez", "Dr. James Liu"],
+        "budget_allocated": 2500000.0,
+        "budget_spent": 1625000.0,
+        "key_findings": [
+            "Quantum annealing improves pattern detection by 40%",
+            "Hybrid quantum-classical approach shows 85% accuracy",
+            "Energy consumption reduced by 60% compared to classical methods"
+        ],
+        "publications": [
+            "Quantum-Inspired Security Pattern Detection",
+            "Hybrid Optimization Algorithms for Cybersecurity"
+        ],
+        "patents_filed": [
+            "Quantum-Inspired Threat Detection System",
+            "Hybrid Quantum-Classical Optimization Method"
+        ],
+        "performance_metrics": {
+            "accuracy_improvement": 40.0,
+            "speed_improvement": 35.0,
+            "energy_efficiency": 60.0
+        },
+        "next_milestones": [
+            "Complete prototype testing",
+            "Publish research findings",
+            "File patent applications",
+            "Begin production integration"
+        ]
+    }),
+    MappingProxyType({
+        "project_id": "COG_ARCH_002",
+        "name": "Cognitive Computing Architecture",
+        "research_area": ResearchArea.COGNITIVE_COMPUTING,
+        "description": "Develop cognitive architecture for advanced reasoning and decision making",
+        "status": ResearchStatus.TESTING,
+        "progress_percentage": 45.0,
+        "start_offset": timedelta(days=-120),
+        "completion_offset": timedelta(days=180),
+        "lead_researcher": "Dr. Alex Thompson",
+        "team_members": ["Dr. Lisa Wang", "Dr. Robert Kim", "Dr. Maria Garcia"],
+        "budget_allocated": 3000000.0,
+        "budget_spent": 1350000.0,
+        "key_findings": [
+            "Cognitive architecture improves decision accuracy by 25%",
+            "Multi-modal reasoning capabilities demonstrated",
+            "Adaptive learning mechanisms show 50% faster convergence"
+        ],
+        "publications": [
+            "Cognitive Architecture for Security Analysis",
+            "Multi-Modal Reasoning in AI Systems"
+        ],
+        "patents_filed": [
+            "Adaptive Cognitive Computing System",
+            "Multi-Modal AI Reasoning Engine"
+        ],
+        "performance_metrics": {
+            "reasoning_accuracy": 85.0,
+            "learning_speed": 50.0,
+            "adaptation_capability": 75.0
+        },
+        "next_milestones": [
+            "Complete integration testing",
+            "Validate performance benchmarks",
+            "Prepare production deployment",
+            "Begin field trials"
+        ]
+    }),
+    MappingProxyType({
+        "project_id": "NEUROMORPH_003",
+        "name": "Neuromorphic Security System",
+        "research_area": ResearchArea.NEUROMORPHIC_SYSTEMS,
+        "description": "Develop neuromorphic computing systems for energy-efficient security monitoring",
+        "status": ResearchStatus.SIMULATION,
+        "progress_percentage": 30.0,
+        "start_offset": timedelta(days=-90),
+        "completion_offset": timedelta(days=270),
+        "lead_researcher": "Dr. Jennifer Lee",
+        "team_members": ["Dr. David Brown", "Dr. Sophie Martin", "Dr. Kevin Chen"],
+        "budget_allocated": 3500000.0,
+        "budget_spent": 1050000.0,
+        "key_findings": [
+            "Neuromorphic architecture reduces power consumption by 80%",
+            "Event-driven processing shows 100x speed improvement",
+            "Adaptive synaptic plasticity enables continuous learning"
+        ],
+        "publications": [
+            "Neuromorphic Computing for Security Applications",
+            "Event-Driven Neural Processing Systems"
+        ],
+        "patents_filed": [
+            "Neuromorphic Security Monitoring System",
+            "Adaptive Neuromorphic Processor"
+        ],
+        "performance_metrics": {
+            "energy_efficiency": 80.0,
+            "processing_speed": 100.0,
+            "learning_capability": 60.0
+        },
+        "next_milestones": [
+            "Complete hardware simulation",
+            "Develop prototype chip",
+            "Test with real-world data",
+            "Optimize for production"
+        ]
+    }),
+)
+
+_ALGORITHM_SEED_DATA = (
+    MappingProxyType({
+        "algorithm_id": "QUANTUM_ANNEAL_001",
+        "name": "Quantum Annealing Security Optimizer",
+        "quantum_principle": "Quantum annealing for optimization",
+        "classical_equivalent": "Simulated annealing",
+        "performance_improvement": 45.0,
+        "accuracy_improvement": 38.0,
+        "speed_improvement": 60.0,
+        "energy_efficiency": 55.0,
+        "scalability_factor": 10.0,
+        "implementation_complexity": "High",
+        "use_cases": ["Security pattern detection", "Threat optimization", "Resource allocation"],
+        "current_status": "Prototype testing",
+        "research_progress": 70.0
+    }),
+    MappingProxyType({
+        "algorithm_id": "QUANTUM_GROVER_002",
+        "name": "Quantum Grover Search Algorithm",
+        "quantum_principle": "Quantum search for unstructured data",
+        "classical_equivalent": "Linear search",
+        "performance_improvement": 85.0,
+        "accuracy_improvement": 42.0,
+        "speed_improvement": 90.0,
+        "energy_efficiency": 40.0,
+        "scalability_factor": 15.0,
+        "implementation_complexity": "Very High",
+        "use_cases": ["Database search", "Pattern matching", "Anomaly detection"],
+        "current_status": "Simulation phase",
+        "research_progress": 55.0
+    }),
+    MappingProxyType({
+        "algorithm_id": "QUANTUM_VARIATIONAL_003",
+        "name": "Variational Quantum Classifier",
+        "quantum_principle": "Variational quantum circuits",
+        "classical_equivalent": "Neural networks",
+        "performance_improvement": 35.0,
+        "accuracy_improvement": 28.0,
+        "speed_improvement": 25.0,
+        "energy_efficiency": 65.0,
+        "scalability_factor": 8.0,
+        "implementation_complexity": "Medium",
+        "use_cases": ["Classification", "Pattern recognition", "Risk assessment"],
+        "current_status": "Theoretical development",
+        "research_progress": 40.0
+    }),
+)
+
+_ARCHITECTURE_SEED_DATA = (
+    MappingProxyType({
+        "architecture_id": "COG_REASONING_001",
+        "name": "Multi-Modal Reasoning Architecture",
+        "cognitive_model": "Integrated perception-reasoning-action cycle",
+        "neural_components": ["Visual cortex", "Auditory cortex", "Prefrontal cortex", "Hippocampus"],
+        "learning_capabilities": ["Supervised learning", "Reinforcement learning", "Meta-learning"],
+        "reasoning_capabilities": ["Logical reasoning", "Causal reasoning", "Analogical reasoning"],
+        "memory_system": "Episodic memory with semantic indexing",
+        "attention_mechanism": "Multi-head self-attention with temporal focus",
+        "performance_benchmarks": {
+            "reasoning_accuracy": 88.0,
+            "learning_efficiency": 75.0,
+            "memory_recall": 92.0,
+            "attention_precision": 85.0
+        },
+        "integration_status": "Prototype integration",
+        "deployment_readiness": 60.0
+    }),
+    MappingProxyType({
+        "architecture_id": "COG_ADAPTIVE_002",
+        "name": "Adaptive Cognitive Architecture",
+        "cognitive_model": "Self-organizing neural system",
+        "neural_components": ["Adaptive neurons", "Dynamic synapses", "Meta-learning controller"],
+        "learning_capabilities": ["Continual learning", "Transfer learning", "Few-shot learning"],
+        "reasoning_capabilities": ["Adaptive reasoning", "Contextual inference", "Predictive reasoning"],
+        "memory_system": "Hierarchical memory with forgetting mechanism",
+        "attention_mechanism": "Dynamic attention with context awareness",
+        "performance_benchmarks": {
+            "adaptation_speed": 80.0,
+            "transfer_efficiency": 70.0,
+            "contextual_accuracy": 85.0,
+            "prediction_precision": 78.0
+        },
+        "integration_status": "Testing phase",
+        "deployment_readiness": 45.0
+    }),
+)
+
+_NEUROMORPHIC_SEED_DATA = (
+    MappingProxyType({
+        "system_id": "NEURO_SECURITY_001",
+        "name": "Neuromorphic Security Monitor",
+        "hardware_platform": "IBM TrueNorth",
+        "neural_network_type": "Spiking neural network",
+        "synaptic_plasticity": "STDP (Spike-Timing-Dependent Plasticity)",
+        "energy_efficiency": 85.0,
+        "processing_speed": 120.0,
+        "learning_capability": "Unsupervised event-based learning",
+        "adaptation_mechanism": "Homeostatic plasticity",
+        "benchmark_results": {
+            "energy_per_operation": 0.1,
+            "latency_microseconds": 10.0,
+            "accuracy_percent": 93.0,
+            "adaptation_time_hours": 2.0
+        },
+        "production_status": "Prototype development",
+        "scalability_metrics": {
+            "neurons_count": 1000000,
+            "synapses_count": 10000000,
+            "chip_area_mm2": 25.0
+        }
+    }),
+    MappingProxyType({
+        "system_id": "NEURO_VISION_002",
+        "name": "Neuromorphic Vision Processor",
+        "hardware_platform": "Intel Loihi",
+        "neural_network_type": "Convolutional spiking network",
+        "synaptic_plasticity": "Anti-Hebbian learning",
+        "energy_efficiency": 90.0,
+        "processing_speed": 150.0,
+        "learning_capability": "Unsupervised feature learning",
+        "adaptation_mechanism": "Reward-modulated plasticity",
+        "benchmark_results": {
+            "energy_per_frame": 0.05,
+            "processing_fps": 1000.0,
+            "accuracy_percent": 95.0,
+            "learning_iterations": 1000
+        },
+        "production_status": "Simulation phase",
+        "scalability_metrics": {
+            "pixels_per_second": 1000000,
+            "feature_maps": 256,
+            "network_depth": 10
+        }
+    }),
+)
+
+_TIMELINE_SEED_DATA = (
+    MappingProxyType({
+        "offset": timedelta(hours=-24),
+        "event_type": "patent_filed",
+        "project_id": "QUANTUM_OPT_001",
+        "description": "Quantum-inspired threat detection patent filed",
+        "impact": "Critical",
+        "researchers": ["Dr. Sarah Chen", "Dr. Michael Zhang"]
+    }),
+    MappingProxyType({
+        "offset": timedelta(hours=-12),
+        "event_type": "publication",
+        "project_id": "NEUROMORPH_003",
+        "description": "Neuromorphic computing paper published in Nature",
+        "impact": "High",
+        "researchers": ["Dr. Jennifer Lee", "Dr. David Brown"]
+    }),
+    MappingProxyType({
+        "offset": timedelta(hours=-6),
+        "event_type": "breakthrough",
+        "project_id": "COG_ARCH_002",
+        "description": "Multi-modal reasoning breakthrough achieved",
+        "impact": "Critical",
+        "researchers": ["Dr. Alex Thompson", "Dr. Lisa Wang"]
+    }),
+    MappingProxyType({
+        "offset": timedelta(hours=-2),
+        "event_type": "milestone_achieved",
+        "project_id": "QUANTUM_OPT_001",
+        "description": "Quantum annealing prototype completed successfully",
+        "impact": "High",
+        "researchers": ["Dr. Sarah Chen", "Dr. Michael Zhang"]
+    }),
+)
+
+# Plain dict rather than a proxy so it serializes directly; treat as read-only
+_NEXT_GEN_CAPABILITIES = {
+    "quantum_inspired_computing": {
+        "status": "Active development",
+        "progress": 65.0,
+        "expected_completion": "Q3 2026",
+        "key_capabilities": [
+            "Quantum annealing optimization",
+            "Quantum search algorithms",
+            "Hybrid quantum-classical systems"
+        ],
+        "performance_improvements": {
+            "accuracy": "+45%",
+            "speed": "+60%",
+            "efficiency": "+55%"
+        }
+    },
+    "cognitive_computing": {
+        "status": "Prototype testing",
+        "progress": 45.0,
+        "expected_completion": "Q4 2026",
+        "key_capabilities": [
+            "Multi-modal reasoning",
+            "Adaptive learning",
+            "Contextual inference"
+        ],
+        "performance_improvements": {
+            "reasoning": "+38%",
+            "learning": "+50%",
+            "adaptation": "+75%"
+        }
+    },
+    "neuromorphic_systems": {
+        "status": "Simulation phase",
+        "progress": 30.0,
+        "expected_completion": "Q1 2027",
+        "key_capabilities": [
+            "Event-driven processing",
+            "Energy-efficient computing",
+            "Continuous learning"
+        ],
+        "performance_improvements": {
+            "energy": "-80%",
+            "speed": "+100%",
+            "adaptation": "+200%"
+        }
+    }
+}
+
+# Endpoints whose payload only changes when the underlying research data does
+CACHEABLE_ENDPOINTS = {
+    "quantum_algorithms": "get_quantum_algorithms",
+    "cognitive_architectures": "get_cognitive_architectures",
+    "neuromorphic_systems": "get_neuromorphic_systems",
+    "research_projects": "get_research_projects",
+    "performance_benchmarks": "get_performance_benchmarks"
+}
+
+# Endpoints that embed the current time and are encoded fresh on every call
+VOLATILE_ENDPOINTS = {
+    "research_summary": "get_research_summary",
+    "research_timeline": "get_research_timeline"
+}
+
+def _intern_fields(record: Any, fields: Tuple[str, ...]):
+    """Intern repeated category strings so equal values share one object"""
+    for field in fields:
+        setattr(record, field, sys.intern(getattr(record, field)))
+
+def _copy_project_dict(project: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a serialized project the caller may mutate; its containers are flat"""
+    return {key: value.copy() if isinstance(value, (list, dict)) else value
+            for key, value in project.items()}
+
+def _json_default(obj: Any) -> Any:
+    """Encode the non-JSON types that appear in research payloads"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps(payload: Any) -> bytes:
+    """Encode a payload as JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, default=_json_default).encode("utf-8")
+
 class AdvancedAIResearchSystem:
     """Advanced AI Research System"""
     
+    # Static payloads are encoded once and shared by every instance
+    _next_gen_capabilities = _NEXT_GEN_CAPABILITIES
+    _next_gen_capabilities_json = json.dumps(_NEXT_GEN_CAPABILITIES)
+    _next_gen_capabilities_bytes = _dumps(_NEXT_GEN_CAPABILITIES)
+    
     def __init__(self):
         self.logger = logging.getLogger("advanced_ai_research")
         self.research_projects = {}
         self.quantum_algorithms = {}
         self.cognitive_architectures = {}
         self.neuromorphic_systems = {}
-        self.research_timeline = deque(maxlen=1000)
+        self.timeline_capacity = 1000
+        self._timeline_ts = np.zeros(self.timeline_capacity, dtype='datetime64[us]')
+        self._timeline_event_type = [None] * self.timeline_capacity
+        self._timeline_proj_id = [None] * self.timeline_capacity
+        self._timeline_description = [None] * self.timeline_capacity
+        self._timeline_impact = [None] * self.timeline_capacity
+        self._timeline_researchers = [None] * self.timeline_capacity
+        self._timeline_head = 0
+        self._timeline_len = 0
         self.performance_benchmarks = {}
         self.research_budget = 10000000  # $10M annual budget
         self.active_researchers = 15
         self.research_labs = 5
+        self._bytes_cache = {}
         
         # Initialize with sample research projects
         self._initialize_research_projects()
@@ -133,291 +542,108 @@ class AdvancedAIResearchSystem:
         
         # Initialize neuromorphic systems
         self._initialize_neuromorphic_systems()
+        
+        # Initialize research timeline
+        self._initialize_research_timeline()
+        
+        self._static_summary = {
+            "active_researchers": self.active_researchers,
+            "research_labs": self.research_labs
+        }
     
     def _initialize_research_projects(self):
         """Initialize with sample research projects"""
-        projects = [
-            {
-                "project_id": "QUANTUM_OPT_001",
-                "name": "Quantum-Inspired Optimization Algorithm",
-                "research_area": ResearchArea.QUANTUM_INSPIRED,
-                "description": "Develop quantum-inspired optimization algorithms for security pattern detection",
-                "status": ResearchStatus.PROTOTYPE,
-                "progress_percentage": 65.0,
-                "start_date": datetime.now() - timedelta(days=180),
-                "estimated_completion": datetime.now() + timedelta(days=120),
-                "lead_researcher": "Dr. Sarah Chen",
-                "team_members": ["Dr. Michael Zhang", "Dr. Emily Rodriguez", "Dr. James Liu"],
-                "budget_allocated": 2500000.0,
-                "budget_spent": 1625000.0,
-                "key_findings": [
-                    "Quantum annealing improves pattern detection by 40%",
-                    "Hybrid quantum-classical approach shows 85% accuracy",
-                    "Energy consumption reduced by 60% compared to classical methods"
-                ],
-                "publications": [
-                    "Quantum-Inspired Security Pattern Detection",
-                    "Hybrid Optimization Algorithms for Cybersecurity"
-                ],
-                "patents_filed": [
-                    "Quantum-Inspired Threat Detection System",
-                    "Hybrid Quantum-Classical Optimization Method"
-                ],
-                "performance_metrics": {
-                    "accuracy_improvement": 40.0,
-                    "speed_improvement": 35.0,
-                    "energy_efficiency": 60.0
-                },
-                "next_milestones": [
-                    "Complete prototype testing",
-                    "Publish research findings",
-                    "File patent applications",
-                    "Begin production integration"
-                ]
-            },
-            {
-                "project_id": "COG_ARCH_002",
-                "name": "Cognitive Computing Architecture",
-                "research_area": ResearchArea.COGNITIVE_COMPUTING,
-                "description": "Develop cognitive architecture for advanced reasoning and decision making",
-                "status": ResearchStatus.TESTING,
-                "progress_percentage": 45.0,
-                "start_date": datetime.now() - timedelta(days=120),
-                "estimated_completion": datetime.now() + timedelta(days=180),
-                "lead_researcher": "Dr. Alex Thompson",
-                "team_members": ["Dr. Lisa Wang", "Dr. Robert Kim", "Dr. Maria Garcia"],
-                "budget_allocated": 3000000.0,
-                "budget_spent": 1350000.0,
-                "key_findings": [
-                    "Cognitive architecture improves decision accuracy by 25%",
-                    "Multi-modal reasoning capabilities demonstrated",
-                    "Adaptive learning mechanisms show 50% faster convergence"
-                ],
-                "publications": [
-                    "Cognitive Architecture for Security Analysis",
-                    "Multi-Modal Reasoning in AI Systems"
-                ],
-                "patents_filed": [
-                    "Adaptive Cognitive Computing System",
-                    "Multi-Modal AI Reasoning Engine"
-                ],
-                "performance_metrics": {
-                    "reasoning_accuracy": 85.0,
-                    "learning_speed": 50.0,
-                    "adaptation_capability": 75.0
-                },
-                "next_milestones": [
-                    "Complete integration testing",
-                    "Validate performance benchmarks",
-                    "Prepare production deployment",
-                    "Begin field trials"
-                ]
-            },
-            {
-                "project_id": "NEUROMORPH_003",
-                "name": "Neuromorphic Security System",
-                "research_area": ResearchArea.NEUROMORPHIC_SYSTEMS,
-                "description": "Develop neuromorphic computing systems for energy-efficient security monitoring",
-                "status": ResearchStatus.SIMULATION,
-                "progress_percentage": 30.0,
-                "start_date": datetime.now() - timedelta(days=90),
-                "estimated_completion": datetime.now() + timedelta(days=270),
-                "lead_researcher": "Dr. Jennifer Lee",
-                "team_members": ["Dr. David Brown", "Dr. Sophie Martin", "Dr. Kevin Chen"],
-                "budget_allocated": 3500000.0,
-                "budget_spent": 1050000.0,
-                "key_findings": [
-                    "Neuromorphic architecture reduces power consumption by 80%",
-                    "Event-driven processing shows 100x speed improvement",
-                    "Adaptive synaptic plasticity enables continuous learning"
-                ],
-                "publications": [
-                    "Neuromorphic Computing for Security Applications",
-                    "Event-Driven Neural Processing Systems"
-                ],
-                "patents_filed": [
-                    "Neuromorphic Security Monitoring System",
-                    "Adaptive Neuromorphic Processor"
-                ],
-                "performance_metrics": {
-                    "energy_efficiency": 80.0,
-                    "processing_speed": 100.0,
-                    "learning_capability": 60.0
-                },
-                "next_milestones": [
-                    "Complete hardware simulation",
-                    "Develop prototype chip",
-                    "Test with real-world data",
-                    "Optimize for production"
-                ]
-            }
-        ]
-        
-        for project_data in projects:
+        now = datetime.now()
+        for seed in _PROJECT_SEED_DATA:
+            project_data = dict(seed)
+            project_data["start_date"] = now + project_data.pop("start_offset")
+            project_data["estimated_completion"] = now + project_data.pop("completion_offset")
             project = ResearchProject(**project_data)
+            _intern_fields(project, ("lead_researcher",))
             self.research_projects[project.project_id] = project
         
-        self.logger.info(f"Initialized {len(projects)} advanced AI research projects")
+        self._rebuild_project_arrays()
+        self._rebuild_project_index()
+        
+        self.logger.info(f"Initialized {len(_PROJECT_SEED_DATA)} advanced AI research projects")
+    
+    def _rebuild_project_arrays(self):
+        """Rebuild the area-index / progress arrays used for per-area aggregates"""
+        self._bytes_cache.clear()
+        self._area_idx_to_value = list(_RESEARCH_AREAS_BY_VALUE)
+        area_index = {member: idx for idx, member in enumerate(_RESEARCH_AREAS_BY_VALUE.values())}
+        projects = self.research_projects.values()
+        self._project_area_idx = np.fromiter(
+            (area_index[p.research_area] for p in projects), dtype=np.int32, count=len(projects)
+        )
+        self._project_progress = np.fromiter(
+            (p.progress_percentage for p in projects), dtype=np.float64, count=len(projects)
+        )
+    
+    def _rebuild_project_index(self):
+        """Rebuild the status -> project_id index and the serialized project dicts"""
+        self._projects_by_status = {}
+        self._project_dicts = {}
+        for project_id, project in self.research_projects.items():
+            self._projects_by_status.setdefault(project.status.value, []).append(project_id)
+            self._project_dicts[project_id] = asdict(project)
     
     def _initialize_quantum_algorithms(self):
         """Initialize quantum-inspired algorithms"""
-        algorithms = [
-            {
-                "algorithm_id": "QUANTUM_ANNEAL_001",
-                "name": "Quantum Annealing Security Optimizer",
-                "quantum_principle": "Quantum annealing for optimization",
-                "classical_equivalent": "Simulated annealing",
-                "performance_improvement": 45.0,
-                "accuracy_improvement": 38.0,
-                "speed_improvement": 60.0,
-                "energy_efficiency": 55.0,
-                "scalability_factor": 10.0,
-                "implementation_complexity": "High",
-                "use_cases": ["Security pattern detection", "Threat optimization", "Resource allocation"],
-                "current_status": "Prototype testing",
-                "research_progress": 70.0
-            },
-            {
-                "algorithm_id": "QUANTUM_GROVER_002",
-                "name": "Quantum Grover Search Algorithm",
-                "quantum_principle": "Quantum search for unstructured data",
-                "classical_equivalent": "Linear search",
-                "performance_improvement": 85.0,
-                "accuracy_improvement": 42.0,
-                "speed_improvement": 90.0,
-                "energy_efficiency": 40.0,
-                "scalability_factor": 15.0,
-                "implementation_complexity": "Very High",
-                "use_cases": ["Database search", "Pattern matching", "Anomaly detection"],
-                "current_status": "Simulation phase",
-                "research_progress": 55.0
-            },
-            {
-                "algorithm_id": "QUANTUM_VARIATIONAL_003",
-                "name": "Variational Quantum Classifier",
-                "quantum_principle": "Variational quantum circuits",
-                "classical_equivalent": "Neural networks",
-                "performance_improvement": 35.0,
-                "accuracy_improvement": 28.0,
-                "speed_improvement": 25.0,
-                "energy_efficiency": 65.0,
-                "scalability_factor": 8.0,
-                "implementation_complexity": "Medium",
-                "use_cases": ["Classification", "Pattern recognition", "Risk assessment"],
-                "current_status": "Theoretical development",
-                "research_progress": 40.0
-            }
-        ]
-        
-        for algorithm_data in algorithms:
+        for algorithm_data in _ALGORITHM_SEED_DATA:
             algorithm = QuantumInspiredAlgorithm(**algorithm_data)
+            _intern_fields(algorithm, ("implementation_complexity", "current_status"))
             self.quantum_algorithms[algorithm.algorithm_id] = algorithm
         
-        self.logger.info(f"Initialized {len(algorithms)} quantum-inspired algorithms")
+        self._rebuild_algorithm_arrays()
+        
+        self.logger.info(f"Initialized {len(_ALGORITHM_SEED_DATA)} quantum-inspired algorithms")
+    
+    def _rebuild_algorithm_arrays(self):
+        """Rebuild the struct-of-arrays benchmark columns for quantum algorithms"""
+        self._bytes_cache.clear()
+        algorithms = list(self.quantum_algorithms.values())
+        self._qa_ids = [a.algorithm_id for a in algorithms]
+        self._qa_metrics = {
+            metric: np.array([getattr(a, metric) for a in algorithms], dtype=np.float32)
+            for metric in QUANTUM_BENCHMARK_METRICS
+        }
     
     def _initialize_cognitive_architectures(self):
         """Initialize cognitive architectures"""
-        architectures = [
-            {
-                "architecture_id": "COG_REASONING_001",
-                "name": "Multi-Modal Reasoning Architecture",
-                "cognitive_model": "Integrated perception-reasoning-action cycle",
-                "neural_components": ["Visual cortex", "Auditory cortex", "Prefrontal cortex", "Hippocampus"],
-                "learning_capabilities": ["Supervised learning", "Reinforcement learning", "Meta-learning"],
-                "reasoning_capabilities": ["Logical reasoning", "Causal reasoning", "Analogical reasoning"],
-                "memory_system": "Episodic memory with semantic indexing",
-                "attention_mechanism": "Multi-head self-attention with temporal focus",
-                "performance_benchmarks": {
-                    "reasoning_accuracy": 88.0,
-                    "learning_efficiency": 75.0,
-                    "memory_recall": 92.0,
-                    "attention_precision": 85.0
-                },
-                "integration_status": "Prototype integration",
-                "deployment_readiness": 60.0
-            },
-            {
-                "architecture_id": "COG_ADAPTIVE_002",
-                "name": "Adaptive Cognitive Architecture",
-                "cognitive_model": "Self-organizing neural system",
-                "neural_components": ["Adaptive neurons", "Dynamic synapses", "Meta-learning controller"],
-                "learning_capabilities": ["Continual learning", "Transfer learning", "Few-shot learning"],
-                "reasoning_capabilities": ["Adaptive reasoning", "Contextual inference", "Predictive reasoning"],
-                "memory_system": "Hierarchical memory with forgetting mechanism",
-                "attention_mechanism": "Dynamic attention with context awareness",
-                "performance_benchmarks": {
-                    "adaptation_speed": 80.0,
-                    "transfer_efficiency": 70.0,
-                    "contextual_accuracy": 85.0,
-                    "prediction_precision": 78.0
-                },
-                "integration_status": "Testing phase",
-                "deployment_readiness": 45.0
-            }
-        ]
-        
-        for architecture_data in architectures:
+        for architecture_data in _ARCHITECTURE_SEED_DATA:
             architecture = CognitiveArchitecture(**architecture_data)
+            _intern_fields(architecture, ("integration_status",))
             self.cognitive_architectures[architecture.architecture_id] = architecture
         
-        self.logger.info(f"Initialized {len(architectures)} cognitive architectures")
+        self._bytes_cache.clear()
+        
+        self.logger.info(f"Initialized {len(_ARCHITECTURE_SEED_DATA)} cognitive architectures")
     
     def _initialize_neuromorphic_systems(self):
         """Initialize neuromorphic systems"""
-        systems = [
-            {
-                "system_id": "NEURO_SECURITY_001",
-                "name": "Neuromorphic Security Monitor",
-                "hardware_platform": "IBM TrueNorth",
-                "neural_network_type": "Spiking neural network",
-                "synaptic_plasticity": "STDP (Spike-Timing-Dependent Plasticity)",
-                "energy_efficiency": 85.0,
-                "processing_speed": 120.0,
-                "learning_capability": "Unsupervised event-based learning",
-                "adaptation_mechanism": "Homeostatic plasticity",
-                "benchmark_results": {
-                    "energy_per_operation": 0.1,
-                    "latency_microseconds": 10.0,
-                    "accuracy_percent": 93.0,
-                    "adaptation_time_hours": 2.0
-                },
-                "production_status": "Prototype development",
-                "scalability_metrics": {
-                    "neurons_count": 1000000,
-                    "synapses_count": 10000000,
-                    "chip_area_mm2": 25.0
-                }
-            },
-            {
-                "system_id": "NEURO_VISION_002",
-                "name": "Neuromorphic Vision Processor",
-                "hardware_platform": "Intel Loihi",
-                "neural_network_type": "Convolutional spiking network",
-                "synaptic_plasticity": "Anti-Hebbian learning",
-                "energy_efficiency": 90.0,
-                "processing_speed": 150.0,
-                "learning_capability": "Unsupervised feature learning",
-                "adaptation_mechanism": "Reward-modulated plasticity",
-                "benchmark_results": {
-                    "energy_per_frame": 0.05,
-                    "processing_fps": 1000.0,
-                    "accuracy_percent": 95.0,
-                    "learning_iterations": 1000
-                },
-                "production_status": "Simulation phase",
-                "scalability_metrics": {
-                    "pixels_per_second": 1000000,
-                    "feature_maps": 256,
-                    "network_depth": 10
-                }
-            }
-        ]
-        
-        for system_data in systems:
+        for system_data in _NEUROMORPHIC_SEED_DATA:
             system = NeuromorphicSystem(**system_data)
+            _intern_fields(system, ("hardware_platform", "neural_network_type", "production_status"))
             self.neuromorphic_systems[system.system_id] = system
         
-        self.logger.info(f"Initialized {len(systems)} neuromorphic systems")
+        self._bytes_cache.clear()
+        
+        self.logger.info(f"Initialized {len(_NEUROMORPHIC_SEED_DATA)} neuromorphic systems")
+    
+    def _initialize_research_timeline(self):
+        """Initialize the research timeline with sample events
+        
+        Seed events are stamped relative to startup, so they age out of the
+        default 30-day window like any logged event.
+        """
+        now = datetime.now()
+        for seed in _TIMELINE_SEED_DATA:
+            event_data = dict(seed)
+            event_data["timestamp"] = now + event_data.pop("offset")
+            self.log_event(**event_data)
+        
+        self.logger.info(f"Initialized {len(_TIMELINE_SEED_DATA)} research timeline events")
     
     def get_research_summary(self) -> Dict[str, Any]:
         """Get comprehensive research summary"""
@@ -427,23 +653,24 @@ class AdvancedAIResearchSystem:
         total_systems = len(self.neuromorphic_systems)
         
         # Calculate progress by research area
-        research_area_progress = defaultdict(list)
-        for project in self.research_projects.values():
-            research_area_progress[project.research_area.value].append(project.progress_percentage)
-        
-        area_averages = {}
-        for area, progress_list in research_area_progress.items():
-            area_averages[area] = sum(progress_list) / len(progress_list) if progress_list else 0
-        
-        # Calculate budget utilization
-        total_budget_allocated = sum(p.budget_allocated for p in self.research_projects.values())
-        total_budget_spent = sum(p.budget_spent for p in self.research_projects.values())
-        budget_utilization = (total_budget_spent / total_budget_allocated * 100) if total_budget_allocated > 0 else 0
+        n_areas = len(self._area_idx_to_value)
+        counts = np.bincount(self._project_area_idx, minlength=n_areas)
+        sums = np.bincount(self._project_area_idx, weights=self._project_progress, minlength=n_areas)
+        area_averages = {
+            self._area_idx_to_value[idx]: float(sums[idx] / counts[idx])
+            for idx in np.flatnonzero(counts)
+        }
         
-        # Count by status
-        status_counts = defaultdict(int)
+        # Accumulate budget totals and status counts in a single pass
+        total_budget_allocated = 0.0
+        total_budget_spent = 0.0
+        status_counts: Dict[str, int] = {}
         for project in self.research_projects.values():
-            status_counts[project.status.value] += 1
+            total_budget_allocated += project.budget_allocated
+            total_budget_spent += project.budget_spent
+            status = project.status.value
+            status_counts[status] = status_counts.get(status, 0) + 1
+        budget_utilization = (total_budget_spent / total_budget_allocated * 100) if total_budget_allocated > 0 else 0
         
         return {
             "total_projects": total_projects,
@@ -455,9 +682,8 @@ class AdvancedAIResearchSystem:
             "total_budget_allocated": total_budget_allocated,
             "total_budget_spent": total_budget_spent,
             "budget_utilization": round(budget_utilization, 2),
-            "status_distribution": dict(status_counts),
-            "active_researchers": self.active_researchers,
-            "research_labs": self.research_labs,
+            "status_distribution": status_counts,
+            **self._static_summary,
             "last_updated": datetime.now().isoformat()
         }
     
@@ -473,14 +699,43 @@ class AdvancedAIResearchSystem:
         """Get neuromorphic systems"""
         return [asdict(system) for system in self.neuromorphic_systems.values()]
     
-    def get_research_projects(self, status: str = None) -> List[Dict[str, Any]]:
-        """Get research projects filtered by status"""
-        projects = list(self.research_projects.values())
+    def rank_quantum_algorithms(self, weights: Optional[List[float]] = None) -> List[Dict[str, Any]]:
+        """Rank quantum-inspired algorithms by weighted composite benchmark score"""
+        w = DEFAULT_COMPOSITE_WEIGHTS if weights is None else np.asarray(weights, dtype=np.float32)
+        scores = composite_score(*(self._qa_metrics[m] for m in QUANTUM_BENCHMARK_METRICS), w)
+        order = np.argsort(-scores, kind='stable')
+        return [
+            {"algorithm_id": self._qa_ids[idx], "composite_score": round(float(scores[idx]), 2)}
+            for idx in order
+        ]
+    
+    def top_k_algorithms(self, metric: str, k: int) -> List[str]:
+        """Get the IDs of the k quantum-inspired algorithms with the highest metric value"""
+        if metric not in self._qa_metrics:
+            raise ValueError(f"Unknown algorithm benchmark metric: {metric}")
+        
+        values = self._qa_metrics[metric]
+        k = min(k, len(values))
+        if k <= 0:
+            return []
+        
+        # argpartition selects the top k in O(N); only those k are then sorted
+        top = np.argpartition(-values, k - 1)[:k]
+        top = top[np.argsort(-values[top], kind='stable')]
+        return [self._qa_ids[idx] for idx in top]
+    
+    def get_research_projects(self, status: str = None, research_area: str = None) -> List[Dict[str, Any]]:
+        """Get research projects filtered by status and/or research area"""
+        project_ids = self._projects_by_status.get(status, ()) if status else self._project_dicts
         
-        if status:
-            projects = [p for p in projects if p.status.value == status]
+        if research_area:
+            area = _RESEARCH_AREAS_BY_VALUE.get(research_area)
+            project_ids = [
+                pid for pid in project_ids
+                if self.research_projects[pid].research_area is area
+            ]
         
-        return [asdict(project) for project in projects]
+        return [_copy_project_dict(self._project_dicts[pid]) for pid in project_ids]
     
     def get_performance_benchmarks(self) -> Dict[str, Any]:
         """Get performance benchmarks across all research areas"""
@@ -520,97 +775,89 @@ class AdvancedAIResearchSystem:
         
         return benchmarks
     
+    def log_event(self, event_type: str, project_id: str, description: str, impact: str,
+                  researchers: List[str], timestamp: Optional[datetime] = None):
+        """Append an event to the research timeline ring buffer
+        
+        The buffer is kept in chronological order for get_research_timeline, so
+        a timestamp older than the newest event raises ValueError; without a
+        timestamp the event is stamped now, never earlier than the newest event.
+        Once the buffer is full the oldest event is overwritten.
+        """
+        head = self._timeline_head
+        ts = np.datetime64(timestamp or datetime.now(), 'us')
+        if self._timeline_len:
+            newest = self._timeline_ts[(head - 1) % self.timeline_capacity]
+            if ts < newest:
+                if timestamp is not None:
+                    raise ValueError(f"Timeline event at {timestamp.isoformat()} is older than the newest event")
+                ts = newest  # Wall clock stepped back
+        self._timeline_ts[head] = ts
+        self._timeline_event_type[head] = event_type
+        self._timeline_proj_id[head] = project_id
+        self._timeline_description[head] = description
+        self._timeline_impact[head] = impact
+        self._timeline_researchers[head] = researchers
+        self._timeline_head = (head + 1) % self.timeline_capacity
+        if self._timeline_len < self.timeline_capacity:
+            self._timeline_len += 1
+    
     def get_research_timeline(self, days: int = 30) -> List[Dict[str, Any]]:
-        """Get research timeline events"""
-        cutoff_date = datetime.now() - timedelta(days=days)
+        """Get research timeline events, newest first"""
+        cutoff = np.datetime64(datetime.now() - timedelta(days=days), 'us')
         
-        # Generate sample timeline events
-        events = [
-            {
-                "timestamp": (datetime.now() - timedelta(hours=2)).isoformat(),
-                "event_type": "milestone_achieved",
-                "project_id": "QUANTUM_OPT_001",
-                "description": "Quantum annealing prototype completed successfully",
-                "impact": "High",
-                "researchers": ["Dr. Sarah Chen", "Dr. Michael Zhang"]
-            },
-            {
-                "timestamp": (datetime.now() - timedelta(hours=6)).isoformat(),
-                "event_type": "breakthrough",
-                "project_id": "COG_ARCH_002",
-                "description": "Multi-modal reasoning breakthrough achieved",
-                "impact": "Critical",
-                "researchers": ["Dr. Alex Thompson", "Dr. Lisa Wang"]
-            },
-            {
-                "timestamp": (datetime.now() - timedelta(hours=12)).isoformat(),
-                "event_type": "publication",
-                "project_id": "NEUROMORPH_003",
-                "description": "Neuromorphic computing paper published in Nature",
-                "impact": "High",
-                "researchers": ["Dr. Jennifer Lee", "Dr. David Brown"]
-            },
+        # The ring holds at most two chronologically sorted segments
+        if self._timeline_len < self.timeline_capacity:
+            segments = [(0, self._timeline_len)]
+        else:
+            segments = [(self._timeline_head, self.timeline_capacity), (0, self._timeline_head)]
+        
+        indices = []
+        for start, end in segments:
+            first = start + int(np.searchsorted(self._timeline_ts[start:end], cutoff, side='left'))
+            indices.extend(range(first, end))
+        
+        return [
             {
-                "timestamp": (datetime.now() - timedelta(hours=24)).isoformat(),
-                "event_type": "patent_filed",
-                "project_id": "QUANTUM_OPT_001",
-                "description": "Quantum-inspired threat detection patent filed",
-                "impact": "Critical",
-                "researchers": ["Dr. Sarah Chen", "Dr. Michael Zhang"]
+                "timestamp": self._timeline_ts[idx].item().isoformat(),
+                "event_type": self._timeline_event_type[idx],
+                "project_id": self._timeline_proj_id[idx],
+                "description": self._timeline_description[idx],
+                "impact": self._timeline_impact[idx],
+                "researchers": self._timeline_researchers[idx]
             }
+            for idx in reversed(indices)
         ]
-        
-        return events
     
     def get_next_generation_capabilities(self) -> Dict[str, Any]:
         """Get next-generation capabilities overview"""
-        return {
-            "quantum_inspired_computing": {
-                "status": "Active development",
-                "progress": 65.0,
-                "expected_completion": "Q3 2026",
-                "key_capabilities": [
-                    "Quantum annealing optimization",
-                    "Quantum search algorithms",
-                    "Hybrid quantum-classical systems"
-                ],
-                "performance_improvements": {
-                    "accuracy": "+45%",
-                    "speed": "+60%",
-                    "efficiency": "+55%"
-                }
-            },
-            "cognitive_computing": {
-                "status": "Prototype testing",
-                "progress": 45.0,
-                "expected_completion": "Q4 2026",
-                "key_capabilities": [
-                    "Multi-modal reasoning",
-                    "Adaptive learning",
-                    "Contextual inference"
-                ],
-                "performance_improvements": {
-                    "reasoning": "+38%",
-                    "learning": "+50%",
-                    "adaptation": "+75%"
-                }
-            },
-            "neuromorphic_systems": {
-                "status": "Simulation phase",
-                "progress": 30.0,
-                "expected_completion": "Q1 2027",
-                "key_capabilities": [
-                    "Event-driven processing",
-                    "Energy-efficient computing",
-                    "Continuous learning"
-                ],
-                "performance_improvements": {
-                    "energy": "-80%",
-                    "speed": "+100%",
-                    "adaptation": "+200%"
-                }
-            }
-        }
+        return self._next_gen_capabilities
+    
+    def get_next_generation_capabilities_json(self) -> str:
+        """Get next-generation capabilities overview as a pre-encoded JSON string"""
+        return self._next_gen_capabilities_json
+
+    
+    def to_bytes(self, endpoint: str) -> bytes:
+        """Get an endpoint payload as encoded JSON bytes
+        
+        Data-only payloads are cached until the research data changes; the
+        static capabilities overview is encoded once at startup.
+        """
+        if endpoint == "next_generation_capabilities":
+            return self._next_gen_capabilities_bytes
+        
+        if endpoint in VOLATILE_ENDPOINTS:
+            return _dumps(getattr(self, VOLATILE_ENDPOINTS[endpoint])())
+        
+        if endpoint not in CACHEABLE_ENDPOINTS:
+            raise ValueError(f"Unknown research endpoint: {endpoint}")
+        
+        cached = self._bytes_cache.get(endpoint)
+        if cached is None:
+            cached = _dumps(getattr(self, CACHEABLE_ENDPOINTS[endpoint])())
+            self._bytes_cache[endpoint] = cached
+        return cached
 
 # Global advanced AI research system instance
 advanced_ai_research_system = AdvancedAIResearchSystem()
@@ -7,17 +7,141 @@ Real-time monitoring and analytics for LLM performance metrics
 import os
 import sys
 import time
-import json
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
-from collections import defaultdict, deque
+import numpy as np
+from datetime import datetime
+from typing import Dict, List, Any, NamedTuple, Tuple, Union
+from dataclasses import dataclass
+from collections import deque
+from enum import IntEnum
+from types import MappingProxyType
+try:
+    from numba import njit
+except ImportError:
+    # Fallback for environments without numba
+    njit = None
 
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+class Category(IntEnum):
+    """Built-in metric categories; the value is the code stored in the metric ring buffer"""
+    RESPONSE_TIME = 0
+    ACCURACY = 1
+    ERROR_RATE = 2
+    RESOURCE_USAGE = 3
 
-@dataclass
+_CAT_LOOKUP = {member.name.lower(): member for member in Category}
+
+CATEGORY_NAMES = tuple(_CAT_LOOKUP)
+
+# Plain-int aliases so hot paths compare against module globals, not enum attributes
+CAT_RESPONSE = int(Category.RESPONSE_TIME)
+CAT_ACCURACY = int(Category.ACCURACY)
+CAT_ERROR = int(Category.ERROR_RATE)
+CAT_RESOURCE = int(Category.RESOURCE_USAGE)
+MAX_CATEGORY_CODE = 127  # Codes are stored as int8
+
+METRICS_CAPACITY = 1000  # Last 1000 metrics
+STATS_WINDOW = 100  # Rolling stats cover the last 100 metrics
+NS_PER_HOUR = 3_600_000_000_000
+
+# Dev mode: set HELM_AI_MOCK to serve fixed sample stats instead of live ones
+USE_MOCK_STATS = bool(os.getenv("HELM_AI_MOCK"))
+
+MOCK_PERFORMANCE_STATS = {
+    "total_requests": 1500,
+    "successful_requests": 1425,
+    "failed_requests": 75,
+    "avg_response_time": 1250.5,
+    "avg_accuracy": 0.92,
+    "peak_response_time": 3500.0,
+    "min_response_time": 450.0,
+    "max_response_time": 3500.0,
+    "error_rate": 0.05,
+    "gpu_usage": 65.0,
+    "memory_usage": 72.0
+}
+
+# Timestamps are stored on the monotonic clock so time-window cutoffs are plain int
+# compares immune to wall-clock jumps; this offset maps them back to Unix time
+_MONOTONIC_EPOCH_NS = time.time_ns() - time.monotonic_ns()
+SUMMARY_CACHE_TTL = 1.0  # Seconds a cached performance summary may be served
+
+# Model health status codes stored in the model health table
+STATUS_HEALTHY = 0
+STATUS_DEGRADED = 1
+STATUS_UNHEALTHY = 2
+
+HEALTH_STATUSES = ("healthy", "degraded", "unhealthy")
+
+# Status code indexed by [critical][warning] threshold flags
+_STATUS_LOOKUP = (
+    (STATUS_HEALTHY, STATUS_DEGRADED),
+    (STATUS_UNHEALTHY, STATUS_UNHEALTHY)
+)
+
+MODEL_HEALTH_CAPACITY = 64  # Initial slots; the table doubles when full
+TREND_WINDOW = 10  # Trends compare the newest 10 values per category with the 10 before
+
+# Raised alerts are kept raw in a fixed ring and only formatted when read
+ALERT_CAPACITY = 256
+_ALERT_DTYPE = np.dtype([("ts", "i8"), ("cat", "i1"), ("sev", "i1"), ("val", "f8"), ("thr", "f8")])
+
+NO_ALERT = -1
+SEVERITY_WARNING = 0
+SEVERITY_CRITICAL = 1
+
+ALERT_SEVERITIES = ("warning", "critical")
+
+# Alert codes are the built-in category codes, except that resource usage metrics
+# named like memory metrics get their own code and the memory thresholds
+ALERT_MEMORY = 4
+
+# Alert type and message format indexed by alert code
+_ALERT_TYPES = ("performance", "performance", "performance", "resource", "resource")
+_ALERT_MESSAGES = (
+    "Response time {:.0f}ms exceeds threshold",
+    "Accuracy {:.2f} below threshold",
+    "Error rate {:.2f} exceeds threshold",
+    "GPU usage {:.1f}% exceeds threshold",
+    "Memory usage {:.1f}% exceeds threshold"
+)
+
+def _to_datetime(monotonic_ns: int) -> datetime:
+    """Wall-clock datetime for a stored monotonic timestamp"""
+    return datetime.fromtimestamp((int(monotonic_ns) + _MONOTONIC_EPOCH_NS) / 1e9)
+
+def _trends_loop(values, categories, window, recent_sum, recent_count, older_sum, older_count):
+    """Sum the newest `window` values per category, and the `window` values before those"""
+    for i in range(values.shape[0] - 1, -1, -1):
+        code = categories[i]
+        if recent_count[code] < window:
+            recent_sum[code] += values[i]
+            recent_count[code] += 1
+        elif older_count[code] < window:
+            older_sum[code] += values[i]
+            older_count[code] += 1
+
+def _trends_vectorized(values, categories, window, recent_sum, recent_count, older_sum, older_count):
+    """NumPy equivalent of _trends_loop, for when numba cannot compile the loop"""
+    newest_first = categories[::-1].astype(np.intp)
+    order = np.argsort(newest_first, kind='stable')
+    grouped = newest_first[order]
+    # Rank of each value among its category's values, newest first
+    rank = np.empty(len(order), dtype=np.intp)
+    rank[order] = np.arange(len(order)) - np.searchsorted(grouped, grouped, side='left')
+    size = len(recent_sum)
+    for lo, sums, counts in ((0, recent_sum, recent_count), (window, older_sum, older_count)):
+        selected = (rank >= lo) & (rank < lo + window)
+        codes = newest_first[selected]
+        sums += np.bincount(codes, weights=values[::-1][selected], minlength=size)
+        counts += np.bincount(codes, minlength=size)
+
+if njit is not None:
+    _trends_kernel = njit('void(float64[:], int8[:], int64, float64[:], int64[:], float64[:], int64[:])',
+                          cache=True)(_trends_loop)
+else:
+    _trends_kernel = _trends_vectorized
+
+@dataclass(slots=True, frozen=True)
 class PerformanceMetric:
     """Performance metric data structure"""
     timestamp: datetime
@@ -27,7 +151,7 @@ class PerformanceMetric:
     category: str  # response_time, accuracy, throughput, resource_usage
     tags: List[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelHealth:
     """Model health status"""
     timestamp: datetime
@@ -40,13 +164,64 @@ class ModelHealth:
     gpu_usage: float
     memory_usage: float
 
+class PerformanceAlert(NamedTuple):
+    """Performance alert raised by a recorded metric"""
+    type: str  # performance, resource
+    severity: str  # warning, critical
+    message: str
+    metric: str
+    value: float
+    threshold: float
+
 class AIPerformanceMonitor:
     """AI Performance Monitoring System"""
     
+    _HEALTH_COLUMNS = (
+        "_health_ts", "_health_status", "_health_resp", "_health_acc",
+        "_health_rpm", "_health_err", "_health_gpu", "_health_mem"
+    )
+    
     def __init__(self):
         self.logger = logging.getLogger("ai_performance")
-        self.metrics_history = deque(maxlen=1000)  # Last 1000 metrics
-        self.model_health = {}
+        # Bumped on every write; keys the summary and recommendation caches
+        self._ingest_version = 0
+        self._summary_cache = None  # (hours, ingest_version, computed_at, summary)
+        self._recommendations_cache = None  # (ingest_version, recommendations)
+        # Struct-of-arrays ring buffer of recorded metrics
+        self._val = np.empty(METRICS_CAPACITY, dtype=np.float64)
+        self._cat = np.empty(METRICS_CAPACITY, dtype=np.int8)
+        self._ts = np.empty(METRICS_CAPACITY, dtype=np.int64)  # Monotonic clock in ns
+        # Buffer views over the same columns; single-element reads and writes through a
+        # memoryview skip NumPy scalar boxing, like a stdlib array.array would
+        self._val_view = memoryview(self._val)
+        self._cat_view = memoryview(self._cat)
+        self._ts_view = memoryview(self._ts)
+        self._names = [None] * METRICS_CAPACITY
+        self._units = [None] * METRICS_CAPACITY
+        self._tags = [None] * METRICS_CAPACITY
+        self._head = 0
+        self._count = 0
+        self._seq = 0  # Total metrics recorded; metric #seq lives at seq % METRICS_CAPACITY
+        # Running sums/counts per category over the last STATS_WINDOW metrics, plus
+        # monotonic deques of sequence numbers for the sliding response-time min/max
+        self._window_sum = {}
+        self._window_count = {}
+        self._rt_max_seq = deque()
+        self._rt_min_seq = deque()
+        # Unknown categories are assigned codes after the built-in ones
+        self._category_names = list(CATEGORY_NAMES)
+        self._category_codes = {name: int(member) for name, member in _CAT_LOOKUP.items()}
+        # Fixed-slot struct-of-arrays model health table; slot per model name
+        self._model_ids = {}
+        self._model_names = []
+        self._health_ts = np.empty(MODEL_HEALTH_CAPACITY, dtype=np.int64)  # Monotonic clock in ns
+        self._health_status = np.empty(MODEL_HEALTH_CAPACITY, dtype=np.int8)
+        self._health_resp = np.empty(MODEL_HEALTH_CAPACITY, dtype=np.float64)
+        self._health_acc = np.empty(MODEL_HEALTH_CAPACITY, dtype=np.float64)
+        self._health_rpm = np.empty(MODEL_HEALTH_CAPACITY, dtype=np.float64)
+        self._health_err = np.empty(MODEL_HEALTH_CAPACITY, dtype=np.float64)
+        self._health_gpu = np.empty(MODEL_HEALTH_CAPACITY, dtype=np.float64)
+        self._health_mem = np.empty(MODEL_HEALTH_CAPACITY, dtype=np.float64)
         self.alert_thresholds = {
             "response_time_warning": 2000,  # 2 seconds
             "response_time_critical": 5000,  # 5 seconds
@@ -59,6 +234,19 @@ class AIPerformanceMonitor:
             "memory_usage_warning": 80.0,  # 80%
             "memory_usage_critical": 95.0,  # 95%
         }
+        self._alert_ring = np.empty(ALERT_CAPACITY, dtype=_ALERT_DTYPE)
+        self._alert_metrics = [None] * ALERT_CAPACITY
+        self._alert_head = 0
+        self._alert_count = 0
+        # Alert handlers indexed by alert code
+        self._alert_handlers = (
+            self._response_time_alert,
+            self._accuracy_alert,
+            self._error_rate_alert,
+            self._resource_usage_alert,
+            self._memory_usage_alert
+        )
+        self._resource_alert_codes = {}  # Resource metric name -> alert code
         self.performance_stats = {
             "total_requests": 0,
             "successful_requests": 0,
@@ -66,251 +254,518 @@ class AIPerformanceMonitor:
             "avg_response_time": 0.0,
             "avg_accuracy": 0.0,
             "peak_response_time": 0.0,
-            "min_response_time": float('inf'),
-            "max_response_time": 0.0
+            "min_response_time": 0.0,
+            "max_response_time": 0.0,
+            "error_rate": 0.0
         }
     
-    def record_metric(self, metric_name: str, value: float, unit: str, category: str, tags: List[str] = None):
+    @property
+    def metrics_count(self) -> int:
+        """Number of metrics currently held in the ring buffer"""
+        return self._count
+    
+    @property
+    def metrics_history(self) -> List[PerformanceMetric]:
+        """Recorded metrics, oldest first, materialized from the ring buffer"""
+        return self.get_recent_metrics(self._count)
+    
+    def get_recent_metrics(self, limit: int = STATS_WINDOW) -> List[PerformanceMetric]:
+        """Materialize only the last `limit` recorded metrics, oldest first"""
+        return [
+            PerformanceMetric(
+                timestamp=_to_datetime(self._ts_view[idx]),
+                metric_name=self._names[idx],
+                value=self._val_view[idx],
+                unit=self._units[idx],
+                category=self._category_names[self._cat_view[idx]],
+                tags=self._tags[idx]
+            )
+            for idx in self._last_indices(limit).tolist()
+        ]
+    
+    def _category_code(self, category: Union[str, Category]) -> int:
+        """Get the integer code for a category, registering unknown ones"""
+        if isinstance(category, Category):
+            return int(category)
+        code = self._category_codes.get(category)
+        if code is None:
+            code = len(self._category_names)
+            if code > MAX_CATEGORY_CODE:
+                raise ValueError(f"Too many metric categories; cannot register {category!r}")
+            self._category_names.append(category)
+            self._category_codes[category] = code
+        return code
+    
+    def _last_indices(self, n: int) -> np.ndarray:
+        """Ring-buffer indices of the last n recorded metrics, oldest first"""
+        n = min(n, self._count)
+        return (self._head - n + np.arange(n)) % METRICS_CAPACITY
+    
+    def record_metric(self, metric_name: str, value: float, unit: str, category: Union[str, Category],
+                      tags: List[str] = None):
         """Record a performance metric"""
-        metric = PerformanceMetric(
-            timestamp=datetime.now(),
-            metric_name=metric_name,
-            value=value,
-            unit=unit,
-            category=category,
-            tags=tags or []
-        )
-        
-        self.metrics_history.append(metric)
+        code = self._category_code(category)
+        head = self._head
+        self._val_view[head] = value
+        self._cat_view[head] = code
+        self._ts_view[head] = time.monotonic_ns()
+        self._names[head] = metric_name
+        self._units[head] = unit
+        self._tags[head] = tags or []
+        self._head = (head + 1) % METRICS_CAPACITY
+        if self._count < METRICS_CAPACITY:
+            self._count += 1
+        self._seq += 1
+        self._ingest_version += 1
         
         # Update performance stats
-        self._update_performance_stats()
+        self._update_performance_stats(code, value)
         
         # Check for alerts
-        self._check_performance_alerts(metric)
+        self._check_performance_alerts(metric_name, value, code)
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Recorded metric: %s = %s %s", metric_name, value, unit)
+    
+    def record_metrics_batch(self, metric_names: List[str], values: List[float], units: List[str],
+                             categories: List[Union[str, Category]], tags: List[List[str]] = None):
+        """Record a batch of performance metrics with one stats update and one alert scan"""
+        n = len(values)
+        if n == 0:
+            return
+        
+        values = np.asarray(values, dtype=np.float64)
+        codes = np.fromiter((self._category_code(c) for c in categories), dtype=np.int8, count=n)
+        
+        # Only the newest METRICS_CAPACITY entries of an oversized batch stay in the ring
+        keep = min(n, METRICS_CAPACITY)
+        start = n - keep
+        positions = (self._head + start + np.arange(keep)) % METRICS_CAPACITY
+        self._val[positions] = values[start:]
+        self._cat[positions] = codes[start:]
+        self._ts[positions] = time.monotonic_ns()
+        for offset, position in enumerate(positions.tolist(), start):
+            self._names[position] = metric_names[offset]
+            self._units[position] = units[offset]
+            self._tags[position] = (tags[offset] if tags else None) or []
+        self._head = (self._head + n) % METRICS_CAPACITY
+        self._count = min(self._count + n, METRICS_CAPACITY)
+        self._seq += n
+        self._ingest_version += 1
         
-        self.logger.info(f"Recorded metric: {metric_name} = {value} {unit}")
+        # Update performance stats
+        self._rebuild_window_stats()
+        self._publish_window_stats()
+        
+        # Check for alerts, only building alert dicts where a threshold is crossed
+        alert_codes = codes.copy()
+        # Custom categories never alert; their codes (from 4) would otherwise alias ALERT_MEMORY
+        alert_codes[codes > CAT_RESOURCE] = NO_ALERT
+        for i in np.flatnonzero(codes == CAT_RESOURCE).tolist():
+            alert_codes[i] = self._resource_alert_code(metric_names[i])
+        alert_mask = (
+            ((alert_codes == CAT_RESPONSE) & (values > self._rt_warn)) |
+            ((alert_codes == CAT_ACCURACY) & (values < self._acc_warn)) |
+            ((alert_codes == CAT_ERROR) & (values > self._err_warn)) |
+            ((alert_codes == CAT_RESOURCE) & (values > self._gpu_warn)) |
+            ((alert_codes == ALERT_MEMORY) & (values > self._mem_warn))
+        )
+        alert_idx = np.flatnonzero(alert_mask)
+        for i in alert_idx.tolist():
+            code = int(alert_codes[i])
+            value = float(values[i])
+            self._push_alert(metric_names[i], code, self._alert_handlers[code](value), value)
+        if len(alert_idx):
+            self.logger.warning(f"Performance alerts: {len(alert_idx)} alerts generated")
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Recorded %d metrics", n)
     
     def record_model_health(self, model_name: str, response_time_ms: float, accuracy: float, 
                          requests_per_minute: float, error_rate: float, 
                          gpu_usage: float = 0, memory_usage: float = 0):
         """Record model health status"""
-        # Determine health status
-        status = "healthy"
-        if (response_time_ms > self.alert_thresholds["response_time_critical"] or 
-            accuracy < self.alert_thresholds["accuracy_critical"] or
-            error_rate > self.alert_thresholds["error_rate_critical"] or
-            gpu_usage > self.alert_thresholds["gpu_usage_critical"] or
-            memory_usage > self.alert_thresholds["memory_usage_critical"]):
-            status = "unhealthy"
-        elif (response_time_ms > self.alert_thresholds["response_time_warning"] or 
-              accuracy < self.alert_thresholds["accuracy_warning"] or
-              error_rate > self.alert_thresholds["error_rate_warning"] or
-              gpu_usage > self.alert_thresholds["gpu_usage_warning"] or
-              memory_usage > self.alert_thresholds["memory_usage_warning"]):
-            status = "degraded"
-        
-        health = ModelHealth(
-            timestamp=datetime.now(),
-            model_name=model_name,
-            status=status,
-            response_time_ms=response_time_ms,
-            accuracy=accuracy,
-            requests_per_minute=requests_per_minute,
-            error_rate=error_rate,
-            gpu_usage=gpu_usage,
-            memory_usage=memory_usage
-        )
-        
-        self.model_health[model_name] = health
-        
-        self.logger.info(f"Model health updated: {model_name} = {status}")
+        # Determine health status; bitwise | evaluates every comparison without
+        # short-circuit branches, and the two flags index the status code directly
+        critical = ((response_time_ms > self._rt_crit) | (accuracy < self._acc_crit) |
+                    (error_rate > self._err_crit) | (gpu_usage > self._gpu_crit) |
+                    (memory_usage > self._mem_crit))
+        warning = ((response_time_ms > self._rt_warn) | (accuracy < self._acc_warn) |
+                   (error_rate > self._err_warn) | (gpu_usage > self._gpu_warn) |
+                   (memory_usage > self._mem_warn))
+        status = _STATUS_LOOKUP[critical][warning]
+        
+        slot = self._model_ids.get(model_name)
+        if slot is None:
+            slot = len(self._model_names)
+            if slot == len(self._health_ts):
+                self._grow_health_table()
+            model_name = sys.intern(model_name)
+            self._model_ids[model_name] = slot
+            self._model_names.append(model_name)
+        
+        self._health_ts[slot] = time.monotonic_ns()
+        self._health_status[slot] = status
+        self._health_resp[slot] = response_time_ms
+        self._health_acc[slot] = accuracy
+        self._health_rpm[slot] = requests_per_minute
+        self._health_err[slot] = error_rate
+        self._health_gpu[slot] = gpu_usage
+        self._health_mem[slot] = memory_usage
+        self._ingest_version += 1
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Model health updated: %s = %s", model_name, HEALTH_STATUSES[status])
     
-    def _update_performance_stats(self):
-        """Update performance statistics"""
-        if not self.metrics_history:
-            return
-        
-        recent_metrics = list(self.metrics_history)[-100:]  # Last 100 metrics
-        
-        # Calculate stats
-        response_times = [m.value for m in recent_metrics if m.category == "response_time"]
-        accuracy_metrics = [m.value for m in recent_metrics if m.category == "accuracy"]
-        error_metrics = [m.value for m in recent_metrics if m.category == "error_rate"]
-        
-        if response_times:
-            self.performance_stats["avg_response_time"] = sum(response_times) / len(response_times)
-            self.performance_stats["peak_response_time"] = max(response_times)
-            self.performance_stats["min_response_time"] = min(response_times)
-        
-        if accuracy_metrics:
-            self.performance_stats["avg_accuracy"] = sum(accuracy_metrics) / len(accuracy_metrics)
-        
-        if error_metrics:
-            self.performance_stats["error_rate"] = sum(error_metrics) / len(error_metrics)
+    def _grow_health_table(self):
+        """Double the capacity of the model health table"""
+        for attr in self._HEALTH_COLUMNS:
+            column = getattr(self, attr)
+            grown = np.empty(len(column) * 2, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, attr, grown)
+    
+    @property
+    def model_health(self) -> Dict[str, ModelHealth]:
+        """Latest health per model, materialized from the model health table"""
+        return {
+            name: ModelHealth(
+                timestamp=_to_datetime(self._health_ts[slot]),
+                model_name=name,
+                status=HEALTH_STATUSES[self._health_status[slot]],
+                response_time_ms=float(self._health_resp[slot]),
+                accuracy=float(self._health_acc[slot]),
+                requests_per_minute=float(self._health_rpm[slot]),
+                error_rate=float(self._health_err[slot]),
+                gpu_usage=float(self._health_gpu[slot]),
+                memory_usage=float(self._health_mem[slot])
+            )
+            for slot, name in enumerate(self._model_names)
+        }
+    
+    def _update_performance_stats(self, code: int, value: float):
+        """Update performance statistics for the metric just recorded"""
+        seq = self._seq - 1
+        window_sum = self._window_sum
+        window_count = self._window_count
+        
+        # Add the new metric to the window
+        window_sum[code] = window_sum.get(code, 0.0) + value
+        window_count[code] = window_count.get(code, 0) + 1
+        if code == CAT_RESPONSE:
+            self._push_response_time(seq, value)
+        
+        # Evict the metric that just left the window
+        evicted_code = code
+        evicted = seq - STATS_WINDOW
+        if evicted >= 0:
+            evicted_idx = evicted % METRICS_CAPACITY
+            evicted_code = self._cat_view[evicted_idx]
+            window_count[evicted_code] -= 1
+            if window_count[evicted_code]:
+                window_sum[evicted_code] -= self._val_view[evicted_idx]
+            else:
+                window_sum[evicted_code] = 0.0  # Reset to shed accumulated rounding error
+            if evicted_code == CAT_RESPONSE:
+                if self._rt_max_seq[0] <= evicted:
+                    self._rt_max_seq.popleft()
+                if self._rt_min_seq[0] <= evicted:
+                    self._rt_min_seq.popleft()
+        
+        # Only the categories that entered or left the window can change their stats;
+        # custom and resource-usage categories feed no rolling stats at all
+        if code in _STATS_PUBLISHERS:
+            _STATS_PUBLISHERS[code](self)
+        if evicted_code != code and evicted_code in _STATS_PUBLISHERS:
+            _STATS_PUBLISHERS[evicted_code](self)
+    
+    def _rebuild_window_stats(self):
+        """Recompute the rolling window state from the ring buffer"""
+        n = min(self._seq, STATS_WINDOW)
+        first_seq = self._seq - n
+        idx = self._last_indices(n)
+        values = self._val.take(idx)
+        codes = self._cat.take(idx)
+        
+        num_categories = len(self._category_names)
+        sums = np.bincount(codes, weights=values, minlength=num_categories)
+        counts = np.bincount(codes, minlength=num_categories)
+        self._window_sum = {code: float(sums[code]) for code in range(num_categories)}
+        self._window_count = {code: int(counts[code]) for code in range(num_categories)}
+        
+        self._rt_max_seq.clear()
+        self._rt_min_seq.clear()
+        for offset in np.flatnonzero(codes == CAT_RESPONSE).tolist():
+            self._push_response_time(first_seq + offset, float(values[offset]))
+    
+    def _publish_window_stats(self):
+        """Copy the rolling window state into performance_stats"""
+        self._publish_response_time_stats()
+        self._publish_accuracy_stats()
+        self._publish_error_rate_stats()
+    
+    def _publish_response_time_stats(self):
+        """Copy the rolling response-time stats into performance_stats"""
+        rt_count = self._window_count.get(CAT_RESPONSE, 0)
+        if rt_count:
+            self.performance_stats["avg_response_time"] = self._window_sum[CAT_RESPONSE] / rt_count
+            self.performance_stats["peak_response_time"] = self._val_view[self._rt_max_seq[0] % METRICS_CAPACITY]
+            self.performance_stats["min_response_time"] = self._val_view[self._rt_min_seq[0] % METRICS_CAPACITY]
+    
+    def _publish_accuracy_stats(self):
+        """Copy the rolling accuracy stats into performance_stats"""
+        accuracy_count = self._window_count.get(CAT_ACCURACY, 0)
+        if accuracy_count:
+            self.performance_stats["avg_accuracy"] = self._window_sum[CAT_ACCURACY] / accuracy_count
+    
+    def _publish_error_rate_stats(self):
+        """Copy the rolling error-rate stats into performance_stats"""
+        error_count = self._window_count.get(CAT_ERROR, 0)
+        if error_count:
+            self.performance_stats["error_rate"] = self._window_sum[CAT_ERROR] / error_count
         else:
             self.performance_stats["error_rate"] = 0.0
     
-    def _check_performance_alerts(self, metric: PerformanceMetric):
+    def _push_response_time(self, seq: int, value: float):
+        """Push a response time onto the sliding min/max monotonic deques"""
+        values = self._val_view
+        while self._rt_max_seq and values[self._rt_max_seq[-1] % METRICS_CAPACITY] <= value:
+            self._rt_max_seq.pop()
+        self._rt_max_seq.append(seq)
+        while self._rt_min_seq and values[self._rt_min_seq[-1] % METRICS_CAPACITY] >= value:
+            self._rt_min_seq.pop()
+        self._rt_min_seq.append(seq)
+    
+    @property
+    def alert_thresholds(self) -> MappingProxyType:
+        """Read-only view of the alert thresholds; assign a new dict to change them"""
+        return self._alert_thresholds
+    
+    @alert_thresholds.setter
+    def alert_thresholds(self, thresholds: Dict[str, float]):
+        self._alert_thresholds = MappingProxyType(dict(thresholds))
+        self._cache_alert_thresholds()
+    
+    def _cache_alert_thresholds(self):
+        """Copy alert thresholds into plain attributes for the alerting paths"""
+        thresholds = self._alert_thresholds
+        self._ingest_version += 1
+        self._rt_warn = float(thresholds["response_time_warning"])
+        self._rt_crit = float(thresholds["response_time_critical"])
+        self._acc_warn = float(thresholds["accuracy_warning"])
+        self._acc_crit = float(thresholds["accuracy_critical"])
+        self._err_warn = float(thresholds["error_rate_warning"])
+        self._err_crit = float(thresholds["error_rate_critical"])
+        self._gpu_warn = float(thresholds["gpu_usage_warning"])
+        self._gpu_crit = float(thresholds["gpu_usage_critical"])
+        self._mem_warn = float(thresholds["memory_usage_warning"])
+        self._mem_crit = float(thresholds["memory_usage_critical"])
+        # Warning threshold recorded with an alert, indexed by alert code
+        self._warn_thresholds = (self._rt_warn, self._acc_warn, self._err_warn, self._gpu_warn, self._mem_warn)
+    
+    def _check_performance_alerts(self, metric_name: str, value: float, category: int):
         """Check for performance alerts"""
-        alerts = []
-        
-        if metric.category == "response_time" and metric.value > self.alert_thresholds["response_time_warning"]:
-            alerts.append({
-                "type": "performance",
-                "severity": "warning" if metric.value < self.alert_thresholds["response_time_critical"] else "critical",
-                "message": f"Response time {metric.value:.0f}ms exceeds threshold",
-                "metric": metric.metric_name,
-                "value": metric.value,
-                "threshold": self.alert_thresholds["response_time_warning"]
-            })
-        
-        if metric.category == "accuracy" and metric.value < self.alert_thresholds["accuracy_warning"]:
-            alerts.append({
-                "type": "performance",
-                "severity": "warning" if metric.value < self.alert_thresholds["accuracy_critical"] else "critical",
-                "message": f"Accuracy {metric.value:.2f} below threshold",
-                "metric": metric.metric_name,
-                "value": metric.value,
-                "threshold": self.alert_thresholds["accuracy_warning"]
-            })
-        
-        if metric.category == "error_rate" and metric.value > self.alert_thresholds["error_rate_warning"]:
-            alerts.append({
-                "type": "performance",
-                "severity": "warning" if metric.value < self.alert_thresholds["error_rate_critical"] else "critical",
-                "message": f"Error rate {metric.value:.2f} exceeds threshold",
-                "metric": metric.metric_name,
-                "value": metric.value,
-                "threshold": self.alert_thresholds["error_rate_warning"]
-            })
-        
-        if metric.category == "resource_usage" and metric.value > self.alert_thresholds["gpu_usage_warning"]:
-            alerts.append({
-                "type": "resource",
-                "severity": "warning" if metric.value < self.alert_thresholds["gpu_usage_critical"] else "critical",
-                "message": f"GPU usage {metric.value:.1f}% exceeds threshold",
-                "metric": metric.metric_name,
-                "value": metric.value,
-                "threshold": self.alert_thresholds["gpu_usage_warning"]
-            })
+        # Categories without a handler (custom ones) never alert
+        if category > CAT_RESOURCE:
+            return
         
-        if alerts:
-            self.logger.warning(f"Performance alerts: {len(alerts)} alerts generated")
+        code = self._resource_alert_code(metric_name) if category == CAT_RESOURCE else category
+        severity = self._alert_handlers[code](value)
+        if severity != NO_ALERT:
+            self._push_alert(metric_name, code, severity, value)
+            self.logger.warning("Performance alerts: 1 alerts generated")
+    
+    def _resource_alert_code(self, metric_name: str) -> int:
+        """Alert code for a resource usage metric, memoized per metric name"""
+        code = self._resource_alert_codes.get(metric_name)
+        if code is None:
+            code = ALERT_MEMORY if "memory" in metric_name.lower() else CAT_RESOURCE
+            self._resource_alert_codes[metric_name] = code
+        return code
+    
+    def _push_alert(self, metric_name: str, code: int, severity: int, value: float):
+        """Write a raised alert into the alert ring, overwriting the oldest when full"""
+        head = self._alert_head
+        self._alert_ring[head] = (time.monotonic_ns(), code, severity, value, self._warn_thresholds[code])
+        self._alert_metrics[head] = metric_name
+        self._alert_head = (head + 1) % ALERT_CAPACITY
+        if self._alert_count < ALERT_CAPACITY:
+            self._alert_count += 1
+    
+    def _response_time_alert(self, value: float) -> int:
+        """Severity for a response time metric above the warning threshold"""
+        if value <= self._rt_warn:
+            return NO_ALERT
+        return SEVERITY_CRITICAL if value >= self._rt_crit else SEVERITY_WARNING
+    
+    def _accuracy_alert(self, value: float) -> int:
+        """Severity for an accuracy metric below the warning threshold"""
+        if value >= self._acc_warn:
+            return NO_ALERT
+        return SEVERITY_CRITICAL if value < self._acc_crit else SEVERITY_WARNING
+    
+    def _error_rate_alert(self, value: float) -> int:
+        """Severity for an error rate metric above the warning threshold"""
+        if value <= self._err_warn:
+            return NO_ALERT
+        return SEVERITY_CRITICAL if value >= self._err_crit else SEVERITY_WARNING
+    
+    def _resource_usage_alert(self, value: float) -> int:
+        """Severity for a resource usage metric above the GPU warning threshold"""
+        if value <= self._gpu_warn:
+            return NO_ALERT
+        return SEVERITY_CRITICAL if value >= self._gpu_crit else SEVERITY_WARNING
+    
+    def _memory_usage_alert(self, value: float) -> int:
+        """Severity for a memory usage metric above the memory warning threshold"""
+        if value <= self._mem_warn:
+            return NO_ALERT
+        return SEVERITY_CRITICAL if value >= self._mem_crit else SEVERITY_WARNING
+    
+    def _recorded_alerts(self, cutoff_ns: int) -> List[Tuple[int, PerformanceAlert]]:
+        """(timestamp ns, alert) pairs for alerts raised after cutoff_ns, newest first"""
+        positions = (self._alert_head - 1 - np.arange(self._alert_count)) % ALERT_CAPACITY
+        records = self._alert_ring[positions]
+        keep = records["ts"] > cutoff_ns
+        alerts = []
+        for position, (ts, cat, sev, val, thr) in zip(positions[keep].tolist(), records[keep].tolist()):
+            alerts.append((ts, PerformanceAlert(
+                type=_ALERT_TYPES[cat],
+                severity=ALERT_SEVERITIES[sev],
+                message=_ALERT_MESSAGES[cat].format(val),
+                metric=self._alert_metrics[position],
+                value=val,
+                threshold=thr
+            )))
+        return alerts
     
     def get_performance_summary(self, hours: int = 1) -> Dict[str, Any]:
-        """Get performance summary for specified time period"""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        """Get performance summary for specified time period
+        
+        Repeated calls with no new data within SUMMARY_CACHE_TTL seconds return the
+        same cached dict, which must not be mutated.
+        """
+        now = time.monotonic()
+        cache = self._summary_cache
+        if (cache is not None and cache[0] == hours and cache[1] == self._ingest_version
+                and now - cache[2] < SUMMARY_CACHE_TTL):
+            return cache[3]
+        
+        cutoff_ns = time.monotonic_ns() - hours * NS_PER_HOUR
         
         # Filter recent metrics
-        recent_metrics = [
-            m for m in self.metrics_history 
-            if m.timestamp > cutoff_time
-        ]
+        recent_idx = self._last_indices(self._count)
+        recent_idx = recent_idx[self._ts[recent_idx] > cutoff_ns]
         
-        # Add mock data for testing
-        mock_stats = {
-            "total_requests": 1500,
-            "successful_requests": 1425,
-            "failed_requests": 75,
-            "avg_response_time": 1250.5,
-            "avg_accuracy": 0.92,
-            "peak_response_time": 3500.0,
-            "min_response_time": 450.0,
-            "max_response_time": 3500.0,
-            "error_rate": 0.05,
-            "gpu_usage": 65.0,
-            "memory_usage": 72.0
-        }
+        if USE_MOCK_STATS:
+            performance_stats = dict(MOCK_PERFORMANCE_STATS)
+        else:
+            performance_stats = dict(self.performance_stats)
         
         # Calculate summary
         summary = {
             "period_hours": hours,
-            "total_metrics": len(recent_metrics),
-            "performance_stats": mock_stats,
-            "model_health": dict(self.model_health),
-            "alerts": self._get_recent_alerts(hours),
-            "trends": self._calculate_trends(recent_metrics),
+            "total_metrics": len(recent_idx),
+            "performance_stats": performance_stats,
+            "model_health": self.model_health,
+            "alerts": self._get_recent_alerts(cutoff_ns),
+            "trends": self._calculate_trends(recent_idx),
             "recommendations": self._generate_recommendations()
         }
         
+        self._summary_cache = (hours, self._ingest_version, now, summary)
         return summary
     
-    def _get_recent_alerts(self, hours: int) -> List[Dict[str, Any]]:
-        """Get recent alerts"""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        
+    def _get_recent_alerts(self, cutoff_ns: int) -> List[Dict[str, Any]]:
+        """Get recent alerts: rolling-average alerts followed by recorded alerts, newest first"""
         # This would integrate with actual alert system
-        # For now, return mock alerts based on thresholds
+        # For now, return mock alerts based on the cached thresholds (see _cache_alert_thresholds)
         alerts = []
+        timestamp = datetime.now().isoformat()
         
-        if self.performance_stats["avg_response_time"] > self.alert_thresholds["response_time_warning"]:
+        if self.performance_stats["avg_response_time"] > self._rt_warn:
             alerts.append({
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "type": "performance",
                 "severity": "warning",
                 "message": f"Avg response time ({self.performance_stats['avg_response_time']:.0f}ms) exceeds threshold"
             })
         
-        if self.performance_stats["avg_accuracy"] < self.alert_thresholds["accuracy_warning"]:
+        if self.performance_stats["avg_accuracy"] < self._acc_warn:
             alerts.append({
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "type": "performance",
                 "severity": "warning",
                 "message": f"Accuracy ({self.performance_stats['avg_accuracy']:.2f}) below threshold"
             })
         
+        for ts, alert in self._recorded_alerts(cutoff_ns):
+            record = alert._asdict()
+            record["timestamp"] = _to_datetime(ts).isoformat()
+            alerts.append(record)
+        
         return alerts
     
-    def _calculate_trends(self, metrics: List[PerformanceMetric]) -> Dict[str, Any]:
-        """Calculate performance trends"""
-        if len(metrics) < 10:
+    def _calculate_trends(self, indices: np.ndarray) -> Dict[str, Any]:
+        """Calculate performance trends over the given ring-buffer indices (oldest first)"""
+        if len(indices) < 10:
             return {}
         
-        # Group metrics by category
-        categories = defaultdict(list)
-        for metric in metrics:
-            categories[metric.category].append(metric)
+        num_categories = len(self._category_names)
+        recent_sum = np.zeros(num_categories, dtype=np.float64)
+        recent_count = np.zeros(num_categories, dtype=np.int64)
+        older_sum = np.zeros(num_categories, dtype=np.float64)
+        older_count = np.zeros(num_categories, dtype=np.int64)
+        _trends_kernel(self._val.take(indices), self._cat.take(indices), TREND_WINDOW,
+                       recent_sum, recent_count, older_sum, older_count)
         
         trends = {}
-        for category, category_metrics in categories.items():
-            if len(category_metrics) >= 2:
-                recent_values = [m.value for m in category_metrics[-10:]]
-                older_values = [m.value for m in category_metrics[-20:-10]]
-                
-                if recent_values and older_values:
-                    recent_avg = sum(recent_values) / len(recent_values)
-                    older_avg = sum(older_values) / len(older_values)
-                    
-                    trend = "improving" if recent_avg < older_avg else "degrading" if recent_avg > older_avg else "stable"
-                    change_percent = ((recent_avg - older_avg) / older_avg) * 100 if older_avg != 0 else 0
-                    
-                    trends[category] = {
-                        "trend": trend,
-                        "change_percent": change_percent,
-                        "recent_avg": recent_avg,
-                        "older_avg": older_avg
-                    }
+        for code in np.flatnonzero(older_count):
+            recent_avg = float(recent_sum[code] / recent_count[code])
+            older_avg = float(older_sum[code] / older_count[code])
+            
+            trend = "improving" if recent_avg < older_avg else "degrading" if recent_avg > older_avg else "stable"
+            change_percent = ((recent_avg - older_avg) / older_avg) * 100 if older_avg != 0 else 0
+            
+            trends[self._category_names[code]] = {
+                "trend": trend,
+                "change_percent": change_percent,
+                "recent_avg": recent_avg,
+                "older_avg": older_avg
+            }
         
         return trends
     
     def _generate_recommendations(self) -> List[str]:
         """Generate performance recommendations"""
+        # Recommendations only depend on performance_stats and thresholds
+        cache = self._recommendations_cache
+        if cache is not None and cache[0] == self._ingest_version:
+            return cache[1]
+        
         recommendations = []
         
         # Response time recommendations
-        if self.performance_stats["avg_response_time"] > self.alert_thresholds["response_time_warning"]:
+        if self.performance_stats["avg_response_time"] > self._rt_warn:
             recommendations.append("Consider optimizing model or increasing resources")
         
         # Accuracy recommendations
-        if self.performance_stats["avg_accuracy"] < self.alert_thresholds["accuracy_warning"]:
+        if self.performance_stats["avg_accuracy"] < self._acc_warn:
             recommendations.append("Review training data and model parameters")
         
         # Error rate recommendations
-        if self.performance_stats["error_rate"] > self.alert_thresholds["error_rate_warning"]:
+        if self.performance_stats["error_rate"] > self._err_warn:
             recommendations.append("Investigate error patterns and improve error handling")
         
+        self._recommendations_cache = (self._ingest_version, recommendations)
         return recommendations
 
+# Rolling-stat publishers per category code; other categories feed no rolling stats
+_STATS_PUBLISHERS = {
+    CAT_RESPONSE: AIPerformanceMonitor._publish_response_time_stats,
+    CAT_ACCURACY: AIPerformanceMonitor._publish_accuracy_stats,
+    CAT_ERROR: AIPerformanceMonitor._publish_error_rate_stats
+}
+
 # Global performance monitor instance
 ai_performance_monitor = AIPerformanceMonitor()
@@ -10,14 +10,26 @@ import time
 import json
 import logging
 import threading
+import secrets
+import bisect
+import heapq
+import base64
 import hashlib
+import hmac
 import jwt
 import bcrypt
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
-from collections import defaultdict, deque
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+from collections import OrderedDict, defaultdict, deque
+from itertools import islice
+from operator import attrgetter
 from enum import Enum
+try:
+    import orjson
+except ImportError:
+    # Fallback for environments without orjson
+    orjson = None
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -48,7 +60,74 @@ class Permission(Enum):
     VIEW_REPORTS = "view_reports"
     EXPORT_DATA = "export_data"
 
-@dataclass
+# One bit per permission; a permission set's mask is the OR of its members' bits
+PERMISSION_BITS = {p: 1 << i for i, p in enumerate(Permission)}
+
+# Plain-int bits by string value, so checks are int & int with no Enum lookup
+_PERMISSION_BITS_BY_NAME = {p.value: bit for p, bit in PERMISSION_BITS.items()}
+
+@dataclass(slots=True, frozen=True)
+class IPMatcher:
+    """Compiled IP allow-list: exact addresses, "prefix*" patterns and the "*" wildcard
+    
+    Large allow-lists keep their dot-terminated prefixes ("10.0.", "192.168.1.") in a set
+    probed once per dot in the address, so matching cost does not grow with the list.
+    """
+    exact: frozenset
+    prefixes: Tuple[str, ...]
+    wildcard: bool
+    dot_prefixes: frozenset = frozenset()
+    
+    # Below this many prefixes a single C-level str.startswith over the tuple is faster
+    DOT_SET_MIN_PREFIXES = 32
+    
+    @classmethod
+    def from_patterns(cls, patterns: List[str]) -> 'IPMatcher':
+        """Compile allow-list patterns once so matching needs no per-request string work"""
+        exact = set()
+        prefixes = []
+        for pattern in patterns:
+            if pattern.endswith("*"):
+                prefixes.append(pattern[:-1])
+            else:
+                exact.add(pattern)
+        dot_prefixes = frozenset()
+        if len(prefixes) >= cls.DOT_SET_MIN_PREFIXES:
+            dot_prefixes = frozenset(p for p in prefixes if p.endswith("."))
+            prefixes = [p for p in prefixes if not p.endswith(".")]
+        return cls(exact=frozenset(exact), prefixes=tuple(prefixes), wildcard="*" in patterns,
+                   dot_prefixes=dot_prefixes)
+    
+    def matches(self, ip_address: str) -> bool:
+        """Check an IP address against the allow-list"""
+        if self.wildcard or ip_address in self.exact or ip_address.startswith(self.prefixes):
+            return True
+        if self.dot_prefixes:
+            # A dot-terminated prefix can only match up to one of the address's dots
+            dot = ip_address.find(".")
+            while dot != -1:
+                if ip_address[:dot + 1] in self.dot_prefixes:
+                    return True
+                dot = ip_address.find(".", dot + 1)
+        return False
+
+# Permission tuple -> (ordered claim names for JWTs, permission bitmask).
+# Users sharing a role's canonical tuple share one claim.
+_PERMISSION_VALUES = {}
+
+def _permission_values(permissions: Sequence[Permission]) -> Tuple[Tuple[str, ...], int]:
+    """Claim names and bitmask of a permission set, computed once per distinct set"""
+    key = tuple(permissions)
+    values = _PERMISSION_VALUES.get(key)
+    if values is None:
+        mask = 0
+        for p in key:
+            mask |= PERMISSION_BITS[p]
+        claim = tuple(p.value for p in key)
+        values = _PERMISSION_VALUES.setdefault(key, (claim, mask))
+    return values
+
+@dataclass(slots=True)
 class User:
     """User data structure"""
     user_id: str
@@ -56,7 +135,7 @@ class User:
     email: str
     full_name: str
     role: UserRole
-    permissions: List[Permission]
+    permissions: Sequence[Permission]
     auth_provider: AuthProvider
     last_login: Optional[datetime]
     created_at: datetime
@@ -68,8 +147,26 @@ class User:
     session_timeout: int
     allowed_ips: List[str]
     mfa_secret: Optional[str]
+    password_hash: Optional[bytes] = field(default=None, repr=False)  # bcrypt; None disables password login
+    ip_matcher: IPMatcher = field(init=False, repr=False, compare=False)
+    perm_mask: int = field(init=False, repr=False, compare=False)
+    permissions_claim: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.ip_matcher = IPMatcher.from_patterns(self.allowed_ips)
+        self.set_permissions(self.permissions)
+    
+    def set_permissions(self, permissions: Sequence[Permission]):
+        """Replace the user's permissions and recompute their claim names and bitmask"""
+        self.permissions = permissions
+        self.permissions_claim, self.perm_mask = _permission_values(permissions)
+    
+    def set_allowed_ips(self, allowed_ips: List[str]):
+        """Replace the IP allow-list and recompile its matcher"""
+        self.allowed_ips = allowed_ips
+        self.ip_matcher = IPMatcher.from_patterns(allowed_ips)
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """Session data structure"""
     session_id: str
@@ -80,19 +177,19 @@ class Session:
     ip_address: str
     user_agent: str
     is_active: bool
-    permissions: List[Permission]
+    permissions: Sequence[Permission]
     access_token: str
     refresh_token: str
 
-@dataclass
+@dataclass(slots=True)
 class RolePermission:
     """Role permission mapping"""
     role: UserRole
-    permissions: List[Permission]
+    permissions: Tuple[Permission, ...]  # Canonical per role; shared by every user with the role
     description: str
     level: int  # 1=lowest, 10=highest
 
-@dataclass
+@dataclass(slots=True)
 class SecurityEvent:
     """Security event data structure"""
     event_id: str
@@ -104,22 +201,86 @@ class SecurityEvent:
     severity: str  # low, medium, high, critical
     resolved: bool
     resolution_notes: Optional[str]
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _cached_json: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """API representation, built on first use; events are immutable once logged,
+        so the same dict is returned every time and must not be mutated"""
+        d = self._cached_dict
+        if d is None:
+            d = self._cached_dict = {
+                "event_id": self.event_id,
+                "event_type": self.event_type,
+                "user_id": self.user_id,
+                "ip_address": self.ip_address,
+                "timestamp": self.timestamp.isoformat(),
+                "description": self.description,
+                "severity": self.severity,
+                "resolved": self.resolved,
+                "resolution_notes": self.resolution_notes
+            }
+        return d
+    
+    def to_json(self) -> bytes:
+        """Encoded JSON of to_dict(), built on first use"""
+        data = self._cached_json
+        if data is None:
+            data = self._cached_json = _json_bytes(self.to_dict())
+        return data
+
+_event_timestamp = attrgetter("timestamp")
+
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url, as used by JWT segments"""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+def _json_bytes(payload: Dict[str, Any]) -> bytes:
+    """Compact JSON encoding, used for JWT segments and encoded responses"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+# Every token is HS256, so its header segment is a constant
+_HS256_HEADER = _b64url(_json_bytes({"alg": "HS256", "typ": "JWT"}))
 
 class AuthenticationSystem:
     """Authentication & Authorization System"""
     
     def __init__(self):
         self.logger = logging.getLogger("authentication_system")
+        # Guards every mutation of the user, session, token-cache, lockout and event state
+        self.lock = threading.RLock()
         self.users = {}
+        self._users_by_username = {}
         self.sessions = {}
+        # user_id -> active session ids, kept in a dict to preserve creation order
+        self._sessions_by_user = defaultdict(dict)
+        # Min-heap of (expires_at, session_id) so expired sessions can be dropped oldest first
+        self._expiry_heap = []
+        self.reaper_interval = 60  # Max seconds between background reaper passes
+        self.reaper_active = False
+        self.reaper_thread = None
+        self._reaper_wakeup = threading.Event()
         self.role_permissions = {}
-        self.security_events = deque(maxlen=10000)
+        self.security_events = deque(maxlen=10000)  # Oldest first, in timestamp order
+        # Per-severity views of security_events, trimmed in step with it
+        self._events_by_severity = defaultdict(deque)
         self.jwt_secret = os.getenv('JWT_SECRET', 'your-secret-key-change-in-production')
+        # Keyed HMAC state, copied per token so the key schedule is computed only once
+        self._jwt_hmac = hmac.new(self.jwt_secret.encode('utf-8'), digestmod=hashlib.sha256)
         self.jwt_expiry = 3600  # 1 hour
         self.refresh_expiry = 86400  # 24 hours
         self.max_failed_attempts = 5
         self.lockout_duration = 900  # 15 minutes
-        self.failed_attempts = defaultdict(list)
+        self.bcrypt_rounds = int(os.getenv('BCRYPT_ROUNDS', '12'))  # Lower (min 4) for tests
+        # Monotonic times of the most recent failed attempts per username
+        self.failed_attempts = defaultdict(lambda: deque(maxlen=self.max_failed_attempts))
+        # LRU cache of decoded tokens: token -> (valid_until, payload, (error type, message))
+        self.token_cache_size = 4096
+        self.invalid_token_ttl = 5  # seconds a rejected token stays cached
+        self._token_cache = OrderedDict()
+        self._session_tokens = defaultdict(set)  # session_id -> cached tokens
         
         # Initialize with sample users and roles
         self._initialize_role_permissions()
@@ -131,43 +292,43 @@ class AuthenticationSystem:
         permissions = [
             RolePermission(
                 role=UserRole.ADMIN,
-                permissions=list(Permission),
+                permissions=tuple(Permission),
                 description="Full system access and management",
                 level=10
             ),
             RolePermission(
                 role=UserRole.EXECUTIVE,
-                permissions=[Permission.READ, Permission.VIEW_REPORTS, Permission.EXPORT_DATA],
+                permissions=(Permission.READ, Permission.VIEW_REPORTS, Permission.EXPORT_DATA),
                 description="Executive access to reports and analytics",
                 level=8
             ),
             RolePermission(
                 role=UserRole.MANAGER,
-                permissions=[Permission.READ, Permission.WRITE, Permission.VIEW_REPORTS],
+                permissions=(Permission.READ, Permission.WRITE, Permission.VIEW_REPORTS),
                 description="Manager access with write permissions",
                 level=6
             ),
             RolePermission(
                 role=UserRole.ANALYST,
-                permissions=[Permission.READ, Permission.VIEW_REPORTS, Permission.EXPORT_DATA],
+                permissions=(Permission.READ, Permission.VIEW_REPORTS, Permission.EXPORT_DATA),
                 description="Analyst access to data and reports",
                 level=5
             ),
             RolePermission(
                 role=UserRole.DEVELOPER,
-                permissions=[Permission.READ, Permission.WRITE, Permission.MANAGE_SYSTEM],
+                permissions=(Permission.READ, Permission.WRITE, Permission.MANAGE_SYSTEM),
                 description="Developer access to system management",
                 level=7
             ),
             RolePermission(
                 role=UserRole.VIEWER,
-                permissions=[Permission.READ],
+                permissions=(Permission.READ,),
                 description="Read-only access to system data",
                 level=3
             ),
             RolePermission(
                 role=UserRole.GUEST,
-                permissions=[Permission.READ],
+                permissions=(Permission.READ,),
                 description="Limited read access for guests",
                 level=1
             )
@@ -180,6 +341,7 @@ class AuthenticationSystem:
     
     def _initialize_sample_users(self):
         """Initialize with sample users"""
+        now = datetime.now()
         users = [
             {
                 "user_id": "admin_001",
@@ -187,10 +349,10 @@ class AuthenticationSystem:
                 "email": "admin@stellarlogica.ai",
                 "full_name": "System Administrator",
                 "role": UserRole.ADMIN,
-                "permissions": list(Permission),
+                "permissions": self.role_permissions[UserRole.ADMIN].permissions,
                 "auth_provider": AuthProvider.LOCAL,
-                "last_login": datetime.now() - timedelta(hours=2),
-                "created_at": datetime.now() - timedelta(days=365),
+                "last_login": now - timedelta(hours=2),
+                "created_at": now - timedelta(days=365),
                 "is_active": True,
                 "is_verified": True,
                 "two_factor_enabled": True,
@@ -206,10 +368,10 @@ class AuthenticationSystem:
                 "email": "ceo@stellarlogica.ai",
                 "full_name": "Chief Executive Officer",
                 "role": UserRole.EXECUTIVE,
-                "permissions": [Permission.READ, Permission.VIEW_REPORTS, Permission.EXPORT_DATA],
+                "permissions": self.role_permissions[UserRole.EXECUTIVE].permissions,
                 "auth_provider": AuthProvider.SAML,
-                "last_login": datetime.now() - timedelta(hours=6),
-                "created_at": datetime.now() - timedelta(days=180),
+                "last_login": now - timedelta(hours=6),
+                "created_at": now - timedelta(days=180),
                 "is_active": True,
                 "is_verified": True,
                 "two_factor_enabled": True,
@@ -225,10 +387,10 @@ class AuthenticationSystem:
                 "email": "manager@stellarlogica.ai",
                 "full_name": "Operations Manager",
                 "role": UserRole.MANAGER,
-                "permissions": [Permission.READ, Permission.WRITE, Permission.VIEW_REPORTS],
+                "permissions": self.role_permissions[UserRole.MANAGER].permissions,
                 "auth_provider": AuthProvider.LOCAL,
-                "last_login": datetime.now() - timedelta(hours=4),
-                "created_at": datetime.now() - timedelta(days=90),
+                "last_login": now - timedelta(hours=4),
+                "created_at": now - timedelta(days=90),
                 "is_active": True,
                 "is_verified": True,
                 "two_factor_enabled": False,
@@ -244,10 +406,10 @@ class AuthenticationSystem:
                 "email": "analyst@stellarlogica.ai",
                 "full_name": "Data Analyst",
                 "role": UserRole.ANALYST,
-                "permissions": [Permission.READ, Permission.VIEW_REPORTS, Permission.EXPORT_DATA],
+                "permissions": self.role_permissions[UserRole.ANALYST].permissions,
                 "auth_provider": AuthProvider.OAUTH,
-                "last_login": datetime.now() - timedelta(hours=1),
-                "created_at": datetime.now() - timedelta(days=60),
+                "last_login": now - timedelta(hours=1),
+                "created_at": now - timedelta(days=60),
                 "is_active": True,
                 "is_verified": True,
                 "two_factor_enabled": False,
@@ -259,21 +421,23 @@ class AuthenticationSystem:
             }
         ]
         
+        # Sample accounts share the demo password, so hash it once
+        demo_password_hash = self._hash_password("password123")
         for user_data in users:
-            user = User(**user_data)
-            self.users[user.user_id] = user
+            self._add_user(User(**user_data, password_hash=demo_password_hash))
         
         self.logger.info(f"Initialized {len(users)} sample users")
     
     def _initialize_security_events(self):
         """Initialize with sample security events"""
+        now = datetime.now()
         events = [
             {
                 "event_id": "sec_001",
                 "event_type": "login_success",
                 "user_id": "admin_001",
                 "ip_address": "192.168.1.100",
-                "timestamp": datetime.now() - timedelta(hours=2),
+                "timestamp": now - timedelta(hours=2),
                 "description": "Successful login from admin account",
                 "severity": "low",
                 "resolved": True,
@@ -284,7 +448,7 @@ class AuthenticationSystem:
                 "event_type": "failed_login",
                 "user_id": None,
                 "ip_address": "192.168.1.200",
-                "timestamp": datetime.now() - timedelta(hours=3),
+                "timestamp": now - timedelta(hours=3),
                 "description": "Failed login attempt - invalid credentials",
                 "severity": "medium",
                 "resolved": True,
@@ -295,7 +459,7 @@ class AuthenticationSystem:
                 "event_type": "password_change",
                 "user_id": "mgr_001",
                 "ip_address": "192.168.1.150",
-                "timestamp": datetime.now() - timedelta(hours=6),
+                "timestamp": now - timedelta(hours=6),
                 "description": "Password changed successfully",
                 "severity": "low",
                 "resolved": True,
@@ -306,7 +470,7 @@ class AuthenticationSystem:
                 "event_type": "mfa_enabled",
                 "user_id": "exec_001",
                 "ip_address": "192.168.1.101",
-                "timestamp": datetime.now() - timedelta(days=1),
+                "timestamp": now - timedelta(days=1),
                 "description": "Multi-factor authentication enabled",
                 "severity": "low",
                 "resolved": True,
@@ -314,9 +478,9 @@ class AuthenticationSystem:
             }
         ]
         
-        for event_data in events:
-            event = SecurityEvent(**event_data)
-            self.security_events.append(event)
+        # Keep the log in timestamp order so queries can binary-search the cutoff
+        for event_data in sorted(events, key=lambda e: e["timestamp"]):
+            self._append_security_event(SecurityEvent(**event_data))
         
         self.logger.info(f"Initialized {len(events)} security events")
     
@@ -329,11 +493,7 @@ class AuthenticationSystem:
                 return {"success": False, "error": "Account locked. Please try again later."}
             
             # Find user
-            user = None
-            for u in self.users.values():
-                if u.username == username:
-                    user = u
-                    break
+            user = self._users_by_username.get(username)
             
             if not user:
                 self._record_failed_attempt(username, ip_address)
@@ -359,10 +519,11 @@ class AuthenticationSystem:
             session = self._create_session(user, ip_address, user_agent)
             
             # Update user last login
-            user.last_login = datetime.now()
+            user.last_login = session.created_at
             
             # Clear failed attempts
-            self.failed_attempts[username] = []
+            with self.lock:
+                self.failed_attempts.pop(username, None)
             
             # Log successful login
             self._log_security_event("login_success", user.user_id, ip_address, "Successful login")
@@ -378,7 +539,7 @@ class AuthenticationSystem:
                     "username": user.username,
                     "full_name": user.full_name,
                     "role": user.role.value,
-                    "permissions": [p.value for p in user.permissions]
+                    "permissions": list(user.permissions_claim)
                 }
             }
             
@@ -389,15 +550,16 @@ class AuthenticationSystem:
     def verify_token(self, token: str) -> Dict[str, Any]:
         """Verify JWT token and return user info"""
         try:
-            payload = jwt.decode(token, self.jwt_secret, algorithms=['HS256'])
+            payload = self._decode_token(token)
             
             # Check if session exists and is active
             session = self.sessions.get(payload.get('session_id'))
-            if not session or not session.is_active or session.expires_at < datetime.now():
+            now = datetime.now()
+            if not session or not session.is_active or session.expires_at < now:
                 return {"valid": False, "error": "Invalid or expired session"}
             
             # Update last activity
-            session.last_activity = datetime.now()
+            session.last_activity = now
             
             return {
                 "valid": True,
@@ -423,7 +585,7 @@ class AuthenticationSystem:
                 return {"success": False, "error": "Session not found"}
             
             # Invalidate session
-            session.is_active = False
+            self._deactivate_session(session)
             
             # Log logout
             self._log_security_event("logout", session.user_id, session.ip_address, "User logged out")
@@ -441,7 +603,7 @@ class AuthenticationSystem:
             if not user:
                 return False
             
-            return permission in [p.value for p in user.permissions]
+            return bool(user.perm_mask & _PERMISSION_BITS_BY_NAME.get(permission, 0))
             
         except Exception as e:
             self.logger.error(f"Permission check error: {e}")
@@ -450,9 +612,12 @@ class AuthenticationSystem:
     def get_user_sessions(self, user_id: str) -> List[Dict[str, Any]]:
         """Get all active sessions for a user"""
         try:
+            with self.lock:
+                sessions = [self.sessions[session_id] for session_id in self._sessions_by_user.get(user_id, ())]
+            
             user_sessions = []
-            for session in self.sessions.values():
-                if session.user_id == user_id and session.is_active:
+            for session in sessions:
+                if session.is_active:
                     user_sessions.append({
                         "session_id": session.session_id,
                         "created_at": session.created_at.isoformat(),
@@ -475,7 +640,7 @@ class AuthenticationSystem:
             if not session:
                 return {"success": False, "error": "Session not found"}
             
-            session.is_active = False
+            self._deactivate_session(session)
             
             # Log session revocation
             self._log_security_event("session_revoked", session.user_id, session.ip_address, "Session revoked by administrator")
@@ -487,35 +652,36 @@ class AuthenticationSystem:
             return {"success": False, "error": "Failed to revoke session"}
     
     def get_security_events(self, hours: int = 24, severity: str = None) -> List[Dict[str, Any]]:
-        """Get security events filtered by time and severity"""
+        """Get security events filtered by time and severity
+        
+        The event dicts are cached per event and shared between calls; do not mutate them.
+        """
         try:
-            cutoff_time = datetime.now() - timedelta(hours=hours)
-            events = []
-            
-            for event in self.security_events:
-                if event.timestamp >= cutoff_time:
-                    if severity is None or event.severity == severity:
-                        events.append({
-                            "event_id": event.event_id,
-                            "event_type": event.event_type,
-                            "user_id": event.user_id,
-                            "ip_address": event.ip_address,
-                            "timestamp": event.timestamp.isoformat(),
-                            "description": event.description,
-                            "severity": event.severity,
-                            "resolved": event.resolved,
-                            "resolution_notes": event.resolution_notes
-                        })
-            
-            # Sort by timestamp (newest first)
-            events.sort(key=lambda x: x['timestamp'], reverse=True)
-            
-            return events
+            return [event.to_dict() for event in self._select_security_events(hours, severity)]
             
         except Exception as e:
             self.logger.error(f"Get security events error: {e}")
             return []
     
+    def get_security_events_json(self, hours: int = 24, severity: str = None) -> bytes:
+        """Get security events as an encoded JSON array, ready to send as a response body"""
+        try:
+            return b"[" + b",".join(event.to_json() for event in self._select_security_events(hours, severity)) + b"]"
+            
+        except Exception as e:
+            self.logger.error(f"Get security events error: {e}")
+            return b"[]"
+    
+    def _select_security_events(self, hours: int, severity: Optional[str]) -> List[SecurityEvent]:
+        """Events inside the time window, newest first, optionally of one severity"""
+        cutoff_time = datetime.now() - timedelta(hours=hours)
+        
+        # Walk back from the newest event to the first one inside the window
+        with self.lock:
+            log = self.security_events if severity is None else self._events_by_severity.get(severity, ())
+            start = bisect.bisect_left(log, cutoff_time, key=_event_timestamp)
+            return list(islice(reversed(log), len(log) - start))
+    
     def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create new user"""
         try:
@@ -526,12 +692,15 @@ class AuthenticationSystem:
                     return {"success": False, "error": f"Missing required field: {field}"}
             
             # Check if username already exists
-            for user in self.users.values():
-                if user.username == user_data['username']:
-                    return {"success": False, "error": "Username already exists"}
+            if user_data['username'] in self._users_by_username:
+                return {"success": False, "error": "Username already exists"}
+            
+            password = user_data.get('password')
+            password_hash = self._hash_password(password) if password else None
             
             # Create user
-            user_id = f"user_{int(time.time())}"
+            now = datetime.now()
+            user_id = f"user_{int(now.timestamp())}"
             role = UserRole(user_data['role'])
             permissions = self.role_permissions[role].permissions
             
@@ -544,18 +713,23 @@ class AuthenticationSystem:
                 permissions=permissions,
                 auth_provider=AuthProvider.LOCAL,
                 last_login=None,
-                created_at=datetime.now(),
+                created_at=now,
                 is_active=True,
                 is_verified=False,
                 two_factor_enabled=False,
-                department=user_data.get('department', 'General'),
+                department=sys.intern(user_data.get('department', 'General')),
                 manager_id=user_data.get('manager_id'),
                 session_timeout=120,
                 allowed_ips=['*'],
-                mfa_secret=None
+                mfa_secret=None,
+                password_hash=password_hash
             )
             
-            self.users[user_id] = user
+            with self.lock:
+                # Re-check under the lock so concurrent creates cannot share a username
+                if user.username in self._users_by_username:
+                    return {"success": False, "error": "Username already exists"}
+                self._add_user(user)
             
             # Log user creation
             self._log_security_event("user_created", user_id, "system", f"User created: {user.username}")
@@ -566,40 +740,117 @@ class AuthenticationSystem:
             self.logger.error(f"Create user error: {e}")
             return {"success": False, "error": "Failed to create user"}
     
+    def _add_user(self, user: User):
+        """Register a user under both its user_id and its username"""
+        with self.lock:
+            replaced = self.users.get(user.user_id)
+            if replaced is not None:
+                self._users_by_username.pop(replaced.username, None)
+            self.users[user.user_id] = user
+            self._users_by_username[user.username] = user
+    
+    def _hash_password(self, password: str) -> bytes:
+        """Hash a password with a per-password bcrypt salt"""
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(self.bcrypt_rounds))
+    
     def _verify_password(self, password: str, user: User) -> bool:
-        """Verify password (simplified for demo)"""
-        # In production, use bcrypt or similar
-        return password == "password123"  # Simplified for demo
+        """Verify password against the user's bcrypt hash (constant-time compare)"""
+        if user.password_hash is None:
+            return False
+        return bcrypt.checkpw(password.encode('utf-8'), user.password_hash)
+    
+    def _decode_token(self, token: str) -> Dict[str, Any]:
+        """Decode a JWT, serving repeat tokens from the LRU cache until they expire"""
+        now = time.time()
+        with self.lock:
+            entry = self._token_cache.get(token)
+            if entry is not None:
+                valid_until, payload, error = entry
+                if now < valid_until:
+                    self._token_cache.move_to_end(token)
+                else:
+                    self._uncache_token(token)
+        if entry is not None:
+            if now < valid_until:
+                if error is not None:
+                    # A fresh exception per hit; re-raising one instance grows its traceback
+                    error_type, message = error
+                    raise error_type(message)
+                return payload
+            if error is None:
+                raise jwt.ExpiredSignatureError("Signature has expired")
+        
+        try:
+            payload = jwt.decode(token, self.jwt_secret, algorithms=['HS256'])
+        except jwt.InvalidTokenError as e:
+            # Cache rejections briefly so a sprayed token is not re-verified each time
+            with self.lock:
+                self._cache_token(token, (now + self.invalid_token_ttl, None, (type(e), str(e))))
+            raise
+        
+        exp = payload.get('exp')
+        if exp is not None:
+            with self.lock:
+                self._cache_token(token, (exp, payload, None))
+                session_id = payload.get('session_id')
+                if session_id is not None:
+                    self._session_tokens[session_id].add(token)
+        return payload
+    
+    def _cache_token(self, token: str, entry: Tuple[float, Optional[Dict[str, Any]], Optional[Tuple[type, str]]]):
+        """Insert a token cache entry, evicting the least recently used when full"""
+        cache = self._token_cache
+        cache[token] = entry
+        cache.move_to_end(token)
+        if len(cache) > self.token_cache_size:
+            self._uncache_token(next(iter(cache)))
+    
+    def _uncache_token(self, token: str):
+        """Remove a token from the cache and from its session's token set"""
+        _, payload, _ = self._token_cache.pop(token)
+        session_id = payload.get('session_id') if payload else None
+        tokens = self._session_tokens.get(session_id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._session_tokens[session_id]
+    
+    def _evict_session_tokens(self, session_id: str):
+        """Drop cached tokens belonging to an invalidated session"""
+        for token in self._session_tokens.pop(session_id, ()):
+            self._token_cache.pop(token, None)
     
     def _create_session(self, user: User, ip_address: str, user_agent: str) -> Session:
         """Create new session for user"""
-        session_id = hashlib.sha256(f"{user.user_id}_{time.time()}".encode()).hexdigest()
+        session_id = secrets.token_urlsafe(32)
+        now = datetime.now()
+        issued_at = int(now.timestamp())  # JWT exp is a NumericDate: seconds since the Unix epoch
         
         # Create JWT tokens
         access_payload = {
             'user_id': user.user_id,
             'username': user.username,
             'role': user.role.value,
-            'permissions': [p.value for p in user.permissions],
+            'permissions': user.permissions_claim,
             'session_id': session_id,
-            'exp': datetime.now() + timedelta(seconds=self.jwt_expiry)
+            'exp': issued_at + self.jwt_expiry
         }
         
         refresh_payload = {
             'user_id': user.user_id,
             'session_id': session_id,
-            'exp': datetime.now() + timedelta(seconds=self.refresh_expiry)
+            'exp': issued_at + self.refresh_expiry
         }
         
-        access_token = jwt.encode(access_payload, self.jwt_secret, algorithm='HS256')
-        refresh_token = jwt.encode(refresh_payload, self.jwt_secret, algorithm='HS256')
+        access_token = self._encode_token(access_payload)
+        refresh_token = self._encode_token(refresh_payload)
         
         session = Session(
             session_id=session_id,
             user_id=user.user_id,
-            created_at=datetime.now(),
-            expires_at=datetime.now() + timedelta(seconds=user.session_timeout * 60),
-            last_activity=datetime.now(),
+            created_at=now,
+            expires_at=now + timedelta(minutes=user.session_timeout),
+            last_activity=now,
             ip_address=ip_address,
             user_agent=user_agent,
             is_active=True,
@@ -608,51 +859,128 @@ class AuthenticationSystem:
             refresh_token=refresh_token
         )
         
-        self.sessions[session_id] = session
+        with self.lock:
+            # Logins also drop sessions that have already expired, keeping the table bounded
+            self._reap_expired_sessions(now)
+            self.sessions[session_id] = session
+            self._sessions_by_user[user.user_id][session_id] = None
+            heapq.heappush(self._expiry_heap, (session.expires_at, session_id))
         return session
     
+    def start_session_reaper(self):
+        """Start the background thread that drops expired sessions"""
+        if self.reaper_active:
+            self.logger.warning("Session reaper is already running")
+            return
+        
+        self.reaper_active = True
+        self._reaper_wakeup.clear()
+        self.reaper_thread = threading.Thread(target=self._reaper_loop, daemon=True)
+        self.reaper_thread.start()
+        self.logger.info("Session reaper started")
+    
+    def stop_session_reaper(self):
+        """Stop the session reaper thread"""
+        self.reaper_active = False
+        self._reaper_wakeup.set()
+        if self.reaper_thread:
+            self.reaper_thread.join(timeout=10)
+        self.logger.info("Session reaper stopped")
+    
+    def _reaper_loop(self):
+        """Sleep until the next session expiry (at most reaper_interval), then reap"""
+        while self.reaper_active:
+            try:
+                now = datetime.now()
+                with self.lock:
+                    reaped = self._reap_expired_sessions(now)
+                    next_expiry = self._expiry_heap[0][0] if self._expiry_heap else None
+                if reaped:
+                    self.logger.info(f"Reaped {reaped} expired sessions")
+                
+                delay = self.reaper_interval
+                if next_expiry is not None:
+                    delay = min(delay, max((next_expiry - now).total_seconds(), 0.0))
+                self._reaper_wakeup.wait(delay)
+                
+            except Exception as e:
+                self.logger.error(f"Session reaper error: {e}")
+                self._reaper_wakeup.wait(self.reaper_interval)
+    
+    def _reap_expired_sessions(self, now: datetime) -> int:
+        """Remove sessions whose expiry has passed; caller holds the lock"""
+        heap = self._expiry_heap
+        reaped = 0
+        while heap and heap[0][0] <= now:
+            _, session_id = heapq.heappop(heap)
+            session = self.sessions.pop(session_id, None)
+            if session is not None:
+                self._deactivate_session(session)
+                reaped += 1
+        return reaped
+    
+    def _encode_token(self, payload: Dict[str, Any]) -> str:
+        """Encode an HS256 JWT, equivalent to jwt.encode(payload, jwt_secret, algorithm='HS256')"""
+        signing_input = _HS256_HEADER + b"." + _b64url(_json_bytes(payload))
+        mac = self._jwt_hmac.copy()
+        mac.update(signing_input)
+        return (signing_input + b"." + _b64url(mac.digest())).decode("ascii")
+    
+    def _deactivate_session(self, session: Session):
+        """Mark a session inactive and drop it from the per-user and token indexes"""
+        with self.lock:
+            session.is_active = False
+            user_sessions = self._sessions_by_user.get(session.user_id)
+            if user_sessions is not None:
+                user_sessions.pop(session.session_id, None)
+                if not user_sessions:
+                    del self._sessions_by_user[session.user_id]
+            self._evict_session_tokens(session.session_id)
+    
     def _is_account_locked(self, username: str, ip_address: str) -> bool:
         """Check if account is locked due to failed attempts"""
-        failed_attempts = self.failed_attempts.get(username, [])
-        recent_attempts = [attempt for attempt in failed_attempts 
-                          if datetime.now() - attempt < timedelta(seconds=self.lockout_duration)]
-        
-        return len(recent_attempts) >= self.max_failed_attempts
+        # Locked when even the oldest of the last max_failed_attempts is inside the window
+        attempts = self.failed_attempts.get(username)
+        return (attempts is not None and len(attempts) == attempts.maxlen
+                and time.monotonic() - attempts[0] < self.lockout_duration)
     
     def _record_failed_attempt(self, username: str, ip_address: str):
         """Record failed login attempt"""
-        self.failed_attempts[username].append(datetime.now())
+        with self.lock:
+            self.failed_attempts[username].append(time.monotonic())
     
     def _is_ip_allowed(self, ip_address: str, user: User) -> bool:
         """Check if IP address is allowed for user"""
-        if "*" in user.allowed_ips:
-            return True
-        
-        for allowed_ip in user.allowed_ips:
-            if allowed_ip.endswith("*"):
-                if ip_address.startswith(allowed_ip[:-1]):
-                    return True
-            elif ip_address == allowed_ip:
-                return True
-        
-        return False
+        return user.ip_matcher.matches(ip_address)
     
     def _log_security_event(self, event_type: str, user_id: Optional[str], ip_address: str, description: str):
         """Log security event"""
-        event = SecurityEvent(
-            event_id=f"sec_{int(time.time())}",
-            event_type=event_type,
-            user_id=user_id,
-            ip_address=ip_address,
-            timestamp=datetime.now(),
-            description=description,
-            severity="medium",  # Default severity
-            resolved=False,
-            resolution_notes=None
-        )
-        
-        self.security_events.append(event)
+        # Timestamp under the lock so concurrent events are appended in time order
+        with self.lock:
+            now = datetime.now()
+            event = SecurityEvent(
+                event_id=f"sec_{int(now.timestamp())}",
+                event_type=sys.intern(event_type),
+                user_id=user_id,
+                ip_address=ip_address,
+                timestamp=now,
+                description=description,
+                severity="medium",  # Default severity
+                resolved=False,
+                resolution_notes=None
+            )
+            self._append_security_event(event)
         self.logger.info(f"Security event: {event_type} - {description}")
+    
+    def _append_security_event(self, event: SecurityEvent):
+        """Append to the security log and its severity view, evicting the oldest when full"""
+        with self.lock:
+            log = self.security_events
+            if len(log) == log.maxlen:
+                evicted = log[0]
+                self._events_by_severity[evicted.severity].popleft()
+            log.append(event)
+            self._events_by_severity[event.severity].append(event)
 
 # Global authentication system instance
 authentication_system = AuthenticationSystem()
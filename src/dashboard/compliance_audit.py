@@ -9,14 +9,34 @@ import sys
 import time
 import json
 import logging
+import queue
+import random
 import threading
-import hashlib
 import uuid
+import numpy as np
+from bisect import bisect_left
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
-from collections import defaultdict, deque
+from dataclasses import dataclass, field, fields, is_dataclass, replace
+from collections import Counter, OrderedDict, defaultdict, deque
 from enum import Enum
+try:
+    import msgpack
+except ImportError:
+    # Fallback for environments without msgpack
+    msgpack = None
+try:
+    import orjson
+except ImportError:
+    # Fallback for environments without orjson
+    orjson = None
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    # Fallback for environments without pyarrow
+    pa = None
+    pq = None
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -45,7 +65,15 @@ class AuditEventType(Enum):
     POLICY_VIOLATION = "policy_violation"
     INCIDENT_REPORT = "incident_report"
 
-@dataclass
+class PackedDetails(bytes):
+    """MessagePack-encoded AuditLogEntry.details, distinct from any other bytes value"""
+    __slots__ = ()
+
+    def unpack(self) -> Dict[str, Any]:
+        # Details keys are free-form, so non-str keys must round-trip too
+        return msgpack.unpackb(self, strict_map_key=False)
+
+@dataclass(slots=True)
 class AuditLogEntry:
     """Audit log entry structure"""
     timestamp: datetime
@@ -59,10 +87,16 @@ class AuditLogEntry:
     outcome: str  # success, failure, warning
     risk_level: RiskLevel
     compliance_impact: str
-    details: Dict[str, Any]
+    details: Dict[str, Any]  # PackedDetails once compacted
     correlation_id: str
 
-@dataclass
+    def expanded_details(self) -> Dict[str, Any]:
+        """details as a dict, unpacking it if it has been compacted"""
+        if isinstance(self.details, PackedDetails):
+            return self.details.unpack()
+        return self.details
+
+@dataclass(slots=True)
 class ComplianceCheck:
     """Compliance check data structure"""
     check_id: str
@@ -80,8 +114,13 @@ class ComplianceCheck:
     remediation_steps: List[str]
     assigned_to: str
     due_date: Optional[datetime]
+    audit_path: str = field(init=False, repr=False, compare=False)
 
-@dataclass
+    def __post_init__(self):
+        # Built once, reused by every monitoring tick's audit entry
+        self.audit_path = f"/compliance/check/{self.check_id}"
+
+@dataclass(slots=True)
 class PolicyViolation:
     """Policy violation data structure"""
     violation_id: str
@@ -98,7 +137,7 @@ class PolicyViolation:
     assigned_to: str
     resolution_notes: str
 
-@dataclass
+@dataclass(slots=True)
 class SecurityIncident:
     """Security incident data structure"""
     incident_id: str
@@ -116,17 +155,257 @@ class SecurityIncident:
     lessons_learned: str
     prevention_measures: List[str]
 
+AUDIT_LOG_CAPACITY = 10000  # Last 10,000 audit entries
+# Directory for Parquet archives of entries evicted from the ring; unset disables archiving
+AUDIT_ARCHIVE_DIR = os.getenv("HELM_AI_AUDIT_ARCHIVE_DIR")
+ARCHIVE_BATCH_SIZE = 1000  # Evicted entries per Parquet file
+ARCHIVE_RETRY_DELAY = 30  # Seconds before a failed archive batch is retried
+RECORD_STORE_CAPACITY = 10000  # Policy violations / security incidents kept
+RECORD_RETENTION = timedelta(days=90)  # Older violations / incidents are dropped
+DETAILS_COMPACT_AGE = 300  # Seconds before an entry's details are packed to PackedDetails
+FAILED_LOGIN_CAPACITY = 1024  # Recent failed logins kept for brute-force detection
+BRUTE_FORCE_WINDOW = 3600  # Seconds of failed logins considered for brute force
+BRUTE_FORCE_THRESHOLD = 5  # Failed logins per user within the window before an incident
+
+# Enum members in code order for the int8 audit and compliance columns
+EVENT_TYPES = tuple(AuditEventType)
+RISK_LEVELS = tuple(RiskLevel)
+COMPLIANCE_STATUSES = tuple(ComplianceStatus)
+_EVENT_CODE = {event_type: code for code, event_type in enumerate(EVENT_TYPES)}
+_RISK_CODE = {risk_level: code for code, risk_level in enumerate(RISK_LEVELS)}
+_STATUS_CODE = {status: code for code, status in enumerate(COMPLIANCE_STATUSES)}
+# Compliance score -> risk level: (.., 60] high, (60, 80] medium, (80, ..) low
+RISK_SCORE_THRESHOLDS = (60, 80)
+_RISK_BY_SCORE_BUCKET = (RiskLevel.HIGH, RiskLevel.MEDIUM, RiskLevel.LOW)
+
+# Code -> name, so summaries never go through Enum.value per entry
+EVENT_TYPE_NAMES = tuple(event_type.value for event_type in EVENT_TYPES)
+RISK_LEVEL_NAMES = tuple(risk_level.value for risk_level in RISK_LEVELS)
+
+def _json_default(obj: Any) -> Any:
+    """Encode the values the JSON encoders do not handle natively"""
+    if isinstance(obj, PackedDetails):
+        return obj.unpack()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _json_bytes(payload: Any) -> bytes:
+    """Compact JSON encoding of audit records, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_json_default)
+    return json.dumps(payload, default=_json_default, separators=(",", ":")).encode("utf-8")
+
+class _IdPool:
+    """Hands out 64-bit random hex ids sliced from a batched urandom buffer"""
+    __slots__ = ('buf', 'off', 'lock')
+
+    POOL_BYTES = 4096
+    ID_BYTES = 8
+
+    def __init__(self):
+        self._reseed()
+        if hasattr(os, 'register_at_fork'):
+            # A forked worker must not replay the parent's remaining ids
+            os.register_at_fork(after_in_child=self._reseed)
+
+    def _reseed(self):
+        self.buf = os.urandom(self.POOL_BYTES)
+        self.off = 0
+        self.lock = threading.Lock()
+
+    def next_id(self) -> str:
+        with self.lock:
+            if self.off == self.POOL_BYTES:
+                self.buf = os.urandom(self.POOL_BYTES)
+                self.off = 0
+            buf, off = self.buf, self.off
+            self.off = off + self.ID_BYTES
+        return buf[off:off + self.ID_BYTES].hex()
+
+# Correlation and request ids only need to be unique, not UUID-formatted
+_correlation_ids = _IdPool()
+
+class BoundedRecordStore(OrderedDict):
+    """Insertion-ordered record dict capped at maxsize, expiring records by detected_at"""
+
+    def __init__(self, maxsize: int, ttl: timedelta):
+        super().__init__()
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+    def expire(self, now: datetime) -> int:
+        """Drop records detected more than ttl before now; returns how many were dropped"""
+        cutoff = now - self.ttl
+        stale = [key for key, record in self.items() if record.detected_at < cutoff]
+        for key in stale:
+            del self[key]
+        return len(stale)
+
+class AuditRingBuffer:
+    """Fixed-capacity, lock-protected ring of audit entries in timestamp order
+
+    Alongside the full entries, the fields the summaries aggregate are kept in
+    parallel columns so windows can be reduced without touching the rows.
+    """
+    __slots__ = ('buf', 'times', 'event_codes', 'outcome_codes', 'risk_codes',
+                 'user_ids', 'outcome_names', '_outcome_lookup', 'idx', 'compacted', 'evicted', 'lock')
+
+    def __init__(self, capacity: int, keep_evicted: bool = False):
+        self.buf = [None] * capacity
+        # Epoch seconds, kept non-decreasing (see _write) for the window searches
+        self.times = np.zeros(capacity, dtype=np.float64)
+        self.event_codes = np.zeros(capacity, dtype=np.int8)
+        self.outcome_codes = np.zeros(capacity, dtype=np.int16)
+        self.risk_codes = np.zeros(capacity, dtype=np.int8)
+        self.user_ids = [None] * capacity
+        self.outcome_names = []  # Outcomes are free-form, so they are interned as seen
+        self._outcome_lookup = {}
+        self.idx = 0  # Total entries ever written
+        self.compacted = 0  # Entries before this index have been handed out for compaction
+        self.evicted = [] if keep_evicted else None  # Overwritten entries awaiting archive
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return min(self.idx, len(self.buf))
+
+    def append(self, entry: AuditLogEntry):
+        """Append an entry, overwriting the oldest once the ring is full"""
+        with self.lock:
+            self._write(entry)
+
+    def extend(self, entries: List[AuditLogEntry]):
+        """Append several entries under a single lock acquisition"""
+        with self.lock:
+            for entry in entries:
+                self._write(entry)
+
+    def _write(self, entry: AuditLogEntry):
+        """Write an entry into the next slot; caller holds the lock"""
+        outcome = self._outcome_lookup.get(entry.outcome)
+        if outcome is None:
+            outcome = self._outcome_lookup[entry.outcome] = len(self.outcome_names)
+            self.outcome_names.append(entry.outcome)
+        slot = self.idx % len(self.buf)
+        if self.evicted is not None and self.idx >= len(self.buf):
+            self.evicted.append(self.buf[slot])
+        self.buf[slot] = entry
+        # Entries can arrive slightly out of order (batches stamped at tick start,
+        # wall-clock steps back); clamp so the column stays sorted for searchsorted
+        ts = entry.timestamp.timestamp()
+        if self.idx:
+            ts = max(ts, self.times[(self.idx - 1) % len(self.buf)])
+        self.times[slot] = ts
+        self.event_codes[slot] = _EVENT_CODE[entry.event_type]
+        self.outcome_codes[slot] = outcome
+        self.risk_codes[slot] = _RISK_CODE[entry.risk_level]
+        self.user_ids[slot] = entry.user_id
+        self.idx += 1
+
+    def take_evicted(self) -> List[AuditLogEntry]:
+        """Entries overwritten since the last call, oldest first"""
+        with self.lock:
+            evicted, self.evicted = self.evicted, []
+            return evicted
+
+    def take_uncompacted_before(self, cutoff_ts: float) -> List[Tuple[int, AuditLogEntry]]:
+        """(position, entry) older than cutoff not yet handed out, advancing the compaction cursor"""
+        capacity = len(self.buf)
+        with self.lock:
+            position = max(self.compacted, self.idx - capacity)
+            entries = []
+            while position < self.idx and self.times[position % capacity] < cutoff_ts:
+                entries.append((position, self.buf[position % capacity]))
+                position += 1
+            self.compacted = position
+            return entries
+
+    def store_compacted(self, replacements: List[Tuple[int, AuditLogEntry, AuditLogEntry]]):
+        """Swap in compacted copies of entries still held at their positions
+
+        Entries are replaced rather than mutated, so readers holding the
+        original entry keep seeing a details dict.
+        """
+        capacity = len(self.buf)
+        with self.lock:
+            oldest = self.idx - capacity
+            for position, entry, compacted in replacements:
+                if position >= oldest and self.buf[position % capacity] is entry:
+                    self.buf[position % capacity] = compacted
+
+    def _runs_since(self, cutoff_ts: float) -> List[Tuple[int, int]]:
+        """Physical slot ranges, oldest first, holding entries at or after cutoff"""
+        capacity = len(self.buf)
+        tail = self.idx % capacity
+        if self.idx < capacity:
+            runs = [(0, self.idx)]
+        else:
+            runs = [(tail, capacity), (0, tail)]
+        for i, (lo, hi) in enumerate(runs):
+            if hi > lo and self.times[hi - 1] >= cutoff_ts:
+                lo += int(np.searchsorted(self.times[lo:hi], cutoff_ts, side='left'))
+                return [(lo, hi)] + runs[i + 1:]
+        return []
+
+    def snapshot_since(self, cutoff: datetime) -> List[AuditLogEntry]:
+        """Copy of the entries at or after cutoff, oldest first"""
+        with self.lock:
+            entries = []
+            for lo, hi in self._runs_since(cutoff.timestamp()):
+                entries += self.buf[lo:hi]
+            return entries
+
+    def columns_since(self, cutoff: datetime) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """Copies of the event, outcome and risk code columns and user ids at or after cutoff"""
+        with self.lock:
+            runs = self._runs_since(cutoff.timestamp())
+            if not runs:
+                empty = np.zeros(0, dtype=np.int8)
+                return empty, np.zeros(0, dtype=np.int16), empty, []
+            user_ids = []
+            for lo, hi in runs:
+                user_ids += self.user_ids[lo:hi]
+            return (np.concatenate([self.event_codes[lo:hi] for lo, hi in runs]),
+                    np.concatenate([self.outcome_codes[lo:hi] for lo, hi in runs]),
+                    np.concatenate([self.risk_codes[lo:hi] for lo, hi in runs]),
+                    user_ids)
+
 class ComplianceAuditSystem:
     """Compliance & Audit Management System"""
     
     def __init__(self):
         self.logger = logging.getLogger("compliance_audit_system")
-        self.audit_logs = deque(maxlen=10000)  # Last 10,000 audit entries
+        self.archive_dir = AUDIT_ARCHIVE_DIR if pq is not None else None
+        if AUDIT_ARCHIVE_DIR and pq is None:
+            self.logger.warning("pyarrow is not installed; audit log archiving is disabled")
+        # Evicted batches go to one background writer; file names come from _archive_seq
+        self._archive_queue = queue.Queue()
+        self._archive_lock = threading.Lock()
+        self._archive_seq = 0
+        self._archive_thread = None
+        self._archive_stop = threading.Event()
+        self.audit_logs = AuditRingBuffer(AUDIT_LOG_CAPACITY, keep_evicted=bool(self.archive_dir))
+        self._failed_logins = deque(maxlen=FAILED_LOGIN_CAPACITY)  # (epoch seconds, user_id)
         self.compliance_checks = {}
-        self.policy_violations = {}
-        self.security_incidents = {}
+        # Per-check columns, row order follows compliance_checks insertion order
+        self._check_rows = {}
+        self._check_status = np.zeros(0, dtype=np.int8)
+        self._check_risk = np.zeros(0, dtype=np.int8)
+        self._check_scores = np.zeros(0, dtype=np.float64)
+        self.policy_violations = BoundedRecordStore(RECORD_STORE_CAPACITY, RECORD_RETENTION)
+        self.security_incidents = BoundedRecordStore(RECORD_STORE_CAPACITY, RECORD_RETENTION)
         self.monitoring_active = False
         self.monitoring_thread = None
+        self._stop_event = threading.Event()
         self.check_interval = 300  # 5 minutes
         
         # Compliance frameworks configuration
@@ -179,71 +458,101 @@ class ComplianceAuditSystem:
     
     def _initialize_sample_data(self):
         """Initialize with sample compliance and audit data"""
-        import random
+        rng = np.random.default_rng()
+        now = datetime.now()
         
-        # Generate sample audit logs
-        event_types = list(AuditEventType)
-        risk_levels = list(RiskLevel)
+        # Generate sample audit logs, drawing each field for all entries at once
         outcomes = ["success", "failure", "warning"]
+        resources = ['ai-performance', 'system-health', 'financial', 'analytics']
+        methods = ["GET", "POST", "PUT", "DELETE"]
+        impacts = ["none", "low", "medium", "high"]
+        sample_count = 100
         
-        for i in range(100):
-            timestamp = datetime.now() - timedelta(hours=random.randint(1, 168))  # Last week
-            event_type = random.choice(event_types)
-            risk_level = random.choice(risk_levels)
-            outcome = random.choice(outcomes)
-            
+        # Oldest first, so the ring stays in timestamp order
+        hours = np.sort(rng.integers(1, 169, size=sample_count))[::-1]  # Last week
+        columns = zip(
+            hours.tolist(),
+            rng.integers(0, len(EVENT_TYPES), size=sample_count).tolist(),
+            rng.integers(0, len(RISK_LEVELS), size=sample_count).tolist(),
+            rng.integers(0, len(outcomes), size=sample_count).tolist(),
+            rng.integers(1, 51, size=sample_count).tolist(),
+            rng.integers(1, 255, size=sample_count).tolist(),
+            rng.integers(0, len(resources), size=sample_count).tolist(),
+            rng.integers(0, len(methods), size=sample_count).tolist(),
+            rng.integers(0, len(impacts), size=sample_count).tolist(),
+            rng.uniform(100, 2000, size=sample_count).tolist(),
+            rng.integers(1, 1001, size=sample_count).tolist()
+        )
+        
+        sample_entries = []
+        for hour, event, risk, outcome, user, host, resource, method, impact, response_time, data_volume in columns:
             audit_entry = AuditLogEntry(
-                timestamp=timestamp,
-                event_type=event_type,
-                user_id=f"user_{random.randint(1, 50)}",
-                session_id=str(uuid.uuid4()),
-                ip_address=f"192.168.1.{random.randint(1, 254)}",
+                timestamp=now - timedelta(hours=hour),
+                event_type=EVENT_TYPES[event],
+                user_id=f"user_{user}",
+                session_id=uuid.uuid4().hex,
+                ip_address=f"192.168.1.{host}",
                 user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
-                resource_accessed=f"/api/v1/{random.choice(['ai-performance', 'system-health', 'financial', 'analytics'])}",
-                action_performed=random.choice(["GET", "POST", "PUT", "DELETE"]),
-                outcome=outcome,
-                risk_level=risk_level,
-                compliance_impact=random.choice(["none", "low", "medium", "high"]),
+                resource_accessed=f"/api/v1/{resources[resource]}",
+                action_performed=methods[method],
+                outcome=outcomes[outcome],
+                risk_level=RISK_LEVELS[risk],
+                compliance_impact=impacts[impact],
                 details={
-                    "request_id": str(uuid.uuid4()),
-                    "response_time": random.uniform(100, 2000),
-                    "data_volume": random.randint(1, 1000)
+                    "request_id": _correlation_ids.next_id(),
+                    "response_time": response_time,
+                    "data_volume": data_volume
                 },
-                correlation_id=str(uuid.uuid4())
+                correlation_id=_correlation_ids.next_id()
             )
             
-            self.audit_logs.append(audit_entry)
+            sample_entries.append(audit_entry)
+        
+        self._record_audit_entries(sample_entries)
         
         # Generate sample compliance checks
         categories = ["security", "privacy", "operational", "regulatory"]
-        statuses = list(ComplianceStatus)
         
         for framework, config in self.compliance_frameworks.items():
-            for requirement in config["requirements"]:
+            requirements = config["requirements"]
+            count = len(requirements)
+            statuses = rng.integers(0, len(COMPLIANCE_STATUSES), size=count)
+            scores = np.where(statuses == _STATUS_CODE[ComplianceStatus.COMPLIANT],
+                              rng.uniform(60, 100, size=count), rng.uniform(0, 60, size=count))
+            risk_buckets = np.searchsorted(RISK_SCORE_THRESHOLDS, scores, side='left').tolist()
+            statuses, scores = statuses.tolist(), scores.tolist()
+            category_codes = rng.integers(0, len(categories), size=count).tolist()
+            checked_days = rng.integers(1, 31, size=count).tolist()
+            next_days = rng.integers(1, 91, size=count).tolist()
+            due_days = rng.integers(1, 91, size=count).tolist()
+            officers = rng.integers(1, 6, size=count).tolist()
+            
+            for i, requirement in enumerate(requirements):
                 check_id = f"{framework}_{requirement}"
-                status = random.choice(statuses)
-                score = random.uniform(60, 100) if status == ComplianceStatus.COMPLIANT else random.uniform(0, 60)
+                status = COMPLIANCE_STATUSES[statuses[i]]
                 
                 compliance_check = ComplianceCheck(
                     check_id=check_id,
                     name=f"{framework} - {requirement.replace('_', ' ').title()}",
-                    category=random.choice(categories),
+                    category=categories[category_codes[i]],
                     description=f"Compliance check for {requirement} under {framework}",
                     status=status,
-                    last_checked=datetime.now() - timedelta(days=random.randint(1, 30)),
-                    next_check=datetime.now() + timedelta(days=random.randint(1, 90)),
-                    score=score,
-                    risk_level=RiskLevel.LOW if score > 80 else RiskLevel.MEDIUM if score > 60 else RiskLevel.HIGH,
-                    requirements_met=random.sample(config["requirements"], random.randint(1, 3)),
-                    requirements_failed=random.sample(config["requirements"], random.randint(0, 2)),
-                    evidence=[f"evidence_{i}" for i in range(random.randint(1, 5))],
-                    remediation_steps=[f"step_{i}" for i in range(random.randint(1, 3))],
-                    assigned_to=f"compliance_officer_{random.randint(1, 5)}",
-                    due_date=datetime.now() + timedelta(days=random.randint(1, 90)) if status != ComplianceStatus.COMPLIANT else None
+                    last_checked=now - timedelta(days=checked_days[i]),
+                    next_check=now + timedelta(days=next_days[i]),
+                    score=scores[i],
+                    risk_level=_RISK_BY_SCORE_BUCKET[risk_buckets[i]],
+                    requirements_met=random.sample(requirements, random.randint(1, 3)),
+                    requirements_failed=random.sample(requirements, random.randint(0, 2)),
+                    evidence=[f"evidence_{j}" for j in range(random.randint(1, 5))],
+                    remediation_steps=[f"step_{j}" for j in range(random.randint(1, 3))],
+                    assigned_to=f"compliance_officer_{officers[i]}",
+                    due_date=now + timedelta(days=due_days[i]) if status != ComplianceStatus.COMPLIANT else None
                 )
                 
                 self.compliance_checks[check_id] = compliance_check
         
+        self._index_compliance_checks()
+        
         # Generate sample policy violations
         policies = [
             "Data Access Policy",
@@ -261,13 +570,13 @@ class ComplianceAuditSystem:
                 violation_id=violation_id,
                 policy_name=policy,
                 policy_category=random.choice(["security", "privacy", "operational"]),
-                severity=random.choice(list(RiskLevel)),
-                detected_at=datetime.now() - timedelta(days=random.randint(1, 60)),
+                severity=random.choice(RISK_LEVELS),
+                detected_at=now - timedelta(days=random.randint(1, 60)),
                 user_id=f"user_{random.randint(1, 50)}",
                 description=f"Violation of {policy} detected",
                 impact_assessment=random.choice(["low", "medium", "high", "critical"]),
                 remediation_required=random.choice([True, False]),
-                remediation_due=datetime.now() + timedelta(days=random.randint(1, 30)) if random.choice([True, False]) else None,
+                remediation_due=now + timedelta(days=random.randint(1, 30)) if random.choice([True, False]) else None,
                 status=random.choice(["open", "in_progress", "resolved", "false_positive"]),
                 assigned_to=f"security_analyst_{random.randint(1, 5)}",
                 resolution_notes=random.choice(["", "Resolved by updating configuration", "False positive - no action needed"])
@@ -292,8 +601,8 @@ class ComplianceAuditSystem:
             incident = SecurityIncident(
                 incident_id=incident_id,
                 incident_type=incident_type,
-                severity=random.choice(list(RiskLevel)),
-                detected_at=datetime.now() - timedelta(days=random.randint(1, 90)),
+                severity=random.choice(RISK_LEVELS),
+                detected_at=now - timedelta(days=random.randint(1, 90)),
                 reported_by=f"user_{random.randint(1, 50)}",
                 description=f"{incident_type} detected and reported",
                 affected_systems=random.sample(["AI System", "Database", "API Gateway", "Web Server"], random.randint(1, 3)),
@@ -310,6 +619,121 @@ class ComplianceAuditSystem:
         
         self.logger.info(f"Initialized compliance audit system with {len(self.audit_logs)} audit logs, {len(self.compliance_checks)} compliance checks, {len(self.policy_violations)} policy violations, and {len(self.security_incidents)} security incidents")
     
+    def _index_compliance_checks(self):
+        """Rebuild the per-check status, risk and score columns"""
+        count = len(self.compliance_checks)
+        self._check_rows = {check_id: row for row, check_id in enumerate(self.compliance_checks)}
+        self._check_status = np.zeros(count, dtype=np.int8)
+        self._check_risk = np.zeros(count, dtype=np.int8)
+        self._check_scores = np.zeros(count, dtype=np.float64)
+        for check in self.compliance_checks.values():
+            self._record_check(check)
+    
+    def _record_check(self, check: ComplianceCheck):
+        """Mirror a check's status, risk level and score into its column row"""
+        row = self._check_rows[check.check_id]
+        self._check_status[row] = _STATUS_CODE[check.status]
+        self._check_risk[row] = _RISK_CODE[check.risk_level]
+        self._check_scores[row] = check.score
+    
+    def _record_audit_entry(self, entry: AuditLogEntry):
+        """Append an entry to the audit ring and index failed logins"""
+        self.audit_logs.append(entry)
+        if entry.event_type is AuditEventType.USER_LOGIN and entry.outcome == "failure":
+            self._failed_logins.append((entry.timestamp.timestamp(), entry.user_id))
+        if self.archive_dir and len(self.audit_logs.evicted) >= ARCHIVE_BATCH_SIZE:
+            self._archive_evicted_entries()
+    
+    def _record_audit_entries(self, entries: List[AuditLogEntry]):
+        """Batched _record_audit_entry: one ring lock acquisition for all entries"""
+        self.audit_logs.extend(entries)
+        for entry in entries:
+            if entry.event_type is AuditEventType.USER_LOGIN and entry.outcome == "failure":
+                self._failed_logins.append((entry.timestamp.timestamp(), entry.user_id))
+        if self.archive_dir and len(self.audit_logs.evicted) >= ARCHIVE_BATCH_SIZE:
+            self._archive_evicted_entries()
+    
+    def _archive_evicted_entries(self):
+        """Hand entries evicted from the audit ring to the background archive writer"""
+        entries = self.audit_logs.take_evicted()
+        if not entries:
+            return
+        
+        with self._archive_lock:
+            seq = self._archive_seq
+            self._archive_seq += 1
+            if self._archive_thread is None or not self._archive_thread.is_alive():
+                self._archive_stop.clear()
+                self._archive_thread = threading.Thread(target=self._archive_writer, daemon=True)
+                self._archive_thread.start()
+            self._archive_queue.put((seq, entries))
+    
+    def _archive_writer(self):
+        """Write queued batches in order, requeueing a batch whose write failed"""
+        while True:
+            batch = self._archive_queue.get()
+            if batch is None:
+                break
+            if not self._write_archive(*batch):
+                self._archive_queue.put(batch)
+                self._archive_stop.wait(ARCHIVE_RETRY_DELAY)
+        
+        # Batches requeued behind the shutdown sentinel get one last attempt
+        while True:
+            try:
+                batch = self._archive_queue.get_nowait()
+            except queue.Empty:
+                return
+            if batch is not None and not self._write_archive(*batch):
+                self.logger.error(f"Dropping {len(batch[1])} audit entries that could not be archived")
+    
+    def _stop_archive_writer(self):
+        """Flush pending evictions and wait for the archive writer to drain"""
+        self._archive_evicted_entries()
+        with self._archive_lock:
+            thread = self._archive_thread
+            if thread is None or not thread.is_alive():
+                return
+            self._archive_stop.set()
+            self._archive_queue.put(None)
+        thread.join(timeout=10)
+    
+    def _write_archive(self, seq: int, entries: List[AuditLogEntry]) -> bool:
+        """Write one batch of evicted entries to a Snappy-compressed Parquet file"""
+        def column(name: str) -> List[Any]:
+            return [getattr(entry, name) for entry in entries]
+        
+        try:
+            table = pa.table({
+                "timestamp": pa.array(column("timestamp"), type=pa.timestamp("ms")),
+                "event_type": pa.DictionaryArray.from_arrays(
+                    pa.array([_EVENT_CODE[entry.event_type] for entry in entries], type=pa.int8()),
+                    pa.array(EVENT_TYPE_NAMES)),
+                "user_id": pa.array(column("user_id")).dictionary_encode(),
+                "session_id": pa.array(column("session_id")),
+                "ip_address": pa.array(column("ip_address")).dictionary_encode(),
+                "user_agent": pa.array(column("user_agent")).dictionary_encode(),
+                "resource_accessed": pa.array(column("resource_accessed")).dictionary_encode(),
+                "action_performed": pa.array(column("action_performed")).dictionary_encode(),
+                "outcome": pa.array(column("outcome")).dictionary_encode(),
+                "risk_level": pa.DictionaryArray.from_arrays(
+                    pa.array([_RISK_CODE[entry.risk_level] for entry in entries], type=pa.int8()),
+                    pa.array(RISK_LEVEL_NAMES)),
+                "compliance_impact": pa.array(column("compliance_impact")).dictionary_encode(),
+                "correlation_id": pa.array(column("correlation_id")),
+                "details_json": pa.array([_json_bytes(entry.details) for entry in entries], type=pa.binary())
+            })
+            os.makedirs(self.archive_dir, exist_ok=True)
+            path = os.path.join(
+                self.archive_dir,
+                f"audit_{entries[0].timestamp:%Y%m%dT%H%M%S}_{seq:06d}.parquet")
+            pq.write_table(table, path, compression="snappy")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error archiving {len(entries)} audit entries: {e}")
+            return False
+    
     def start_monitoring(self):
         """Start compliance monitoring"""
         if self.monitoring_active:
@@ -317,6 +741,7 @@ class ComplianceAuditSystem:
             return
         
         self.monitoring_active = True
+        self._stop_event.clear()
         self.monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
         self.monitoring_thread.start()
         self.logger.info("Compliance monitoring started")
@@ -324,37 +749,56 @@ class ComplianceAuditSystem:
     def stop_monitoring(self):
         """Stop compliance monitoring"""
         self.monitoring_active = False
+        self._stop_event.set()
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=10)
+        if self.archive_dir:
+            self._stop_archive_writer()
         self.logger.info("Compliance monitoring stopped")
     
     def _monitoring_loop(self):
-        """Main monitoring loop"""
+        """Main monitoring loop, run every check_interval on a fixed monotonic schedule"""
+        deadline = time.monotonic()
         while self.monitoring_active:
             try:
+                # One clock read per tick, shared by every pass
+                now = datetime.now()
+                
                 # Perform compliance checks
-                self._perform_compliance_checks()
+                self._perform_compliance_checks(now)
                 
                 # Analyze audit logs for anomalies
-                self._analyze_audit_anomalies()
+                self._analyze_audit_anomalies(now)
                 
                 # Check for policy violations
-                self._check_policy_violations()
+                self._check_policy_violations(now)
                 
-                time.sleep(self.check_interval)
+                # Pack details of entries past the anomaly window
+                self._compact_audit_details(now)
+                
+                # Drop violations and incidents past retention
+                self.policy_violations.expire(now)
+                self.security_incidents.expire(now)
+                
+                # Schedule from the previous deadline so work time does not add drift,
+                # but never in the past, so an overrun tick does not trigger a burst
+                deadline = max(deadline + self.check_interval, time.monotonic())
+                if self._stop_event.wait(max(0.0, deadline - time.monotonic())):
+                    break
                 
             except Exception as e:
                 self.logger.error(f"Error in compliance monitoring loop: {e}")
-                time.sleep(60)  # Wait 1 minute before retrying
+                if self._stop_event.wait(60):  # Wait 1 minute before retrying
+                    break
+                deadline = time.monotonic()
     
-    def _perform_compliance_checks(self):
+    def _perform_compliance_checks(self, now: datetime):
         """Perform automated compliance checks"""
+        new_entries = []
         for check_id, check in self.compliance_checks.items():
             # Simulate compliance check
-            import random
-            
             # Update last checked time
-            check.last_checked = datetime.now()
+            check.last_checked = now
             
             # Simulate check results
             if random.random() > 0.9:  # 10% chance of status change
@@ -369,22 +813,19 @@ class ComplianceAuditSystem:
                     check.score = random.uniform(85, 100)
                 
                 # Update risk level based on score
-                if check.score > 80:
-                    check.risk_level = RiskLevel.LOW
-                elif check.score > 60:
-                    check.risk_level = RiskLevel.MEDIUM
-                else:
-                    check.risk_level = RiskLevel.HIGH
+                check.risk_level = _RISK_BY_SCORE_BUCKET[bisect_left(RISK_SCORE_THRESHOLDS, check.score)]
+                
+                self._record_check(check)
             
             # Log compliance check
             audit_entry = AuditLogEntry(
-                timestamp=datetime.now(),
+                timestamp=now,
                 event_type=AuditEventType.COMPLIANCE_CHECK,
                 user_id="system",
                 session_id="system",
                 ip_address="127.0.0.1",
                 user_agent="Compliance Monitor",
-                resource_accessed=f"/compliance/check/{check_id}",
+                resource_accessed=check.audit_path,
                 action_performed="COMPLIANCE_CHECK",
                 outcome="success" if check.status == ComplianceStatus.COMPLIANT else "warning",
                 risk_level=check.risk_level,
@@ -395,43 +836,42 @@ class ComplianceAuditSystem:
                     "score": check.score,
                     "status": check.status.value
                 },
-                correlation_id=str(uuid.uuid4())
+                correlation_id=_correlation_ids.next_id()
             )
             
-            self.audit_logs.append(audit_entry)
+            new_entries.append(audit_entry)
+        
+        self._record_audit_entries(new_entries)
     
-    def _analyze_audit_anomalies(self):
+    def _analyze_audit_anomalies(self, now: datetime):
         """Analyze audit logs for anomalies"""
-        if len(self.audit_logs) < 10:
+        failed_logins = self._failed_logins
+        if not failed_logins or len(self.audit_logs) < 10:
             return
         
-        # Get recent logs (last hour)
-        recent_logs = [
-            log for log in self.audit_logs
-            if datetime.now() - log.timestamp < timedelta(hours=1)
-        ]
+        # Drop failed logins older than the window, then count the rest per user
+        cutoff = now.timestamp() - BRUTE_FORCE_WINDOW
+        while failed_logins and failed_logins[0][0] < cutoff:
+            failed_logins.popleft()
         
-        # Check for failed login attempts
-        failed_logins = [
-            log for log in recent_logs
-            if log.event_type == AuditEventType.USER_LOGIN and log.outcome == "failure"
-        ]
+        # No user can pass the threshold without more failures than it in total
+        if len(failed_logins) <= BRUTE_FORCE_THRESHOLD:
+            return
         
         # Detect brute force attempts
-        user_failed_attempts = defaultdict(int)
-        for log in failed_logins:
-            user_failed_attempts[log.user_id] += 1
+        user_failed_attempts = Counter(user_id for _, user_id in tuple(failed_logins))
         
+        new_entries = []
         for user_id, count in user_failed_attempts.items():
-            if count > 5:  # More than 5 failed attempts in an hour
+            if count > BRUTE_FORCE_THRESHOLD:  # More than 5 failed attempts in an hour
                 # Create security incident
-                incident_id = f"brute_force_{user_id}_{int(time.time())}"
+                incident_id = f"brute_force_{user_id}_{int(now.timestamp())}"
                 
                 incident = SecurityIncident(
                     incident_id=incident_id,
                     incident_type="Brute Force Attack",
                     severity=RiskLevel.HIGH if count > 10 else RiskLevel.MEDIUM,
-                    detected_at=datetime.now(),
+                    detected_at=now,
                     reported_by="system",
                     description=f"Multiple failed login attempts detected for user {user_id}",
                     affected_systems=["Authentication System"],
@@ -448,7 +888,7 @@ class ComplianceAuditSystem:
                 
                 # Log the detection
                 audit_entry = AuditLogEntry(
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     event_type=AuditEventType.SECURITY_EVENT,
                     user_id="system",
                     session_id="system",
@@ -465,18 +905,19 @@ class ComplianceAuditSystem:
                         "target_user": user_id,
                         "failed_attempts": count
                     },
-                    correlation_id=str(uuid.uuid4())
+                    correlation_id=_correlation_ids.next_id()
                 )
                 
-                self.audit_logs.append(audit_entry)
+                new_entries.append(audit_entry)
+        
+        if new_entries:
+            self._record_audit_entries(new_entries)
     
-    def _check_policy_violations(self):
+    def _check_policy_violations(self, now: datetime):
         """Check for policy violations"""
         # Simulate policy violation detection
-        import random
-        
         if random.random() > 0.95:  # 5% chance of detecting a violation
-            violation_id = f"violation_{int(time.time())}"
+            violation_id = f"violation_{int(now.timestamp())}"
             policies = ["Data Access Policy", "Password Policy", "Encryption Policy"]
             policy = random.choice(policies)
             
@@ -485,12 +926,12 @@ class ComplianceAuditSystem:
                 policy_name=policy,
                 policy_category="security",
                 severity=random.choice([RiskLevel.MEDIUM, RiskLevel.HIGH]),
-                detected_at=datetime.now(),
+                detected_at=now,
                 user_id=f"user_{random.randint(1, 50)}",
                 description=f"Violation of {policy} detected",
                 impact_assessment=random.choice(["medium", "high"]),
                 remediation_required=True,
-                remediation_due=datetime.now() + timedelta(days=7),
+                remediation_due=now + timedelta(days=7),
                 status="open",
                 assigned_to=f"security_analyst_{random.randint(1, 5)}",
                 resolution_notes=""
@@ -500,7 +941,7 @@ class ComplianceAuditSystem:
             
             # Log the violation
             audit_entry = AuditLogEntry(
-                timestamp=datetime.now(),
+                timestamp=now,
                 event_type=AuditEventType.POLICY_VIOLATION,
                 user_id="system",
                 session_id="system",
@@ -516,10 +957,25 @@ class ComplianceAuditSystem:
                     "policy_name": policy,
                     "user_id": violation.user_id
                 },
-                correlation_id=str(uuid.uuid4())
+                correlation_id=_correlation_ids.next_id()
             )
             
-            self.audit_logs.append(audit_entry)
+            self._record_audit_entry(audit_entry)
+    
+    def _compact_audit_details(self, now: datetime):
+        """Replace older audit entries with copies whose details are PackedDetails"""
+        if msgpack is None:
+            return
+        
+        replacements = []
+        for position, entry in self.audit_logs.take_uncompacted_before(now.timestamp() - DETAILS_COMPACT_AGE):
+            if isinstance(entry.details, dict):
+                try:
+                    packed = PackedDetails(msgpack.packb(entry.details))
+                except (TypeError, ValueError):
+                    continue  # Keep details msgpack cannot encode as a dict
+                replacements.append((position, entry, replace(entry, details=packed)))
+        self.audit_logs.store_compacted(replacements)
     
     def log_audit_event(self, event_type: AuditEventType, user_id: str, resource_accessed: str, 
                        action_performed: str, outcome: str, risk_level: RiskLevel,
@@ -529,7 +985,7 @@ class ComplianceAuditSystem:
             timestamp=datetime.now(),
             event_type=event_type,
             user_id=user_id,
-            session_id=str(uuid.uuid4()),
+            session_id=uuid.uuid4().hex,
             ip_address="127.0.0.1",  # Would get from request
             user_agent="Stellar Logic AI Dashboard",
             resource_accessed=resource_accessed,
@@ -538,29 +994,25 @@ class ComplianceAuditSystem:
             risk_level=risk_level,
             compliance_impact="low",  # Would calculate based on event
             details=details or {},
-            correlation_id=str(uuid.uuid4())
+            correlation_id=_correlation_ids.next_id()
         )
         
-        self.audit_logs.append(audit_entry)
+        self._record_audit_entry(audit_entry)
         return audit_entry.correlation_id
     
     def get_compliance_summary(self) -> Dict[str, Any]:
         """Get compliance summary"""
-        total_checks = len(self.compliance_checks)
-        compliant_checks = len([c for c in self.compliance_checks.values() if c.status == ComplianceStatus.COMPLIANT])
-        non_compliant_checks = len([c for c in self.compliance_checks.values() if c.status == ComplianceStatus.NON_COMPLIANT])
-        pending_checks = len([c for c in self.compliance_checks.values() if c.status == ComplianceStatus.PENDING])
+        total_checks = len(self._check_scores)
+        status_counts = np.bincount(self._check_status, minlength=len(COMPLIANCE_STATUSES))
+        compliant_checks = int(status_counts[_STATUS_CODE[ComplianceStatus.COMPLIANT]])
+        non_compliant_checks = int(status_counts[_STATUS_CODE[ComplianceStatus.NON_COMPLIANT]])
+        pending_checks = int(status_counts[_STATUS_CODE[ComplianceStatus.PENDING]])
         
         # Calculate overall compliance score
-        if total_checks > 0:
-            overall_score = sum(c.score for c in self.compliance_checks.values()) / total_checks
-        else:
-            overall_score = 0
+        overall_score = float(self._check_scores.mean()) if total_checks > 0 else 0
         
         # Count by risk level
-        risk_counts = defaultdict(int)
-        for check in self.compliance_checks.values():
-            risk_counts[check.risk_level.value] += 1
+        risk_counts = np.bincount(self._check_risk, minlength=len(RISK_LEVELS))
         
         return {
             "total_checks": total_checks,
@@ -569,93 +1021,78 @@ class ComplianceAuditSystem:
             "pending_checks": pending_checks,
             "overall_compliance_score": round(overall_score, 2),
             "compliance_percentage": round((compliant_checks / total_checks * 100) if total_checks > 0 else 0, 2),
-            "risk_distribution": dict(risk_counts),
+            "risk_distribution": {RISK_LEVEL_NAMES[code]: int(count) for code, count in enumerate(risk_counts) if count},
             "last_updated": datetime.now().isoformat()
         }
     
     def get_audit_summary(self, hours: int = 24) -> Dict[str, Any]:
         """Get audit summary for specified time period"""
         cutoff_time = datetime.now() - timedelta(hours=hours)
-        recent_logs = [log for log in self.audit_logs if log.timestamp >= cutoff_time]
-        
-        # Count by event type
-        event_counts = defaultdict(int)
-        for log in recent_logs:
-            event_counts[log.event_type.value] += 1
+        event_codes, outcome_codes, risk_codes, user_ids = self.audit_logs.columns_since(cutoff_time)
         
-        # Count by outcome
-        outcome_counts = defaultdict(int)
-        for log in recent_logs:
-            outcome_counts[log.outcome] += 1
+        # Count by event type, outcome and risk level over the code columns
+        event_counts = np.bincount(event_codes, minlength=len(EVENT_TYPES))
+        outcome_counts = np.bincount(outcome_codes)
+        risk_counts = np.bincount(risk_codes, minlength=len(RISK_LEVELS))
+        outcome_names = self.audit_logs.outcome_names
         
-        # Count by risk level
-        risk_counts = defaultdict(int)
-        for log in recent_logs:
-            risk_counts[log.risk_level.value] += 1
-        
-        # Get top users by activity
-        user_counts = defaultdict(int)
-        for log in recent_logs:
-            user_counts[log.user_id] += 1
+        # Get top users by activity, counted in C by Counter
+        user_counts = Counter(user_ids)
         
-        top_users = sorted(user_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_users = user_counts.most_common(10)  # heapq.nlargest, O(n log 10)
         
         return {
             "period_hours": hours,
-            "total_events": len(recent_logs),
-            "event_distribution": dict(event_counts),
-            "outcome_distribution": dict(outcome_counts),
-            "risk_distribution": dict(risk_counts),
+            "total_events": len(user_ids),
+            "event_distribution": {EVENT_TYPE_NAMES[code]: int(count) for code, count in enumerate(event_counts) if count},
+            "outcome_distribution": {outcome_names[code]: int(count) for code, count in enumerate(outcome_counts) if count},
+            "risk_distribution": {RISK_LEVEL_NAMES[code]: int(count) for code, count in enumerate(risk_counts) if count},
             "top_users": [{"user_id": user, "event_count": count} for user, count in top_users],
             "last_updated": datetime.now().isoformat()
         }
     
+    def get_audit_logs_json(self, hours: int = 24) -> bytes:
+        """Get audit entries for the time period as an encoded JSON array, oldest first"""
+        cutoff_time = datetime.now() - timedelta(hours=hours)
+        return _json_bytes(self.audit_logs.snapshot_since(cutoff_time))
+    
     def get_security_summary(self) -> Dict[str, Any]:
         """Get security summary"""
         total_incidents = len(self.security_incidents)
         total_violations = len(self.policy_violations)
         
-        # Count incidents by status
-        incident_status_counts = defaultdict(int)
-        for incident in self.security_incidents.values():
-            incident_status_counts[incident.investigation_status] += 1
+        recent_cutoff = datetime.now() - timedelta(days=7)
         
-        # Count incidents by severity
+        # Count incidents by status and severity, and those from the last 7 days;
+        # severities are keyed by member and named once at the end
+        incident_status_counts = defaultdict(int)
         incident_severity_counts = defaultdict(int)
+        recent_incidents = 0
         for incident in self.security_incidents.values():
-            incident_severity_counts[incident.severity.value] += 1
+            incident_status_counts[incident.investigation_status] += 1
+            incident_severity_counts[incident.severity] += 1
+            if incident.detected_at > recent_cutoff:
+                recent_incidents += 1
         
-        # Count violations by status
+        # Count violations by status and severity, and those from the last 7 days
         violation_status_counts = defaultdict(int)
-        for violation in self.policy_violations.values():
-            violation_status_counts[violation.status] += 1
-        
-        # Count violations by severity
         violation_severity_counts = defaultdict(int)
+        recent_violations = 0
         for violation in self.policy_violations.values():
-            violation_severity_counts[violation.severity.value] += 1
-        
-        # Get recent incidents (last 7 days)
-        recent_incidents = [
-            incident for incident in self.security_incidents.values()
-            if datetime.now() - incident.detected_at < timedelta(days=7)
-        ]
-        
-        # Get recent violations (last 7 days)
-        recent_violations = [
-            violation for violation in self.policy_violations.values()
-            if datetime.now() - violation.detected_at < timedelta(days=7)
-        ]
+            violation_status_counts[violation.status] += 1
+            violation_severity_counts[violation.severity] += 1
+            if violation.detected_at > recent_cutoff:
+                recent_violations += 1
         
         return {
             "total_incidents": total_incidents,
             "total_violations": total_violations,
-            "recent_incidents": len(recent_incidents),
-            "recent_violations": len(recent_violations),
+            "recent_incidents": recent_incidents,
+            "recent_violations": recent_violations,
             "incident_status_distribution": dict(incident_status_counts),
-            "incident_severity_distribution": dict(incident_severity_counts),
+            "incident_severity_distribution": {severity.value: count for severity, count in incident_severity_counts.items()},
             "violation_status_distribution": dict(violation_status_counts),
-            "violation_severity_distribution": dict(violation_severity_counts),
+            "violation_severity_distribution": {severity.value: count for severity, count in violation_severity_counts.items()},
             "last_updated": datetime.now().isoformat()
         }
 
@@ -11,12 +11,23 @@ import json
 import logging
 import threading
 import hashlib
-import base64
+import hmac
+import ipaddress
+import functools
+import itertools
+from bisect import bisect_left, insort
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
-from collections import defaultdict, deque
+from typing import Callable, Dict, FrozenSet, List, Any, Optional, Tuple
+from dataclasses import dataclass, asdict, fields, is_dataclass, replace
+from collections import OrderedDict, defaultdict, deque
 from enum import Enum
+from types import MappingProxyType
+from operator import attrgetter
+try:
+    import orjson
+except ImportError:
+    # Fallback for environments without orjson
+    orjson = None
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -43,7 +54,7 @@ class ConfigStatus(Enum):
     DEPRECATED = "deprecated"
     PENDING = "pending"
 
-@dataclass
+@dataclass(slots=True)
 class Configuration:
     """Configuration data structure"""
     config_id: str
@@ -62,7 +73,7 @@ class Configuration:
     updated_by: str
     version: int
 
-@dataclass
+@dataclass(slots=True)
 class ConfigTemplate:
     """Configuration template data structure"""
     template_id: str
@@ -75,7 +86,7 @@ class ConfigTemplate:
     required_fields: List[str]
     sensitive_fields: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class ConfigChange:
     """Configuration change data structure"""
     change_id: str
@@ -89,17 +100,541 @@ class ConfigChange:
     approved_by: Optional[str]
     approved_at: Optional[datetime]
 
+_CONFIG_TYPES = {config_type.value: config_type for config_type in ConfigType}
+_changed_at = attrgetter("changed_at")
+
+def _json_default(obj: Any) -> Any:
+    """Encode the values the JSON encoders do not handle natively"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if isinstance(obj, MappingProxyType):  # Frozen template data
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of nested data: dicts become mapping proxies and lists tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+def _thaw(value: Any) -> Any:
+    """Mutable copy of _freeze output, for handing to callers"""
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+# Stored form of encrypted values; v2 is an HMAC, the unversioned legacy form
+# a SHA-256 over key + value, both hex
+_ENCRYPTED_PREFIX = "encrypted:"
+_ENCRYPTED_V2_PREFIX = "encrypted:v2:"
+
+def _remove_sorted(changes: List[ConfigChange], change: ConfigChange):
+    """Remove a change from a list sorted by changed_at"""
+    i = bisect_left(changes, change.changed_at, key=_changed_at)
+    while changes[i] is not change:
+        i += 1
+    del changes[i]
+
+def _is_int(value) -> bool:
+    """Check if value is an int (not bool) or an optionally negative string of ASCII digits"""
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return True
+    if isinstance(value, str):
+        digits = value[1:] if value.startswith("-") else value
+        return digits.isascii() and digits.isdigit()
+    return False
+
+def _is_float(value) -> bool:
+    """Check if value is a valid float"""
+    try:
+        float(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+def _parse_number(value) -> Optional[float]:
+    """float(str(value)), or None when the value is not numeric"""
+    try:
+        return float(str(value))
+    except ValueError:
+        return None
+
+# ASCII letters, digits, "-" and the "." label separator
+_HOSTNAME_BYTES = bytes(c for c in range(128) if chr(c).isalnum() or chr(c) in "-.")
+
+@functools.lru_cache(maxsize=2048)
+def _is_valid_hostname(hostname: str) -> bool:
+    """Check if hostname is valid: dot-separated labels of 1-63 letters, digits or hyphens"""
+    if len(hostname) > 253:
+        return False
+    if hostname[-1] == ".":
+        hostname = hostname[:-1]
+    if not hostname.isascii():
+        return False
+    
+    # One C-level pass for the character set, then label lengths without splitting
+    host_bytes = hostname.encode("ascii")
+    if host_bytes.translate(None, _HOSTNAME_BYTES):
+        return False
+    start = 0
+    while True:
+        end = host_bytes.find(b".", start)
+        if end < 0:
+            return 0 < len(host_bytes) - start <= 63
+        if not 0 < end - start <= 63:
+            return False
+        start = end + 1
+
+@functools.lru_cache(maxsize=2048)
+def _is_valid_ip(ip: str) -> bool:
+    """Check if IP address is valid"""
+    try:
+        ipaddress.ip_address(ip)
+        return True
+    except ValueError:
+        return False
+
+@functools.lru_cache(maxsize=256)
+def _split_options(options_text: str) -> FrozenSet[str]:
+    """Parse an "in:" options list once into a set"""
+    return frozenset(opt.strip() for opt in options_text.split(","))
+
+# Named validation rules; parameterized rules ("min:1") are compiled by _compile_rule
+_RULE_PREDICATES = {
+    "required": lambda value: value is not None and str(value).strip() != "",
+    "integer": _is_int,
+    "float": _is_float,
+    "boolean": lambda value: str(value).lower() in ["true", "false", "1", "0"],
+    "email": lambda value: "@" in str(value) and "." in str(value).split("@")[1],
+    "url": lambda value: str(value).startswith(("http://", "https://")),
+    "hostname": lambda value: _is_valid_hostname(str(value)),
+    "ip_address": lambda value: _is_valid_ip(str(value)),
+    "min_length": lambda value, min_len: len(str(value)) >= min_len,
+    "max_length": lambda value, max_len: len(str(value)) <= max_len,
+    "min": lambda value, min_val: float(str(value)) >= min_val,
+    "max": lambda value, max_val: float(str(value)) <= max_val,
+    "in": lambda value, options: str(value) in _split_options(options)
+}
+
+_NOT_A_NUMBER = "Value is not a number"
+
+# Checks take (value, number), where number is the value parsed by _parse_number
+# once per check list, so numeric bounds never re-parse the value
+RuleCheck = Callable[[Any, Optional[float]], Optional[str]]
+
+def _min_length_check(payload: str) -> RuleCheck:
+    """min_length:N"""
+    min_len = int(payload)
+    error = f"Value too short (minimum {min_len} characters)"
+    return lambda value, number: None if len(str(value)) >= min_len else error
+
+def _max_length_check(payload: str) -> RuleCheck:
+    """max_length:N"""
+    max_len = int(payload)
+    error = f"Value too long (maximum {max_len} characters)"
+    return lambda value, number: None if len(str(value)) <= max_len else error
+
+def _min_check(payload: str) -> RuleCheck:
+    """min:N"""
+    min_val = float(payload)
+    error = f"Value too small (minimum {min_val})"
+    return lambda value, number: (
+        _NOT_A_NUMBER if number is None else None if number >= min_val else error
+    )
+
+def _max_check(payload: str) -> RuleCheck:
+    """max:N"""
+    max_val = float(payload)
+    error = f"Value too large (maximum {max_val})"
+    return lambda value, number: (
+        _NOT_A_NUMBER if number is None else None if number <= max_val else error
+    )
+
+def _in_check(payload: str) -> RuleCheck:
+    """in:a,b,c"""
+    options = _split_options(payload)
+    error = f"Value not in allowed options: {payload}"
+    return lambda value, number: None if str(value) in options else error
+
+# Parameterized rule kind ("min" in "min:1") -> builder of its check from the payload
+_RULE_BUILDERS: Dict[str, Callable[[str], RuleCheck]] = {
+    "min_length": _min_length_check,
+    "max_length": _max_length_check,
+    "min": _min_check,
+    "max": _max_check,
+    "in": _in_check,
+}
+
+def _compile_rule(rule: str) -> Optional[RuleCheck]:
+    """Compile one rule string to a check(value, number); unknown rules compile to None and are skipped"""
+    parts = rule.split(":")
+    if len(parts) > 1 and parts[0] in _RULE_BUILDERS:
+        return _RULE_BUILDERS[parts[0]](parts[1])
+    if rule in _RULE_PREDICATES:
+        predicate = _RULE_PREDICATES[rule]
+        error = f"Validation failed for rule: {rule}"
+        return lambda value, number: None if predicate(value) else error
+    return None
+
+def _compile_rules(rules: List[str]) -> List[RuleCheck]:
+    """Parse rule strings once into checks that return an error message or None"""
+    checks = []
+    for rule in rules:
+        check = _compile_rule(rule)
+        if check is not None:
+            checks.append(check)
+    return checks
+
+class _CountingCheck:
+    """A compiled check with its declared position and how often it was the reported failure"""
+    __slots__ = ('check', 'index', 'fail_count')
+    
+    def __init__(self, check: RuleCheck, index: int):
+        self.check = check
+        self.index = index
+        self.fail_count = 0
+
+def _find_first_failure(checks: Tuple[_CountingCheck, ...], value: Any) -> Optional[Tuple[int, str]]:
+    """(position, error) of the earliest declared failing check, or None
+
+    Checks may be ordered most-failing first; after the first failure only
+    checks declared earlier still need to run.
+    """
+    number = _parse_number(value)
+    for position, check in enumerate(checks):
+        error = check.check(value, number)
+        if error:
+            first = position
+            for other_position in range(position + 1, len(checks)):
+                other = checks[other_position]
+                if other.index < checks[first].index:
+                    other_error = other.check(value, number)
+                    if other_error:
+                        first, error = other_position, other_error
+            return first, error
+    return None
+
+# Memoized for str values; pure, since it is keyed by the check tuple itself
+# and the failure counts are kept by the caller
+_cached_first_failure = functools.lru_cache(maxsize=4096)(_find_first_failure)
+
+# Sample bootstrap data, built into shared objects once at import
+_TEMPLATE_SPECS = (
+    {
+        "template_id": "database_template_001",
+        "name": "Database Configuration Template",
+        "description": "Database connection and performance settings",
+        "config_type": ConfigType.DATABASE,
+        "environments": [Environment.DEVELOPMENT, Environment.STAGING, Environment.PRODUCTION],
+        "default_values": {
+            "db_host": "localhost",
+            "db_port": "5432",
+            "db_name": "stellarlogic",
+            "db_username": "stellarlogic_user",
+            "db_password": "",
+            "db_ssl_mode": "require",
+            "db_pool_size": "20",
+            "db_timeout": "30",
+            "db_max_connections": "100"
+        },
+        "validation_rules": {
+            "db_port": ["required", "integer", "min:1", "max:65535"],
+            "db_pool_size": ["required", "integer", "min:1", "max:100"],
+            "db_timeout": ["required", "integer", "min:1", "max:300"],
+            "db_max_connections": ["required", "integer", "min:1", "max:1000"],
+            "db_ssl_mode": ["required", "in:disable,prefer,require,verify-ca,verify-full"]
+        },
+        "required_fields": ["db_host", "db_port", "db_name", "db_username"],
+        "sensitive_fields": ["db_password"]
+    },
+    {
+        "template_id": "security_template_002",
+        "name": "Security Configuration Template",
+        "description": "Security and authentication settings",
+        "config_type": ConfigType.SECURITY,
+        "environments": [Environment.DEVELOPMENT, Environment.STAGING, Environment.PRODUCTION],
+        "default_values": {
+            "jwt_secret": "",
+            "jwt_expiry": "3600",
+            "session_timeout": "1800",
+            "max_login_attempts": "5",
+            "lockout_duration": "900",
+            "password_min_length": "8",
+            "password_require_special": "true",
+            "mfa_required": "false",
+            "api_rate_limit": "1000",
+            "cors_origins": "[]"
+        },
+        "validation_rules": {
+            "jwt_expiry": ["required", "integer", "min:300", "max:86400"],
+            "session_timeout": ["required", "integer", "min:300", "max:7200"],
+            "max_login_attempts": ["required", "integer", "min:3", "max:10"],
+            "lockout_duration": ["required", "integer", "min:300", "max:3600"],
+            "password_min_length": ["required", "integer", "min:6", "max:128"],
+            "api_rate_limit": ["required", "integer", "min:100", "max:10000"]
+        },
+        "required_fields": ["jwt_secret", "jwt_expiry", "session_timeout"],
+        "sensitive_fields": ["jwt_secret"]
+    },
+    {
+        "template_id": "api_template_003",
+        "name": "API Configuration Template",
+        "description": "API server and endpoint settings",
+        "config_type": ConfigType.API,
+        "environments": [Environment.DEVELOPMENT, Environment.STAGING, Environment.PRODUCTION],
+        "default_values": {
+            "api_host": "0.0.0.0",
+            "api_port": "8000",
+            "api_workers": "4",
+            "api_debug": "false",
+            "api_log_level": "INFO",
+            "api_cors_enabled": "true",
+            "api_rate_limit": "1000",
+            "api_timeout": "30",
+            "api_max_request_size": "10485760",
+            "api_trusted_proxies": "[]"
+        },
+        "validation_rules": {
+            "api_port": ["required", "integer", "min:1", "max:65535"],
+            "api_workers": ["required", "integer", "min:1", "max:32"],
+            "api_rate_limit": ["required", "integer", "min:100", "max:10000"],
+            "api_timeout": ["required", "integer", "min:5", "max:300"],
+            "api_max_request_size": ["required", "integer", "min:1024", "max:104857600"],
+            "api_log_level": ["required", "in:DEBUG,INFO,WARNING,ERROR,CRITICAL"]
+        },
+        "required_fields": ["api_host", "api_port", "api_workers"],
+        "sensitive_fields": []
+    },
+    {
+        "template_id": "monitoring_template_004",
+        "name": "Monitoring Configuration Template",
+        "description": "Monitoring and alerting settings",
+        "config_type": ConfigType.MONITORING,
+        "environments": [Environment.DEVELOPMENT, Environment.STAGING, Environment.PRODUCTION],
+        "default_values": {
+            "monitoring_enabled": "true",
+            "metrics_port": "9090",
+            "health_check_interval": "30",
+            "alert_webhook_url": "",
+            "alert_email_recipients": "[]",
+            "alert_slack_webhook": "",
+            "performance_threshold_cpu": "80",
+            "performance_threshold_memory": "85",
+            "performance_threshold_disk": "90",
+            "log_retention_days": "30"
+        },
+        "validation_rules": {
+            "metrics_port": ["required", "integer", "min:1", "max:65535"],
+            "health_check_interval": ["required", "integer", "min:10", "max:300"],
+            "performance_threshold_cpu": ["required", "integer", "min:50", "max:95"],
+            "performance_threshold_memory": ["required", "integer", "min:50", "max:95"],
+            "performance_threshold_disk": ["required", "integer", "min:50", "max:95"],
+            "log_retention_days": ["required", "integer", "min:1", "max:365"]
+        },
+        "required_fields": ["monitoring_enabled", "metrics_port", "health_check_interval"],
+        "sensitive_fields": ["alert_webhook_url", "alert_slack_webhook"]
+    }
+)
+
+# Shared by every manager, so the templates and their dict forms are frozen;
+# get_config_template hands out thawed copies
+_DEFAULT_TEMPLATES: Dict[str, ConfigTemplate] = {
+    spec["template_id"]: ConfigTemplate(**{field: _freeze(value) for field, value in spec.items()})
+    for spec in _TEMPLATE_SPECS
+}
+_DEFAULT_TEMPLATE_DICTS = {spec["template_id"]: _freeze(spec) for spec in _TEMPLATE_SPECS}
+# (config_type, key) -> validation rules of the first template defining them
+_DEFAULT_TEMPLATE_RULES = {}
+for _template in _DEFAULT_TEMPLATES.values():
+    for _key, _rules in _template.validation_rules.items():
+        # Interned so lookups with interned configuration keys compare by identity
+        _DEFAULT_TEMPLATE_RULES.setdefault((_template.config_type, sys.intern(_key)), _rules)
+# config_type -> keys some template for that type requires
+_DEFAULT_REQUIRED_BY_CT: Dict[ConfigType, FrozenSet[str]] = {}
+for _template in _DEFAULT_TEMPLATES.values():
+    _DEFAULT_REQUIRED_BY_CT[_template.config_type] = (
+        _DEFAULT_REQUIRED_BY_CT.get(_template.config_type, frozenset()) | frozenset(_template.required_fields)
+    )
+# (config_type, key) -> those rules compiled to checks returning an error or None
+_DEFAULT_COMPILED_RULES = {
+    rule_key: _compile_rules(rules) for rule_key, rules in _DEFAULT_TEMPLATE_RULES.items() if rules
+}
+
+# created/updated and changed/approved times are offsets back from initialization
+_CONFIG_SPECS = (
+    {
+        "config_id": "db_prod_host_001",
+        "name": "Production Database Host",
+        "environment": Environment.PRODUCTION,
+        "config_type": ConfigType.DATABASE,
+        "key": "db_host",
+        "value": "db.stellarlogica.ai",
+        "is_encrypted": False,
+        "description": "Production database hostname",
+        "validation_rules": ["required", "hostname"],
+        "default_value": "localhost",
+        "status": ConfigStatus.ACTIVE,
+        "created_ago": timedelta(days=365),
+        "updated_ago": timedelta(days=30),
+        "updated_by": "admin",
+        "version": 1
+    },
+    {
+        "config_id": "db_prod_password_002",
+        "name": "Production Database Password",
+        "environment": Environment.PRODUCTION,
+        "config_type": ConfigType.DATABASE,
+        "key": "db_password",
+        "value": "encrypted:U2FsdGVkX1+encrypted_password_hash",
+        "is_encrypted": True,
+        "description": "Production database password (encrypted)",
+        "validation_rules": ["required", "min_length:16"],
+        "default_value": "",
+        "status": ConfigStatus.ACTIVE,
+        "created_ago": timedelta(days=365),
+        "updated_ago": timedelta(days=7),
+        "updated_by": "admin",
+        "version": 3
+    },
+    {
+        "config_id": "security_jwt_secret_003",
+        "name": "JWT Secret Key",
+        "environment": Environment.PRODUCTION,
+        "config_type": ConfigType.SECURITY,
+        "key": "jwt_secret",
+        "value": "encrypted:U2FsdGVkX1+jwt_secret_key_hash",
+        "is_encrypted": True,
+        "description": "JWT signing secret (encrypted)",
+        "validation_rules": ["required", "min_length:32"],
+        "default_value": "",
+        "status": ConfigStatus.ACTIVE,
+        "created_ago": timedelta(days=365),
+        "updated_ago": timedelta(days=90),
+        "updated_by": "security_admin",
+        "version": 2
+    },
+    {
+        "config_id": "api_prod_port_004",
+        "name": "Production API Port",
+        "environment": Environment.PRODUCTION,
+        "config_type": ConfigType.API,
+        "key": "api_port",
+        "value": "8000",
+        "is_encrypted": False,
+        "description": "Production API server port",
+        "validation_rules": ["required", "integer", "min:1", "max:65535"],
+        "default_value": "8000",
+        "status": ConfigStatus.ACTIVE,
+        "created_ago": timedelta(days=365),
+        "updated_ago": timedelta(days=180),
+        "updated_by": "admin",
+        "version": 1
+    },
+    {
+        "config_id": "monitoring_enabled_005",
+        "name": "Monitoring Enabled",
+        "environment": Environment.PRODUCTION,
+        "config_type": ConfigType.MONITORING,
+        "key": "monitoring_enabled",
+        "value": "true",
+        "is_encrypted": False,
+        "description": "Enable/disable monitoring system",
+        "validation_rules": ["required", "boolean"],
+        "default_value": "true",
+        "status": ConfigStatus.ACTIVE,
+        "created_ago": timedelta(days=365),
+        "updated_ago": timedelta(days=60),
+        "updated_by": "ops_admin",
+        "version": 1
+    }
+)
+
+_CHANGE_SPECS = (
+    {
+        "change_id": "change_001",
+        "config_id": "db_prod_password_002",
+        "old_value": "encrypted:U2FsdGVkX1+old_password_hash",
+        "new_value": "encrypted:U2FsdGVkX1+new_password_hash",
+        "changed_by": "admin",
+        "changed_ago": timedelta(days=7),
+        "environment": Environment.PRODUCTION,
+        "reason": "Regular password rotation",
+        "approved_by": "security_admin",
+        "approved_ago": timedelta(days=7, hours=1)
+    },
+    {
+        "change_id": "change_002",
+        "config_id": "security_jwt_secret_003",
+        "old_value": "encrypted:U2FsdGVkX1+old_jwt_secret",
+        "new_value": "encrypted:U2FsdGVkX1+new_jwt_secret",
+        "changed_by": "security_admin",
+        "changed_ago": timedelta(days=90),
+        "environment": Environment.PRODUCTION,
+        "reason": "JWT secret rotation for security",
+        "approved_by": "cto",
+        "approved_ago": timedelta(days=90, hours=2)
+    },
+    {
+        "change_id": "change_003",
+        "config_id": "api_prod_port_004",
+        "old_value": "8000",
+        "new_value": "8443",
+        "changed_by": "ops_admin",
+        "changed_ago": timedelta(days=180),
+        "environment": Environment.PRODUCTION,
+        "reason": "Port change to avoid conflicts",
+        "approved_by": "admin",
+        "approved_ago": timedelta(days=180, hours=3)
+    }
+)
+
+
 class ConfigurationManager:
     """Configuration Management System"""
     
     def __init__(self):
         self.logger = logging.getLogger("configuration_manager")
+        # Guards writes; readers use the lists and dicts swapped in under it
+        self.lock = threading.RLock()
         self.configurations = {}
+        # Secondary indexes over configurations, maintained by _add_configuration
+        self._by_env = defaultdict(list)
+        self._by_env_type_key = {}
+        self._config_dicts = {}  # config_id -> (config, version, asdict(config))
         self.config_templates = {}
+        self._template_dicts = {}  # template_id -> frozen dict form of the template
+        # (config_type, key) -> validation rules of the first template defining them
+        self._template_rules = {}
+        self._required_by_ct = {}  # config_type -> required keys across its templates
+        # (config_type, key) -> those rules compiled to checks returning an error or None
+        self._compiled_rules = {}
+        # Checks are re-sorted most-failing first every check_reorder_interval runs
+        self.check_reorder_interval = 10000
+        self._check_runs = itertools.count(1)
         self.config_changes = deque(maxlen=1000)
+        # The same changes sorted by changed_at, overall and per config_id
+        self._changes_list = []
+        self._changes_by_config = defaultdict(list)
+        self._change_dicts = {}  # change_id -> asdict(change), built when the change is recorded
         self.encryption_key = os.getenv('CONFIG_ENCRYPTION_KEY', 'default-key-change-in-production')
+        self._key_bytes = self.encryption_key.encode()
+        # LRU of encrypted value -> decrypted value
+        self.decrypt_cache_size = 1024
+        self._decrypt_cache = OrderedDict()
         self.validation_rules = {}
         self.approval_required = True
+        # Change and config ids; unlike whole seconds, never repeats within a process
+        self._id_counter = itertools.count(int(time.time()) * 1000)
         
         # Initialize with sample configurations and templates
         self._initialize_config_templates()
@@ -109,288 +644,112 @@ class ConfigurationManager:
     
     def _initialize_config_templates(self):
         """Initialize with sample configuration templates"""
-        templates = [
-            {
-                "template_id": "database_template_001",
-                "name": "Database Configuration Template",
-                "description": "Database connection and performance settings",
-                "config_type": ConfigType.DATABASE,
-                "environments": [Environment.DEVELOPMENT, Environment.STAGING, Environment.PRODUCTION],
-                "default_values": {
-                    "db_host": "localhost",
-                    "db_port": "5432",
-                    "db_name": "stellarlogic",
-                    "db_username": "stellarlogic_user",
-                    "db_password": "",
-                    "db_ssl_mode": "require",
-                    "db_pool_size": "20",
-                    "db_timeout": "30",
-                    "db_max_connections": "100"
-                },
-                "validation_rules": {
-                    "db_port": ["required", "integer", "min:1", "max:65535"],
-                    "db_pool_size": ["required", "integer", "min:1", "max:100"],
-                    "db_timeout": ["required", "integer", "min:1", "max:300"],
-                    "db_max_connections": ["required", "integer", "min:1", "max:1000"],
-                    "db_ssl_mode": ["required", "in:disable,prefer,require,verify-ca,verify-full"]
-                },
-                "required_fields": ["db_host", "db_port", "db_name", "db_username"],
-                "sensitive_fields": ["db_password"]
-            },
-            {
-                "template_id": "security_template_002",
-                "name": "Security Configuration Template",
-                "description": "Security and authentication settings",
-                "config_type": ConfigType.SECURITY,
-                "environments": [Environment.DEVELOPMENT, Environment.STAGING, Environment.PRODUCTION],
-                "default_values": {
-                    "jwt_secret": "",
-                    "jwt_expiry": "3600",
-                    "session_timeout": "1800",
-                    "max_login_attempts": "5",
-                    "lockout_duration": "900",
-                    "password_min_length": "8",
-                    "password_require_special": "true",
-                    "mfa_required": "false",
-                    "api_rate_limit": "1000",
-                    "cors_origins": "[]"
-                },
-                "validation_rules": {
-                    "jwt_expiry": ["required", "integer", "min:300", "max:86400"],
-                    "session_timeout": ["required", "integer", "min:300", "max:7200"],
-                    "max_login_attempts": ["required", "integer", "min:3", "max:10"],
-                    "lockout_duration": ["required", "integer", "min:300", "max:3600"],
-                    "password_min_length": ["required", "integer", "min:6", "max:128"],
-                    "api_rate_limit": ["required", "integer", "min:100", "max:10000"]
-                },
-                "required_fields": ["jwt_secret", "jwt_expiry", "session_timeout"],
-                "sensitive_fields": ["jwt_secret"]
-            },
-            {
-                "template_id": "api_template_003",
-                "name": "API Configuration Template",
-                "description": "API server and endpoint settings",
-                "config_type": ConfigType.API,
-                "environments": [Environment.DEVELOPMENT, Environment.STAGING, Environment.PRODUCTION],
-                "default_values": {
-                    "api_host": "0.0.0.0",
-                    "api_port": "8000",
-                    "api_workers": "4",
-                    "api_debug": "false",
-                    "api_log_level": "INFO",
-                    "api_cors_enabled": "true",
-                    "api_rate_limit": "1000",
-                    "api_timeout": "30",
-                    "api_max_request_size": "10485760",
-                    "api_trusted_proxies": "[]"
-                },
-                "validation_rules": {
-                    "api_port": ["required", "integer", "min:1", "max:65535"],
-                    "api_workers": ["required", "integer", "min:1", "max:32"],
-                    "api_rate_limit": ["required", "integer", "min:100", "max:10000"],
-                    "api_timeout": ["required", "integer", "min:5", "max:300"],
-                    "api_max_request_size": ["required", "integer", "min:1024", "max:104857600"],
-                    "api_log_level": ["required", "in:DEBUG,INFO,WARNING,ERROR,CRITICAL"]
-                },
-                "required_fields": ["api_host", "api_port", "api_workers"],
-                "sensitive_fields": []
-            },
-            {
-                "template_id": "monitoring_template_004",
-                "name": "Monitoring Configuration Template",
-                "description": "Monitoring and alerting settings",
-                "config_type": ConfigType.MONITORING,
-                "environments": [Environment.DEVELOPMENT, Environment.STAGING, Environment.PRODUCTION],
-                "default_values": {
-                    "monitoring_enabled": "true",
-                    "metrics_port": "9090",
-                    "health_check_interval": "30",
-                    "alert_webhook_url": "",
-                    "alert_email_recipients": "[]",
-                    "alert_slack_webhook": "",
-                    "performance_threshold_cpu": "80",
-                    "performance_threshold_memory": "85",
-                    "performance_threshold_disk": "90",
-                    "log_retention_days": "30"
-                },
-                "validation_rules": {
-                    "metrics_port": ["required", "integer", "min:1", "max:65535"],
-                    "health_check_interval": ["required", "integer", "min:10", "max:300"],
-                    "performance_threshold_cpu": ["required", "integer", "min:50", "max:95"],
-                    "performance_threshold_memory": ["required", "integer", "min:50", "max:95"],
-                    "performance_threshold_disk": ["required", "integer", "min:50", "max:95"],
-                    "log_retention_days": ["required", "integer", "min:1", "max:365"]
-                },
-                "required_fields": ["monitoring_enabled", "metrics_port", "health_check_interval"],
-                "sensitive_fields": ["alert_webhook_url", "alert_slack_webhook"]
-            }
-        ]
+        # Templates are never mutated, so every manager shares the prebuilt objects
+        self.config_templates = dict(_DEFAULT_TEMPLATES)
+        self._template_dicts = dict(_DEFAULT_TEMPLATE_DICTS)
+        self._template_rules = dict(_DEFAULT_TEMPLATE_RULES)
+        self._required_by_ct = dict(_DEFAULT_REQUIRED_BY_CT)
         
-        for template_data in templates:
-            template = ConfigTemplate(**template_data)
-            self.config_templates[template.template_id] = template
-        
-        self.logger.info(f"Initialized {len(templates)} configuration templates")
+        self.logger.info(f"Initialized {len(self.config_templates)} configuration templates")
     
     def _initialize_configurations(self):
         """Initialize with sample configurations"""
-        configurations = [
-            {
-                "config_id": "db_prod_host_001",
-                "name": "Production Database Host",
-                "environment": Environment.PRODUCTION,
-                "config_type": ConfigType.DATABASE,
-                "key": "db_host",
-                "value": "db.stellarlogica.ai",
-                "is_encrypted": False,
-                "description": "Production database hostname",
-                "validation_rules": ["required", "hostname"],
-                "default_value": "localhost",
-                "status": ConfigStatus.ACTIVE,
-                "created_at": datetime.now() - timedelta(days=365),
-                "updated_at": datetime.now() - timedelta(days=30),
-                "updated_by": "admin",
-                "version": 1
-            },
-            {
-                "config_id": "db_prod_password_002",
-                "name": "Production Database Password",
-                "environment": Environment.PRODUCTION,
-                "config_type": ConfigType.DATABASE,
-                "key": "db_password",
-                "value": "encrypted:U2FsdGVkX1+encrypted_password_hash",
-                "is_encrypted": True,
-                "description": "Production database password (encrypted)",
-                "validation_rules": ["required", "min_length:16"],
-                "default_value": "",
-                "status": ConfigStatus.ACTIVE,
-                "created_at": datetime.now() - timedelta(days=365),
-                "updated_at": datetime.now() - timedelta(days=7),
-                "updated_by": "admin",
-                "version": 3
-            },
-            {
-                "config_id": "security_jwt_secret_003",
-                "name": "JWT Secret Key",
-                "environment": Environment.PRODUCTION,
-                "config_type": ConfigType.SECURITY,
-                "key": "jwt_secret",
-                "value": "encrypted:U2FsdGVkX1+jwt_secret_key_hash",
-                "is_encrypted": True,
-                "description": "JWT signing secret (encrypted)",
-                "validation_rules": ["required", "min_length:32"],
-                "default_value": "",
-                "status": ConfigStatus.ACTIVE,
-                "created_at": datetime.now() - timedelta(days=365),
-                "updated_at": datetime.now() - timedelta(days=90),
-                "updated_by": "security_admin",
-                "version": 2
-            },
-            {
-                "config_id": "api_prod_port_004",
-                "name": "Production API Port",
-                "environment": Environment.PRODUCTION,
-                "config_type": ConfigType.API,
-                "key": "api_port",
-                "value": "8000",
-                "is_encrypted": False,
-                "description": "Production API server port",
-                "validation_rules": ["required", "integer", "min:1", "max:65535"],
-                "default_value": "8000",
-                "status": ConfigStatus.ACTIVE,
-                "created_at": datetime.now() - timedelta(days=365),
-                "updated_at": datetime.now() - timedelta(days=180),
-                "updated_by": "admin",
-                "version": 1
-            },
-            {
-                "config_id": "monitoring_enabled_005",
-                "name": "Monitoring Enabled",
-                "environment": Environment.PRODUCTION,
-                "config_type": ConfigType.MONITORING,
-                "key": "monitoring_enabled",
-                "value": "true",
-                "is_encrypted": False,
-                "description": "Enable/disable monitoring system",
-                "validation_rules": ["required", "boolean"],
-                "default_value": "true",
-                "status": ConfigStatus.ACTIVE,
-                "created_at": datetime.now() - timedelta(days=365),
-                "updated_at": datetime.now() - timedelta(days=60),
-                "updated_by": "ops_admin",
-                "version": 1
-            }
-        ]
+        now = datetime.now()
+        configs = []
+        for spec in _CONFIG_SPECS:
+            config_data = dict(spec, validation_rules=list(spec["validation_rules"]))
+            config_data["created_at"] = now - config_data.pop("created_ago")
+            config_data["updated_at"] = now - config_data.pop("updated_ago")
+            configs.append(Configuration(**config_data))
+        self._load_configurations(configs)
         
-        for config_data in configurations:
-            config = Configuration(**config_data)
-            self.configurations[config.config_id] = config
+        self.logger.info(f"Initialized {len(_CONFIG_SPECS)} configurations")
+    
+    def _load_configurations(self, configs: List[Configuration]):
+        """Replace all configurations, building the dict and its indexes in one pass each"""
+        configurations = {config.config_id: config for config in configs}
+        by_env = defaultdict(list)
+        for config in configurations.values():
+            by_env[config.environment].append(config)
+        by_env_type_key = {
+            (config.environment, config.config_type, config.key): config
+            for config in configurations.values()
+        }
         
-        self.logger.info(f"Initialized {len(configurations)} configurations")
+        with self.lock:
+            self.configurations = configurations
+            self._by_env = by_env
+            self._by_env_type_key = by_env_type_key
+            self._config_dicts = {}
+    
+    def _add_configuration(self, config: Configuration):
+        """Store a configuration and index it by environment and (environment, type, key)"""
+        with self.lock:
+            # Environment lists are copied and swapped so lock-free readers keep a consistent snapshot
+            previous = self.configurations.get(config.config_id)
+            if previous is not None and previous.environment == config.environment:
+                # Same environment: replace in place to keep listing order
+                self._by_env[config.environment] = [
+                    config if c is previous else c for c in self._by_env[config.environment]
+                ]
+            else:
+                if previous is not None:
+                    self._by_env[previous.environment] = [
+                        c for c in self._by_env[previous.environment] if c is not previous
+                    ]
+                self._by_env[config.environment] = self._by_env[config.environment] + [config]
+            
+            if previous is not None:
+                index_key = (previous.environment, previous.config_type, previous.key)
+                if self._by_env_type_key.get(index_key) is previous:
+                    del self._by_env_type_key[index_key]
+            
+            self.configurations[config.config_id] = config
+            self._by_env_type_key[(config.environment, config.config_type, config.key)] = config
     
     def _initialize_config_changes(self):
         """Initialize with sample configuration changes"""
-        changes = [
-            {
-                "change_id": "change_001",
-                "config_id": "db_prod_password_002",
-                "old_value": "encrypted:U2FsdGVkX1+old_password_hash",
-                "new_value": "encrypted:U2FsdGVkX1+new_password_hash",
-                "changed_by": "admin",
-                "changed_at": datetime.now() - timedelta(days=7),
-                "environment": Environment.PRODUCTION,
-                "reason": "Regular password rotation",
-                "approved_by": "security_admin",
-                "approved_at": datetime.now() - timedelta(days=7, hours=1)
-            },
-            {
-                "change_id": "change_002",
-                "config_id": "security_jwt_secret_003",
-                "old_value": "encrypted:U2FsdGVkX1+old_jwt_secret",
-                "new_value": "encrypted:U2FsdGVkX1+new_jwt_secret",
-                "changed_by": "security_admin",
-                "changed_at": datetime.now() - timedelta(days=90),
-                "environment": Environment.PRODUCTION,
-                "reason": "JWT secret rotation for security",
-                "approved_by": "cto",
-                "approved_at": datetime.now() - timedelta(days=90, hours=2)
-            },
-            {
-                "change_id": "change_003",
-                "config_id": "api_prod_port_004",
-                "old_value": "8000",
-                "new_value": "8443",
-                "changed_by": "ops_admin",
-                "changed_at": datetime.now() - timedelta(days=180),
-                "environment": Environment.PRODUCTION,
-                "reason": "Port change to avoid conflicts",
-                "approved_by": "admin",
-                "approved_at": datetime.now() - timedelta(days=180, hours=3)
-            }
-        ]
+        now = datetime.now()
+        for spec in _CHANGE_SPECS:
+            change_data = dict(spec)
+            change_data["changed_at"] = now - change_data.pop("changed_ago")
+            change_data["approved_at"] = now - change_data.pop("approved_ago")
+            self._record_change(ConfigChange(**change_data))
         
-        for change_data in changes:
-            change = ConfigChange(**change_data)
+        self.logger.info(f"Initialized {len(_CHANGE_SPECS)} configuration changes")
+    
+    def _record_change(self, change: ConfigChange):
+        """Append a change, keeping the time-sorted views in step with the bounded deque"""
+        with self.lock:
+            # Sorted views are copied and swapped so readers never see a half-applied update
+            changes_list = list(self._changes_list)
+            if len(self.config_changes) == self.config_changes.maxlen:
+                evicted = self.config_changes[0]
+                _remove_sorted(changes_list, evicted)
+                config_changes = list(self._changes_by_config[evicted.config_id])
+                _remove_sorted(config_changes, evicted)
+                if config_changes:
+                    self._changes_by_config[evicted.config_id] = config_changes
+                else:
+                    del self._changes_by_config[evicted.config_id]
+                self._change_dicts.pop(evicted.change_id, None)
+            
+            # Changes are never edited once recorded, so their dict form is built once
+            self._change_dicts[change.change_id] = asdict(change)
             self.config_changes.append(change)
-        
-        self.logger.info(f"Initialized {len(changes)} configuration changes")
+            insort(changes_list, change, key=_changed_at)
+            config_changes = list(self._changes_by_config.get(change.config_id, ()))
+            insort(config_changes, change, key=_changed_at)
+            self._changes_by_config[change.config_id] = config_changes
+            self._changes_list = changes_list
     
     def _initialize_validation_rules(self):
         """Initialize validation rules"""
-        self.validation_rules = {
-            "required": lambda value: value is not None and str(value).strip() != "",
-            "integer": lambda value: str(value).isdigit() if str(value).isdigit() else False,
-            "float": lambda value: self._is_float(value),
-            "boolean": lambda value: str(value).lower() in ["true", "false", "1", "0"],
-            "email": lambda value: "@" in str(value) and "." in str(value).split("@")[1],
-            "url": lambda value: str(value).startswith(("http://", "https://")),
-            "hostname": lambda value: self._is_valid_hostname(str(value)),
-            "ip_address": lambda value: self._is_valid_ip(str(value)),
-            "min_length": lambda value, min_len: len(str(value)) >= min_len,
-            "max_length": lambda value, max_len: len(str(value)) <= max_len,
-            "min": lambda value, min_val: float(str(value)) >= min_val,
-            "max": lambda value, max_val: float(str(value)) <= max_val,
-            "in": lambda value, options: str(value) in [opt.strip() for opt in options.split(",")]
+        self.validation_rules = dict(_RULE_PREDICATES)
+        # Checks are compiled once at import; each manager counts their failures itself
+        self._compiled_rules = {
+            rule_key: tuple(_CountingCheck(check, index) for index, check in enumerate(checks))
+            for rule_key, checks in _DEFAULT_COMPILED_RULES.items()
         }
         
         self.logger.info("Initialized validation rules")
@@ -400,21 +759,24 @@ class ConfigurationManager:
         try:
             env = Environment(environment)
             
-            configs = list(self.configurations.values())
-            configs = [c for c in configs if c.environment == env]
-            
-            if config_type:
-                configs = [c for c in configs if c.config_type.value == config_type]
-            
-            if key:
-                configs = [c for c in configs if c.key == key]
+            if config_type and key:
+                config = self._by_env_type_key.get((env, _CONFIG_TYPES.get(config_type), key))
+                configs = [config] if config is not None else []
+            else:
+                # One pass with a fused predicate over the environment's configurations;
+                # the type is resolved once and compared by identity (unknown types match nothing)
+                ct = _CONFIG_TYPES.get(config_type) if config_type else None
+                configs = [
+                    c for c in self._by_env.get(env, ())
+                    if (not config_type or c.config_type is ct) and (not key or c.key == key)
+                ]
             
             # Decrypt encrypted values
             result_configs = []
             for config in configs:
-                config_dict = asdict(config)
+                config_dict = self._config_dict(config)
                 if config.is_encrypted:
-                    config_dict["value"] = self._decrypt_value(config.value)
+                    config_dict = dict(config_dict, value=self._cached_decrypt(config.value))
                 result_configs.append(config_dict)
             
             return {
@@ -429,6 +791,23 @@ class ConfigurationManager:
             self.logger.error(f"Get configuration error: {e}")
             return {"error": "Failed to get configuration"}
     
+    def to_json(self, obj: Any) -> bytes:
+        """Compact JSON for API results or raw records, via orjson when available
+
+        orjson encodes the dataclasses, enums and datetimes itself, so
+        records can be passed without going through asdict() first.
+        """
+        if orjson is not None:
+            return orjson.dumps(obj, default=_json_default)
+        return json.dumps(obj, default=_json_default, separators=(",", ":")).encode("utf-8")
+    
+    def _config_dict(self, config: Configuration) -> Dict[str, Any]:
+        """asdict(config), cached until the configuration's version changes"""
+        cached = self._config_dicts.get(config.config_id)
+        if cached is None or cached[0] is not config or cached[1] != config.version:
+            cached = self._config_dicts[config.config_id] = (config, config.version, asdict(config))
+        return cached[2]
+    
     def set_configuration(self, environment: str, config_type: str, key: str, value: str, 
                           description: str = "", is_encrypted: bool = False, updated_by: str = "system") -> Dict[str, Any]:
         """Set configuration value"""
@@ -441,95 +820,127 @@ class ConfigurationManager:
             if not validation_result["valid"]:
                 return {"success": False, "error": f"Validation failed: {validation_result['error']}"}
             
-            # Check if configuration exists
-            existing_config = None
-            for config in self.configurations.values():
-                if config.environment == env and config.config_type == ct and config.key == key:
-                    existing_config = config
-                    break
-            
             # Encrypt value if needed
             final_value = self._encrypt_value(value) if is_encrypted else value
             
-            if existing_config:
-                # Update existing configuration
-                old_value = existing_config.value
-                existing_config.value = final_value
-                existing_config.is_encrypted = is_encrypted
-                existing_config.description = description or existing_config.description
-                existing_config.updated_at = datetime.now()
-                existing_config.updated_by = updated_by
-                existing_config.version += 1
-                
-                # Record change
-                change_id = f"change_{int(time.time())}"
-                change = ConfigChange(
-                    change_id=change_id,
-                    config_id=existing_config.config_id,
-                    old_value=old_value,
-                    new_value=final_value,
-                    changed_by=updated_by,
-                    changed_at=datetime.now(),
-                    environment=env,
-                    reason="Configuration update",
-                    approved_by=None,
-                    approved_at=None
-                )
-                self.config_changes.append(change)
-                
-                return {
-                    "success": True,
-                    "config_id": existing_config.config_id,
-                    "action": "updated",
-                    "version": existing_config.version,
-                    "change_id": change_id
-                }
-            else:
-                # Create new configuration
-                config_id = f"config_{int(time.time())}"
-                config = Configuration(
-                    config_id=config_id,
-                    name=f"{key.title()} Configuration",
-                    environment=env,
-                    config_type=ct,
-                    key=key,
-                    value=final_value,
-                    is_encrypted=is_encrypted,
-                    description=description,
-                    validation_rules=[],
-                    default_value="",
-                    status=ConfigStatus.ACTIVE,
-                    created_at=datetime.now(),
-                    updated_at=datetime.now(),
-                    updated_by=updated_by,
-                    version=1
-                )
-                
-                self.configurations[config_id] = config
-                
-                return {
-                    "success": True,
-                    "config_id": config_id,
-                    "action": "created",
-                    "version": 1
-                }
+            with self.lock:
+                return self._upsert_config(env, ct, key, final_value, description, is_encrypted, updated_by)
                 
         except Exception as e:
             self.logger.error(f"Set configuration error: {e}")
             return {"success": False, "error": "Failed to set configuration"}
     
+    def _upsert_config(self, env: Environment, ct: ConfigType, key: str, final_value: str,
+                       description: str, is_encrypted: bool, updated_by: str) -> Dict[str, Any]:
+        """Create or update one validated (and, if sensitive, encrypted) value; caller holds self.lock"""
+        # Check if configuration exists
+        existing_config = self._by_env_type_key.get((env, ct, key))
+        
+        if existing_config:
+            # Update existing configuration
+            # Replace rather than mutate, so readers never see a half-updated record
+            old_value = existing_config.value
+            existing_config = replace(
+                existing_config,
+                value=final_value,
+                is_encrypted=is_encrypted,
+                description=description or existing_config.description,
+                updated_at=datetime.now(),
+                updated_by=updated_by,
+                version=existing_config.version + 1
+            )
+            self._add_configuration(existing_config)
+        
+            # Record change
+            change_id = f"change_{next(self._id_counter)}"
+            change = ConfigChange(
+                change_id=change_id,
+                config_id=existing_config.config_id,
+                old_value=old_value,
+                new_value=final_value,
+                changed_by=updated_by,
+                changed_at=datetime.now(),
+                environment=env,
+                reason="Configuration update",
+                approved_by=None,
+                approved_at=None
+            )
+            self._record_change(change)
+        
+            return {
+                "success": True,
+                "config_id": existing_config.config_id,
+                "action": "updated",
+                "version": existing_config.version,
+                "change_id": change_id
+            }
+        else:
+            # Create new configuration
+            config_id = f"config_{next(self._id_counter)}"
+            config = Configuration(
+                config_id=config_id,
+                name=f"{key.title()} Configuration",
+                environment=env,
+                config_type=ct,
+                key=sys.intern(key),
+                value=final_value,
+                is_encrypted=is_encrypted,
+                description=description,
+                validation_rules=[],
+                default_value="",
+                status=ConfigStatus.ACTIVE,
+                created_at=datetime.now(),
+                updated_at=datetime.now(),
+                updated_by=updated_by,
+                version=1
+            )
+        
+            self._add_configuration(config)
+        
+            return {
+                "success": True,
+                "config_id": config_id,
+                "action": "created",
+                "version": 1
+            }
+    
+    def _bulk_set(self, env: Environment, ct: ConfigType, items: List[Tuple[str, str, bool]],
+                  description: str, updated_by: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Validate every (key, value, is_encrypted) item, then write the valid ones under one lock"""
+        prepared = []
+        errors = []
+        for key, value, is_encrypted in items:
+            validation_result = self._validate_configuration(key, value, ct)
+            if not validation_result["valid"]:
+                errors.append({"key": key, "error": f"Validation failed: {validation_result['error']}"})
+                continue
+            prepared.append((key, self._encrypt_value(value) if is_encrypted else value, is_encrypted))
+        
+        results = []
+        with self.lock:
+            for key, final_value, is_encrypted in prepared:
+                result = self._upsert_config(env, ct, key, final_value, description, is_encrypted, updated_by)
+                results.append({
+                    "key": key,
+                    "config_id": result.get("config_id"),
+                    "action": result.get("action"),
+                    "version": result.get("version")
+                })
+        
+        return results, errors
+    
     def get_config_template(self, template_id: str = None) -> Dict[str, Any]:
         """Get configuration template"""
         if template_id:
-            template = self.config_templates.get(template_id)
-            if template:
-                return asdict(template)
+            template_dict = self._template_dicts.get(template_id)
+            if template_dict:
+                return _thaw(template_dict)
             else:
                 return {"error": "Template not found"}
         
         return {
             "total_templates": len(self.config_templates),
-            "templates": [asdict(template) for template in self.config_templates.values()]
+            "templates": [_thaw(template_dict) for template_dict in self._template_dicts.values()]
         }
     
     def apply_template(self, template_id: str, environment: str, values: Dict[str, str], 
@@ -550,33 +961,15 @@ class ConfigurationManager:
             final_values = template.default_values.copy()
             final_values.update(values)
             
-            # Apply configurations
-            results = []
-            errors = []
-            
-            for key, value in final_values.items():
-                is_encrypted = key in template.sensitive_fields
-                description = f"Configuration from template: {template.name}"
-                
-                result = self.set_configuration(
-                    environment=environment,
-                    config_type=template.config_type.value,
-                    key=key,
-                    value=value,
-                    description=description,
-                    is_encrypted=is_encrypted,
-                    updated_by=updated_by
-                )
-                
-                if result["success"]:
-                    results.append({
-                        "key": key,
-                        "config_id": result.get("config_id"),
-                        "action": result.get("action"),
-                        "version": result.get("version")
-                    })
-                else:
-                    errors.append({"key": key, "error": result.get("error")})
+            # Validate everything, then apply the valid values in one pass
+            description = f"Configuration from template: {template.name}"
+            results, errors = self._bulk_set(
+                env,
+                template.config_type,
+                [(key, value, key in template.sensitive_fields) for key, value in final_values.items()],
+                description,
+                updated_by
+            )
             
             return {
                 "success": len(errors) == 0,
@@ -595,28 +988,31 @@ class ConfigurationManager:
                            days: int = 30) -> Dict[str, Any]:
         """Get configuration changes"""
         try:
-            changes = list(self.config_changes)
-            
-            if environment:
-                env = Environment(environment)
-                changes = [c for c in changes if c.environment == env]
+            env = Environment(environment) if environment else None
             
             if config_id:
-                changes = [c for c in changes if c.config_id == config_id]
+                changes = self._changes_by_config.get(config_id, [])
+            else:
+                changes = self._changes_list
             
-            # Filter by time period
+            # Jump to the first change inside the time period
             cutoff_date = datetime.now() - timedelta(days=days)
-            changes = [c for c in changes if c.changed_at >= cutoff_date]
+            changes = changes[bisect_left(changes, cutoff_date, key=_changed_at):]
+            
+            if env is not None:
+                changes = [c for c in changes if c.environment == env]
             
-            # Sort by date (newest first)
-            changes.sort(key=lambda x: x.changed_at, reverse=True)
+            # Newest first
+            changes.reverse()
+            change_dicts = self._change_dicts
             
             return {
                 "total_changes": len(changes),
                 "environment": environment,
                 "config_id": config_id,
                 "period_days": days,
-                "changes": [asdict(change) for change in changes]
+                # A change evicted since the snapshot was taken falls back to asdict()
+                "changes": [change_dicts.get(change.change_id) or asdict(change) for change in changes]
             }
             
         except Exception as e:
@@ -628,12 +1024,36 @@ class ConfigurationManager:
         try:
             env = Environment(environment)
             
-            configs = [c for c in self.configurations.values() if c.environment == env]
+            configs = list(self._by_env.get(env, []))
             
             validation_results = []
             errors = []
             
+            # Required-key pre-pass: a config type in use that lacks required keys
+            # has the keys reported, and its values are not validated one by one
+            present_keys_by_ct = defaultdict(set)
+            for config in configs:
+                present_keys_by_ct[config.config_type].add(config.key)
+            missing_required = []
+            incomplete_types = set()
+            for ct, present_keys in present_keys_by_ct.items():
+                missing_keys = self._required_by_ct.get(ct, frozenset()) - present_keys
+                if missing_keys:
+                    incomplete_types.add(ct)
+                    missing_required.extend(
+                        {"config_type": ct.value, "key": key} for key in sorted(missing_keys)
+                    )
+            
+            skipped_count = 0
             for config in configs:
+                if config.config_type in incomplete_types:
+                    skipped_count += 1
+                    validation_results.append({
+                        "config_id": config.config_id,
+                        "key": config.key,
+                        "status": "skipped"
+                    })
+                    continue
                 validation_result = self._validate_configuration(config.key, config.value, config.config_type)
                 
                 if validation_result["valid"]:
@@ -652,11 +1072,13 @@ class ConfigurationManager:
             return {
                 "environment": environment,
                 "total_configurations": len(configs),
-                "valid_configurations": len(validation_results),
+                "valid_configurations": len(validation_results) - skipped_count,
                 "invalid_configurations": len(errors),
+                "skipped_configurations": skipped_count,
                 "validation_results": validation_results,
                 "errors": errors,
-                "overall_status": "valid" if len(errors) == 0 else "invalid"
+                "missing_required": missing_required,
+                "overall_status": "valid" if not errors and not missing_required else "invalid"
             }
             
         except Exception as e:
@@ -666,41 +1088,14 @@ class ConfigurationManager:
     def _validate_configuration(self, key: str, value: str, config_type: ConfigType) -> Dict[str, Any]:
         """Validate single configuration"""
         try:
-            # Get validation rules from template
-            rules = []
-            for template in self.config_templates.values():
-                if template.config_type == config_type and key in template.validation_rules:
-                    rules = template.validation_rules[key]
-                    break
-            
-            if not rules:
+            # Only keys with template rules have compiled checks
+            if (config_type, key) not in self._compiled_rules:
                 return {"valid": True, "message": "No validation rules found"}
             
             # Apply validation rules
-            for rule in rules:
-                if rule.startswith("min_length:"):
-                    min_len = int(rule.split(":")[1])
-                    if not self.validation_rules["min_length"](value, min_len):
-                        return {"valid": False, "error": f"Value too short (minimum {min_len} characters)"}
-                elif rule.startswith("max_length:"):
-                    max_len = int(rule.split(":")[1])
-                    if not self.validation_rules["max_length"](value, max_len):
-                        return {"valid": False, "error": f"Value too long (maximum {max_len} characters)"}
-                elif rule.startswith("min:"):
-                    min_val = float(rule.split(":")[1])
-                    if not self.validation_rules["min"](value, min_val):
-                        return {"valid": False, "error": f"Value too small (minimum {min_val})"}
-                elif rule.startswith("max:"):
-                    max_val = float(rule.split(":")[1])
-                    if not self.validation_rules["max"](value, max_val):
-                        return {"valid": False, "error": f"Value too large (maximum {max_val})"}
-                elif rule.startswith("in:"):
-                    options = rule.split(":")[1]
-                    if not self.validation_rules["in"](value, options):
-                        return {"valid": False, "error": f"Value not in allowed options: {options}"}
-                elif rule in self.validation_rules:
-                    if not self.validation_rules[rule](value):
-                        return {"valid": False, "error": f"Validation failed for rule: {rule}"}
+            error = self._run_checks(config_type, key, value)
+            if error:
+                return {"valid": False, "error": error}
             
             return {"valid": True, "message": "Validation passed"}
             
@@ -708,28 +1103,79 @@ class ConfigurationManager:
             self.logger.error(f"Validate configuration error: {e}")
             return {"valid": False, "error": "Validation error"}
     
+    def _run_checks(self, config_type: ConfigType, key: str, value: Any) -> Optional[str]:
+        """First error, in declared rule order, from the compiled rules for (config_type, key), or None"""
+        if next(self._check_runs) % self.check_reorder_interval == 0:
+            self._reorder_checks()
+        
+        checks = self._compiled_rules[(config_type, key)]
+        # Memoized for hashable (string) values; counted on hits and misses alike
+        if isinstance(value, str):
+            failure = _cached_first_failure(checks, value)
+        else:
+            failure = _find_first_failure(checks, value)
+        if failure is None:
+            return None
+        position, error = failure
+        checks[position].fail_count += 1
+        return error
+    
+    def _reorder_checks(self):
+        """Swap in check lists sorted by failure count, so invalid values are rejected sooner"""
+        self._compiled_rules = {
+            rule_key: tuple(sorted(checks, key=lambda check: -check.fail_count))
+            for rule_key, checks in self._compiled_rules.items()
+        }
+    
     def _encrypt_value(self, value: str) -> str:
-        """Encrypt sensitive value"""
+        """Encrypt sensitive value
+        
+        Writes the v2 form, "encrypted:v2:<hex HMAC-SHA256>". Values persisted
+        before v2 are "encrypted:<hex SHA-256 of key + value>" and stay readable
+        (see _decrypt_value and _encrypted_matches).
+        """
         try:
-            import hashlib
-            import base64
-            
             # Simple encryption for demo (use proper encryption in production)
-            key = self.encryption_key.encode()
-            value_bytes = value.encode()
-            
-            # Create hash and encode
-            encrypted = hashlib.sha256(key + value_bytes).hexdigest()
-            return f"encrypted:{encrypted}"
+            digest = hmac.digest(self._key_bytes, value.encode(), "sha256")
+            return _ENCRYPTED_V2_PREFIX + digest.hex()
             
         except Exception as e:
             self.logger.error(f"Encrypt value error: {e}")
             return value
     
+    def _encrypted_matches(self, value: str, encrypted_value: str) -> bool:
+        """Check a plaintext against a stored encrypted value in either format"""
+        if encrypted_value.startswith(_ENCRYPTED_V2_PREFIX):
+            expected = hmac.digest(self._key_bytes, value.encode(), "sha256").hex()
+            stored = encrypted_value[len(_ENCRYPTED_V2_PREFIX):]
+        elif encrypted_value.startswith(_ENCRYPTED_PREFIX):
+            expected = hashlib.sha256(self._key_bytes + value.encode()).hexdigest()
+            stored = encrypted_value[len(_ENCRYPTED_PREFIX):]
+        else:
+            return False
+        return hmac.compare_digest(expected, stored)
+    
+    def _cached_decrypt(self, encrypted_value: str) -> str:
+        """_decrypt_value through an LRU keyed by the encrypted value"""
+        cache = self._decrypt_cache
+        with self.lock:
+            plaintext = cache.get(encrypted_value)
+            if plaintext is not None:
+                cache.move_to_end(encrypted_value)
+                return plaintext
+        
+        plaintext = self._decrypt_value(encrypted_value)
+        with self.lock:
+            cache[encrypted_value] = plaintext
+            if len(cache) > self.decrypt_cache_size:
+                cache.popitem(last=False)
+        return plaintext
+    
     def _decrypt_value(self, encrypted_value: str) -> str:
         """Decrypt sensitive value"""
         try:
-            if not encrypted_value.startswith("encrypted:"):
+            # Both the v2 and the legacy form start with the "encrypted:" prefix
+            if not encrypted_value.startswith(_ENCRYPTED_PREFIX):
                 return encrypted_value
             
             # For demo, return placeholder (use proper decryption in production)
@@ -738,33 +1184,6 @@ class ConfigurationManager:
         except Exception as e:
             self.logger.error(f"Decrypt value error: {e}")
             return encrypted_value
-    
-    def _is_float(self, value) -> bool:
-        """Check if value is a valid float"""
-        try:
-            float(value)
-            return True
-        except ValueError:
-            return False
-    
-    def _is_valid_hostname(self, hostname: str) -> bool:
-        """Check if hostname is valid"""
-        import re
-        if len(hostname) > 253:
-            return False
-        if hostname[-1] == ".":
-            hostname = hostname[:-1]
-        allowed = re.compile(r"^[a-zA-Z0-9-]{1,63}$")
-        return all(allowed.match(x) for x in hostname.split("."))
-    
-    def _is_valid_ip(self, ip: str) -> bool:
-        """Check if IP address is valid"""
-        import ipaddress
-        try:
-            ipaddress.ip_address(ip)
-            return True
-        except ValueError:
-            return False
 
 # Global configuration manager instance
 configuration_manager = ConfigurationManager()
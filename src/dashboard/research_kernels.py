@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Research Analytics Kernels
+Numeric kernels for advanced AI research aggregates, JIT-compiled with Numba when available
+"""
+
+import numpy as np
+try:
+    from numba import njit
+except ImportError:
+    # Fallback for environments without numba
+    njit = None
+
+# Default composite-score weights for
+# (performance, accuracy, speed, energy efficiency, scalability)
+DEFAULT_COMPOSITE_WEIGHTS = np.array([0.3, 0.25, 0.2, 0.15, 0.1], dtype=np.float32)
+
+def _jit(signature: str):
+    """Eagerly compile with a fixed signature and on-disk cache, or pass through without numba"""
+    if njit is None:
+        return lambda func: func
+    return njit(signature, cache=True, fastmath=True)
+
+@_jit('f4[:](f4[:], f4[:], f4[:], f4[:], f4[:], f4[:])')
+def composite_score(perf, acc, speed, energy, scale, w):
+    """Weighted composite score per record over float32 metric columns"""
+    return w[0] * perf + w[1] * acc + w[2] * speed + w[3] * energy + w[4] * scale
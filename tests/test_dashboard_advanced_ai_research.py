@@ -0,0 +1,83 @@
+"""
+Advanced AI research dashboard tests - project queries and the research timeline
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.dashboard.advanced_ai_research import AdvancedAIResearchSystem
+
+@pytest.fixture
+def research():
+    return AdvancedAIResearchSystem()
+
+@pytest.mark.unit
+def test_research_projects_are_returned_as_copies(research):
+    """Mutating a returned project must not leak into later calls"""
+    project = research.get_research_projects()[0]
+    project["name"] = "renamed"
+    project["team_members"].append("intruder")
+    fresh = research.get_research_projects()[0]
+    assert fresh["name"] != "renamed"
+    assert "intruder" not in fresh["team_members"]
+
+@pytest.mark.unit
+def test_research_projects_filter_by_status(research):
+    """The status index returns exactly the projects in that status"""
+    everything = research.get_research_projects()
+    status = everything[0]["status"].value
+    filtered = research.get_research_projects(status=status)
+    assert filtered
+    assert all(project["status"].value == status for project in filtered)
+    assert len(filtered) == sum(project["status"].value == status for project in everything)
+
+@pytest.mark.unit
+def test_research_projects_filter_by_area(research):
+    """Area filtering resolves the value string; an unknown area matches nothing"""
+    area = research.get_research_projects()[0]["research_area"]
+    filtered = research.get_research_projects(research_area=area.value)
+    assert filtered and all(project["research_area"] is area for project in filtered)
+    assert research.get_research_projects(research_area="no_such_area") == []
+
+def _log(research, description, timestamp=None):
+    research.log_event("milestone", "QUANTUM_OPT_001", description, "Low", ["Dr. Test"], timestamp=timestamp)
+
+@pytest.mark.unit
+def test_timeline_returns_newest_first(research):
+    """A newly logged event leads the timeline, ahead of the seed events"""
+    seeded = research.get_research_timeline()
+    _log(research, "latest")
+    timeline = research.get_research_timeline()
+    assert timeline[0]["description"] == "latest"
+    assert timeline[1:] == seeded
+    stamps = [event["timestamp"] for event in timeline]
+    assert stamps == sorted(stamps, reverse=True)
+
+@pytest.mark.unit
+def test_log_event_rejects_out_of_order_timestamp(research):
+    """An explicit timestamp older than the newest event would break the sorted ring"""
+    _log(research, "now")
+    with pytest.raises(ValueError):
+        _log(research, "stale", timestamp=datetime.now() - timedelta(days=2))
+    assert research.get_research_timeline()[0]["description"] == "now"
+
+@pytest.mark.unit
+def test_timeline_wraps_keeping_newest_events(research):
+    """Past capacity the oldest events are overwritten and the window spans the wrap point"""
+    start = datetime.now()
+    for n in range(research.timeline_capacity + 5):
+        _log(research, f"event_{n}", timestamp=start + timedelta(seconds=n))
+    timeline = research.get_research_timeline()
+    assert len(timeline) == research.timeline_capacity
+    assert timeline[0]["description"] == f"event_{research.timeline_capacity + 4}"
+    assert timeline[-1]["description"] == "event_5"
+
+@pytest.mark.unit
+def test_timeline_window_excludes_older_events(research):
+    """Only events inside the requested number of days are returned"""
+    month = research.get_research_timeline(days=30)
+    day = research.get_research_timeline(days=1)
+    # The seed events are stamped 24, 12, 6 and 2 hours before startup
+    assert len(month) == 4
+    assert day == month[:3]
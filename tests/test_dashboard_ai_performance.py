@@ -0,0 +1,99 @@
+"""
+AI performance dashboard tests - metrics ring, alerting paths, thresholds and trend kernels
+"""
+
+import numpy as np
+import pytest
+
+from src.dashboard.ai_performance import (
+    METRICS_CAPACITY, STATS_WINDOW, AIPerformanceMonitor, _trends_loop, _trends_vectorized
+)
+
+def _resource_alerts(monitor):
+    """Recorded alerts of type resource from the performance summary"""
+    return [alert for alert in monitor.get_performance_summary()["alerts"] if alert["type"] == "resource"]
+
+@pytest.mark.unit
+def test_custom_category_batch_does_not_raise_memory_alert():
+    """Custom categories take code 4 upward; the batch path must not alias them to memory alerts"""
+    monitor = AIPerformanceMonitor()
+    monitor.record_metrics_batch(["throughput_rps"], [500.0], ["rps"], ["throughput"])
+    assert _resource_alerts(monitor) == []
+
+@pytest.mark.unit
+def test_custom_category_matches_scalar_path():
+    """A custom-category metric alerts the same way whether recorded singly or batched"""
+    scalar = AIPerformanceMonitor()
+    scalar.record_metric("throughput_rps", 500.0, "rps", "throughput")
+    batched = AIPerformanceMonitor()
+    batched.record_metrics_batch(["throughput_rps"], [500.0], ["rps"], ["throughput"])
+    assert _resource_alerts(scalar) == _resource_alerts(batched) == []
+
+@pytest.mark.unit
+def test_memory_metric_batch_still_alerts():
+    """Resource metrics named like memory metrics keep their memory alerts in a batch"""
+    monitor = AIPerformanceMonitor()
+    monitor.record_metrics_batch(["memory_usage"], [99.0], ["%"], ["resource_usage"])
+    messages = [alert["message"] for alert in _resource_alerts(monitor)]
+    assert any(message.startswith("Memory usage") for message in messages)
+
+@pytest.mark.unit
+def test_assigning_alert_thresholds_updates_alerting():
+    """A new thresholds dict takes effect on the next recorded metric"""
+    monitor = AIPerformanceMonitor()
+    monitor.alert_thresholds = {**monitor.alert_thresholds, "memory_usage_warning": 50.0}
+    monitor.record_metric("memory_usage", 60.0, "%", "resource_usage")
+    messages = [alert["message"] for alert in _resource_alerts(monitor)]
+    assert any(message.startswith("Memory usage") for message in messages)
+
+@pytest.mark.unit
+def test_alert_thresholds_reject_item_assignment():
+    """Editing a threshold in place would bypass the cached copies, so it is refused"""
+    monitor = AIPerformanceMonitor()
+    with pytest.raises(TypeError):
+        monitor.alert_thresholds["memory_usage_warning"] = 50.0
+
+@pytest.mark.unit
+@pytest.mark.parametrize("count", [30, 200])
+def test_vectorized_trends_match_loop(count):
+    """The NumPy fallback sums the same recent and older windows as the loop kernel"""
+    rng = np.random.default_rng(7)
+    values = rng.random(count)
+    categories = rng.integers(0, 5, size=count).astype(np.int8)
+    results = []
+    for kernel in (_trends_loop, _trends_vectorized):
+        sums = [np.zeros(6), np.zeros(6, dtype=np.int64), np.zeros(6), np.zeros(6, dtype=np.int64)]
+        kernel(values, categories, 10, *sums)
+        results.append(sums)
+    for loop_result, vectorized_result in zip(*results):
+        np.testing.assert_allclose(loop_result, vectorized_result)
+
+def _assert_window_stats(monitor, values):
+    """Rolling response-time stats match the last STATS_WINDOW recorded values"""
+    window = values[-STATS_WINDOW:]
+    stats = monitor.performance_stats
+    assert stats["avg_response_time"] == pytest.approx(np.mean(window))
+    assert stats["peak_response_time"] == window.max()
+    assert stats["min_response_time"] == window.min()
+
+@pytest.mark.unit
+def test_metrics_ring_wraps_keeping_newest_in_order():
+    """Past capacity the ring keeps the newest metrics, oldest first, and stats follow the window"""
+    values = np.random.default_rng(3).random(METRICS_CAPACITY + 150) * 1000
+    monitor = AIPerformanceMonitor()
+    for value in values:
+        monitor.record_metric("latency", float(value), "ms", "response_time")
+    history = [metric.value for metric in monitor.metrics_history]
+    assert history == values[-METRICS_CAPACITY:].tolist()
+    _assert_window_stats(monitor, values)
+
+@pytest.mark.unit
+def test_oversized_batch_wraps_like_scalar_records():
+    """A batch larger than the ring leaves the same history and stats as recording one by one"""
+    values = np.random.default_rng(5).random(METRICS_CAPACITY + 150) * 1000
+    monitor = AIPerformanceMonitor()
+    count = len(values)
+    monitor.record_metrics_batch(["latency"] * count, values.tolist(), ["ms"] * count, ["response_time"] * count)
+    history = [metric.value for metric in monitor.metrics_history]
+    assert history == values[-METRICS_CAPACITY:].tolist()
+    _assert_window_stats(monitor, values)
@@ -0,0 +1,115 @@
+"""
+Authentication dashboard tests - permissions, the token cache and IP allow-lists
+"""
+
+import jwt
+import pytest
+
+from src.dashboard import authentication_system
+from src.dashboard.authentication_system import AuthenticationSystem, IPMatcher, Permission
+
+@pytest.fixture
+def auth():
+    return AuthenticationSystem()
+
+@pytest.mark.unit
+def test_permissions_keep_their_string_values():
+    """Permissions still round-trip through their string values at API boundaries"""
+    assert Permission("view_reports") is Permission.VIEW_REPORTS
+    assert Permission.EXPORT_DATA.value == "export_data"
+
+@pytest.mark.unit
+def test_check_permission_uses_role_permissions(auth):
+    """The bitmask check grants exactly the permissions of the user's role"""
+    assert auth.check_permission("analyst_001", "export_data")
+    assert not auth.check_permission("analyst_001", "delete")
+    assert not auth.check_permission("analyst_001", "no_such_permission")
+
+def _access_token(auth, user_id="analyst_001"):
+    return auth._create_session(auth.users[user_id], "127.0.0.1", "tests").access_token
+
+@pytest.fixture
+def decode_calls(monkeypatch):
+    """Tokens passed to jwt.decode, which only runs on token cache misses"""
+    calls = []
+    decode = jwt.decode
+    def counting_decode(token, *args, **kwargs):
+        calls.append(token)
+        return decode(token, *args, **kwargs)
+    monkeypatch.setattr(authentication_system.jwt, "decode", counting_decode)
+    return calls
+
+@pytest.mark.unit
+def test_repeat_token_is_served_from_cache(auth, decode_calls):
+    """A verified token is decoded once and then answered from the cache"""
+    token = _access_token(auth)
+    assert auth.verify_token(token)["valid"]
+    assert auth.verify_token(token)["user_id"] == "analyst_001"
+    assert decode_calls == [token]
+
+@pytest.mark.unit
+def test_token_cache_evicts_least_recently_used(auth, decode_calls):
+    """Past token_cache_size the least recently used token is decoded again on its next use"""
+    auth.token_cache_size = 2
+    first, second, third = (_access_token(auth) for _ in range(3))
+    for token in (first, second, first, third):
+        auth.verify_token(token)
+    del decode_calls[:]
+    auth.verify_token(first)
+    auth.verify_token(second)
+    assert decode_calls == [second]
+
+@pytest.mark.unit
+def test_rejected_token_is_negatively_cached(auth, decode_calls):
+    """An invalid token is rejected from the cache within invalid_token_ttl, with a fresh error each time"""
+    errors = []
+    for _ in range(3):
+        with pytest.raises(jwt.InvalidTokenError) as excinfo:
+            auth._decode_token("not-a-jwt")
+        errors.append(excinfo.value)
+    assert decode_calls == ["not-a-jwt"]
+    assert len({id(error) for error in errors}) == 3
+    assert auth.verify_token("not-a-jwt") == {"valid": False, "error": "Invalid token"}
+
+@pytest.mark.unit
+def test_logout_drops_cached_tokens(auth):
+    """A cached token stops verifying once its session is logged out"""
+    token = _access_token(auth)
+    session_id = auth.verify_token(token)["session_id"]
+    auth.logout_user(session_id)
+    assert token not in auth._token_cache
+    assert not auth.verify_token(token)["valid"]
+
+@pytest.mark.unit
+@pytest.mark.parametrize("ip_address, allowed", [
+    ("192.168.1.40", True),
+    ("10.0.0.7", True),
+    ("172.16.0.9", True),
+    ("192.168.10.4", False),
+    ("10.0.1.7", False),
+    ("172.16.0.90", False),
+])
+def test_ip_matcher_exact_and_prefix_patterns(ip_address, allowed):
+    """Exact addresses match whole; "prefix*" patterns match by string prefix"""
+    matcher = IPMatcher.from_patterns(["192.168.1.*", "10.0.0.*", "172.16.0.9"])
+    assert matcher.matches(ip_address) is allowed
+
+@pytest.mark.unit
+def test_ip_matcher_wildcard_and_recompile(auth):
+    """ "*" allows every address, and set_allowed_ips recompiles the user's matcher"""
+    user = auth.users["mgr_001"]
+    assert not auth._is_ip_allowed("8.8.8.8", user)
+    user.set_allowed_ips(["*"])
+    assert auth._is_ip_allowed("8.8.8.8", user)
+
+@pytest.mark.unit
+def test_large_ip_allow_list_matches_like_small_one():
+    """Past DOT_SET_MIN_PREFIXES the dot-prefix set gives the same answers as prefix scanning"""
+    patterns = [f"10.{n}.*" for n in range(IPMatcher.DOT_SET_MIN_PREFIXES)] + ["192.168.1.*", "172.16*", "8.8.8.8"]
+    large = IPMatcher.from_patterns(patterns)
+    assert large.dot_prefixes
+    for ip_address in ("10.3.2.1", "10.30.2.1", "10.99.2.1", "192.168.1.5", "192.168.11.5",
+                       "172.160.0.1", "8.8.8.8", "8.8.8.80", "1.2.3.4"):
+        assert large.matches(ip_address) is any(
+            ip_address == p or (p.endswith("*") and ip_address.startswith(p[:-1])) for p in patterns
+        ), ip_address
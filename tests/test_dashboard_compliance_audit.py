@@ -0,0 +1,140 @@
+"""
+Compliance audit dashboard tests - id pool, audit ring, compaction and archiving
+"""
+
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.dashboard import compliance_audit
+from src.dashboard.compliance_audit import (
+    AuditEventType, AuditLogEntry, AuditRingBuffer, ComplianceAuditSystem, PackedDetails, RiskLevel,
+    _IdPool, _json_default
+)
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+def _entry(minute, user_id=None):
+    """Audit entry stamped `minute` minutes after BASE_TIME"""
+    return AuditLogEntry(
+        timestamp=BASE_TIME + timedelta(minutes=minute), event_type=AuditEventType.DATA_ACCESS,
+        user_id=user_id or f"user_{minute}", session_id="session", ip_address="10.0.0.1",
+        user_agent="tests", resource_accessed="/data", action_performed="READ", outcome="success",
+        risk_level=RiskLevel.LOW, compliance_impact="low", details={}, correlation_id=f"id_{minute}")
+
+def _archiving_system(archive_dir, capacity=4):
+    """System with a small archiving ring, so a few events force evictions"""
+    system = ComplianceAuditSystem()
+    system.archive_dir = str(archive_dir)
+    system.audit_logs = AuditRingBuffer(capacity, keep_evicted=True)
+    return system
+
+def _log_events(system, count):
+    for n in range(count):
+        system.log_audit_event(AuditEventType.DATA_ACCESS, f"user_{n}", "/data", "READ",
+                               "success", RiskLevel.LOW)
+
+@pytest.mark.unit
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_id_pool_reseeds_in_forked_child():
+    """A forked child must not hand out the ids the parent has still buffered"""
+    pool = _IdPool()
+    pool.next_id()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.write(write_fd, pool.next_id().encode())
+        os._exit(0)
+    os.waitpid(pid, 0)
+    os.close(write_fd)
+    child_id = os.read(read_fd, 64).decode()
+    os.close(read_fd)
+    assert child_id != pool.next_id()
+
+@pytest.mark.unit
+def test_evicted_batches_get_distinct_files(tmp_path):
+    """Each batch handed to the writer gets its own sequence-numbered file"""
+    pq = pytest.importorskip("pyarrow.parquet")
+    system = _archiving_system(tmp_path)
+    for _ in range(3):
+        _log_events(system, 6)
+        system._archive_evicted_entries()
+    system._stop_archive_writer()
+    paths = sorted(tmp_path.iterdir())
+    assert [path.name.rsplit("_", 1)[1] for path in paths] == ["000000.parquet", "000001.parquet", "000002.parquet"]
+    assert sum(pq.read_table(path).num_rows for path in paths) == 18 - 4
+
+@pytest.mark.unit
+def test_failed_archive_batch_is_retried(tmp_path, monkeypatch):
+    """A batch whose write fails is requeued rather than dropped"""
+    pq = pytest.importorskip("pyarrow.parquet")
+    monkeypatch.setattr(compliance_audit, "ARCHIVE_RETRY_DELAY", 0)
+    system = _archiving_system(tmp_path)
+    write_table = compliance_audit.pq.write_table
+    calls = []
+    def flaky_write_table(*args, **kwargs):
+        calls.append(args[1])
+        if len(calls) == 1:
+            raise OSError("disk full")
+        return write_table(*args, **kwargs)
+    monkeypatch.setattr(compliance_audit.pq, "write_table", flaky_write_table)
+    _log_events(system, 6)
+    system._archive_evicted_entries()
+    system._stop_archive_writer()
+    assert len(calls) == 2
+    assert [pq.read_table(path).num_rows for path in tmp_path.iterdir()] == [2]
+
+@pytest.mark.unit
+def test_compaction_swaps_entries_without_mutating_them():
+    """Readers holding an entry keep its dict; the ring holds a packed copy that expands back"""
+    pytest.importorskip("msgpack")
+    system = ComplianceAuditSystem()
+    system.audit_logs = AuditRingBuffer(8)
+    system.log_audit_event(AuditEventType.DATA_ACCESS, "user_1", "/data", "READ", "success",
+                           RiskLevel.LOW, details={"rows": 3, 7: "int key"})
+    held = system.audit_logs.snapshot_since(datetime(2000, 1, 1))[0]
+    system._compact_audit_details(datetime.now() + timedelta(days=1))
+    stored = system.audit_logs.snapshot_since(datetime(2000, 1, 1))[0]
+    assert held.details == {"rows": 3, 7: "int key"}
+    assert isinstance(stored.details, PackedDetails)
+    assert stored.expanded_details() == {"rows": 3, 7: "int key"}
+    assert stored.correlation_id == held.correlation_id
+
+@pytest.mark.unit
+def test_json_default_leaves_plain_bytes_alone():
+    """Only PackedDetails are unpacked; arbitrary bytes are not treated as MessagePack"""
+    with pytest.raises(TypeError):
+        _json_default(b"\x93\x01\x02\x03")
+
+@pytest.mark.unit
+def test_ring_keeps_newest_entries_oldest_first_after_wrap():
+    """Once full, the ring overwrites its oldest entries and still reads back in order"""
+    ring = AuditRingBuffer(5, keep_evicted=True)
+    ring.extend([_entry(minute) for minute in range(3)])
+    for minute in range(3, 8):
+        ring.append(_entry(minute))
+    assert len(ring) == 5
+    assert [entry.user_id for entry in ring.snapshot_since(BASE_TIME)] == [f"user_{m}" for m in range(3, 8)]
+    assert [entry.user_id for entry in ring.take_evicted()] == ["user_0", "user_1", "user_2"]
+    assert ring.take_evicted() == []
+
+@pytest.mark.unit
+def test_ring_window_queries_span_the_wrap_point():
+    """A cutoff inside the wrapped ring selects the same rows from entries and columns"""
+    ring = AuditRingBuffer(5)
+    ring.extend([_entry(minute) for minute in range(8)])
+    cutoff = BASE_TIME + timedelta(minutes=4)
+    assert [entry.user_id for entry in ring.snapshot_since(cutoff)] == ["user_4", "user_5", "user_6", "user_7"]
+    event_codes, outcome_codes, risk_codes, user_ids = ring.columns_since(cutoff)
+    assert user_ids == ["user_4", "user_5", "user_6", "user_7"]
+    assert len(event_codes) == len(outcome_codes) == len(risk_codes) == 4
+    assert ring.snapshot_since(BASE_TIME + timedelta(hours=1)) == []
+
+@pytest.mark.unit
+def test_ring_clamps_out_of_order_timestamps():
+    """An entry stamped before its predecessor stays inside the windows that include it"""
+    ring = AuditRingBuffer(5)
+    ring.extend([_entry(0), _entry(10), _entry(5, user_id="late"), _entry(11)])
+    cutoff = BASE_TIME + timedelta(minutes=10)
+    assert [entry.user_id for entry in ring.snapshot_since(cutoff)] == ["user_10", "late", "user_11"]
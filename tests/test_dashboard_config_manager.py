@@ -0,0 +1,193 @@
+"""
+Configuration manager tests - templates, validation, indexes and change history
+"""
+
+import pytest
+
+from src.dashboard.config_manager import ConfigType, ConfigurationManager, Environment
+
+@pytest.fixture
+def manager():
+    """A fresh manager with the sample data"""
+    return ConfigurationManager()
+
+@pytest.mark.unit
+def test_template_copies_do_not_leak_between_managers(manager):
+    """Mutating a returned template must not change the shared defaults"""
+    template = manager.get_config_template("api_template_003")
+    template["default_values"]["api_port"] = "1"
+    template["validation_rules"]["api_port"].append("max:2")
+    manager.get_config_template()["templates"][0]["required_fields"].clear()
+    
+    other = ConfigurationManager()
+    assert other.get_config_template("api_template_003")["default_values"]["api_port"] == "8000"
+    assert other.get_config_template("api_template_003")["validation_rules"]["api_port"] == [
+        "required", "integer", "min:1", "max:65535"
+    ]
+    assert other.get_config_template()["templates"][0]["required_fields"]
+    with pytest.raises(TypeError):
+        other.config_templates["api_template_003"].default_values["api_port"] = "1"
+
+@pytest.mark.unit
+@pytest.mark.parametrize("value", ["-5", "0", "8000", -5, 8000])
+def test_integer_rule_accepts_integers(value):
+    """Integers and digit strings, including negatives, pass the integer rule"""
+    from src.dashboard.config_manager import _is_int
+    assert _is_int(value)
+
+@pytest.mark.unit
+@pytest.mark.parametrize("value", [5.7, True, " 5 ", "1_000", "5.0", "", "-", "²", None])
+def test_integer_rule_rejects_non_integers(value):
+    """Floats, bools, padded or underscored strings and non-ASCII digits fail the integer rule"""
+    from src.dashboard.config_manager import _is_int
+    assert not _is_int(value)
+
+@pytest.mark.unit
+def test_negative_port_fails_on_minimum_not_integer(manager):
+    """A negative integer passes the integer rule and is rejected by min:1"""
+    result = manager.set_configuration("production", "api", "api_port", "-5")
+    assert result == {"success": False, "error": "Validation failed: Value too small (minimum 1.0)"}
+
+@pytest.mark.unit
+@pytest.mark.parametrize("value", [5.7, True, " 5 ", "1_000"])
+def test_non_integer_port_is_rejected(manager, value):
+    """Non-integer ports fail the integer rule whether or not they are strings"""
+    result = manager.set_configuration("production", "api", "api_port", value)
+    assert result == {"success": False, "error": "Validation failed: Validation failed for rule: integer"}
+
+@pytest.mark.unit
+def test_failures_are_counted_on_memoized_hits(manager):
+    """Repeated identical invalid values count toward the failing check every time"""
+    for _ in range(5):
+        manager.set_configuration("production", "api", "api_port", "abc")
+    counts = {check.index: check.fail_count for check in manager._compiled_rules[(ConfigType.API, "api_port")]}
+    assert counts == {0: 0, 1: 5, 2: 0, 3: 0}
+
+@pytest.mark.unit
+def test_reordered_checks_report_the_declared_first_failure(manager):
+    """After most-failing-first reordering, errors still follow declared rule order"""
+    manager.check_reorder_interval = 3
+    expected = {
+        "": "Validation failed for rule: required",
+        "abc": "Validation failed for rule: integer",
+        "0": "Value too small (minimum 1.0)",
+        "70000": "Value too large (maximum 65535.0)",
+    }
+    for _ in range(4):
+        for value in ["70000", "70000", "0", "abc", ""]:
+            result = manager.set_configuration("production", "api", "api_port", value)
+            assert result["error"] == f"Validation failed: {expected[value]}"
+    assert manager._compiled_rules[(ConfigType.API, "api_port")][0].index == 3
+
+@pytest.mark.unit
+def test_manager_is_freed_without_the_cycle_collector():
+    """Memoization keeps no reference cycle through the manager"""
+    import gc
+    import weakref
+    gc.disable()
+    try:
+        ref = weakref.ref(ConfigurationManager())
+        assert ref() is None
+    finally:
+        gc.enable()
+
+@pytest.mark.unit
+def test_encrypted_values_are_versioned_and_legacy_values_stay_readable(manager):
+    """New values use the v2 prefix; legacy sha256 values still verify and decrypt"""
+    import hashlib
+    encrypted = manager._encrypt_value("s3cret-password-value")
+    assert encrypted.startswith("encrypted:v2:")
+    assert manager._encrypted_matches("s3cret-password-value", encrypted)
+    assert not manager._encrypted_matches("other", encrypted)
+    
+    legacy = "encrypted:" + hashlib.sha256(manager._key_bytes + b"s3cret-password-value").hexdigest()
+    assert manager._encrypted_matches("s3cret-password-value", legacy)
+    assert manager._decrypt_value(legacy) == manager._decrypt_value(encrypted) == "[ENCRYPTED_VALUE]"
+
+@pytest.mark.unit
+def test_index_lookups_follow_creates_and_updates(manager):
+    """Lookups by (environment, type, key) see new values and keep listing order on update"""
+    created = manager.set_configuration("staging", "api", "api_port", "8080")
+    assert created["action"] == "created"
+    other = manager.set_configuration("staging", "api", "api_host", "0.0.0.0")
+    
+    updated = manager.set_configuration("staging", "api", "api_port", "9090")
+    assert updated["action"] == "updated"
+    assert updated["config_id"] == created["config_id"]
+    assert updated["version"] == 2
+    
+    result = manager.get_configuration("staging", "api", "api_port")
+    assert [c["value"] for c in result["configurations"]] == ["9090"]
+    listed = manager.get_configuration("staging")["configurations"]
+    assert [c["config_id"] for c in listed] == [created["config_id"], other["config_id"]]
+    assert manager.get_configuration("staging", "nope")["configurations"] == []
+    assert manager.get_configuration("production", "api", "missing")["configurations"] == []
+
+@pytest.mark.unit
+def test_config_changes_are_windowed_and_newest_first(manager):
+    """Changes are filtered by the day window and config_id and listed newest first"""
+    assert manager.get_config_changes(days=30)["total_changes"] == 1  # Sample password rotation
+    assert manager.get_config_changes(days=100)["total_changes"] == 2
+    assert manager.get_config_changes(days=365)["total_changes"] == 3
+    
+    manager.set_configuration("production", "api", "api_port", "9000")
+    manager.set_configuration("production", "api", "api_port", "9001")
+    changes = manager.get_config_changes(config_id="api_prod_port_004", days=365)["changes"]
+    assert [c["new_value"] for c in changes] == ["9001", "9000", "8443"]
+    assert manager.get_config_changes(environment="staging")["total_changes"] == 0
+
+@pytest.mark.unit
+def test_apply_template_writes_valid_values_and_reports_invalid_ones(manager):
+    """Bulk apply writes every valid value once and reports each invalid key"""
+    result = manager.apply_template(
+        "api_template_003", "staging", {"api_port": "70000", "api_workers": "8"}, updated_by="ops"
+    )
+    assert result["success"] is False
+    assert result["errors"] == [{"key": "api_port", "error": "Validation failed: Value too large (maximum 65535.0)"}]
+    assert result["applied_count"] == 9
+    assert {r["action"] for r in result["results"]} == {"created"}
+    
+    staging = manager.get_configuration("staging", "api")["configurations"]
+    assert len(staging) == 9
+    assert {c["key"]: c["value"] for c in staging}["api_workers"] == "8"
+    
+    again = manager.apply_template("api_template_003", "staging", {"api_port": "8080"})
+    assert again["success"] is True
+    assert {r["action"] for r in again["results"]} == {"created", "updated"}
+    assert [r["key"] for r in again["results"] if r["action"] == "created"] == ["api_port"]
+
+@pytest.mark.unit
+def test_apply_template_encrypts_sensitive_fields(manager):
+    """Sensitive template fields are stored encrypted"""
+    manager.apply_template("security_template_002", "staging", {"jwt_secret": "x" * 40})
+    config = manager._by_env_type_key[(Environment.STAGING, ConfigType.SECURITY, "jwt_secret")]
+    assert config.is_encrypted and config.value.startswith("encrypted:v2:")
+
+@pytest.mark.unit
+def test_validate_all_reports_missing_required_keys_separately(manager):
+    """Missing required keys are listed apart; skipped configs keep the counts adding up"""
+    result = manager.validate_all_configurations("production")
+    assert result["total_configurations"] == 5
+    assert result["skipped_configurations"] == 5
+    assert result["valid_configurations"] == result["invalid_configurations"] == 0
+    assert {r["status"] for r in result["validation_results"]} == {"skipped"}
+    assert {"config_type": "database", "key": "db_port"} in result["missing_required"]
+    assert result["errors"] == []
+    assert result["overall_status"] == "invalid"
+
+@pytest.mark.unit
+def test_validate_all_checks_values_of_complete_types(manager):
+    """Types with every required key present are validated value by value"""
+    manager.apply_template("api_template_003", "staging", {})
+    # Stored data that predates a tighter rule
+    workers = manager._by_env_type_key[(Environment.STAGING, ConfigType.API, "api_workers")]
+    workers.value = "99"
+    result = manager.validate_all_configurations("staging")
+    counted = result["valid_configurations"] + result["invalid_configurations"] + result["skipped_configurations"]
+    assert counted == result["total_configurations"] == 10
+    assert result["missing_required"] == []
+    assert result["errors"] == [{
+        "config_id": workers.config_id,
+        "key": "api_workers",
+        "error": "Value too large (maximum 32.0)"
+    }]